@@ -4,6 +4,13 @@ import config
 
 
 class Character:
+    # 모든 필드는 __init__에서 만듦 (hit_type 등은 None으로 시작)
+    __slots__ = (
+        'currentCharacter', 'image', 'frame', 'x', 'y', 'state', 'hp', 'max_hp',
+        'is_hit', 'hit_type', 'hit_frame_range', 'hit_frame_start', 'can_get_up',
+        'velocity_y', 'is_grounded', 'move_speeds',
+    )
+
     def __init__(self, character_type='priest'):
         self.currentCharacter = character_type  # 현재 캐릭터 타입
         self.image = None
@@ -1,11 +1,26 @@
 from Character.character import Character
-import pico2d
+import renderBackend
 import config
+import frameData
+import moveRegistry
+import playerStateMachine
 from handle_collision import CollisionHandler
+import math
 import pathlib
+from resourceCache import resources
+from startupProfiler import profiler
 
 
 class Player:
+    # 모든 필드는 __init__에서 만듦 (나중에 생기는 필드 없음 - hasattr/getattr 검사 불필요)
+    __slots__ = (
+        'player_side', 'x', 'y', 'prev_x', 'dir', 'facing_right', 'character', 'hp', 'max_hp',
+        'velocity_x', 'velocity_y', 'is_grounded', 'gravity',
+        'state', 'position_state', 'is_attacking', 'is_hit', 'hit_recovery_input', 'can_combo', 'combo_reserved',
+        'is_guarding', 'guard_animation_reset', 'attack_hit_processed', 'can_process_hit', 'move_frame',
+        'move_speed_multiplier', 'guard_counter_window', 'guard_counter_timer', 'can_attack_after_guard',
+        'hit_sound', 'swoosh_sound', 'attack_sound_played', 'sprite_manager',
+    )
 
     def __init__(self, player_side='left', character_type=None):  # player_side: 'left' 또는 'right'
         # player_side에 따른 초기 설정
@@ -49,19 +64,15 @@ class Player:
 
         # 가드 상태 관련 속성 추가
         self.is_guarding = False  # 가드 중인지 체크
+        self.guard_animation_reset = False  # 가드 연장 시 애니메이션 처음부터 (SpriteManager가 확인)
         # guard_timer와 guard_duration 제거 - 애니메이션으로 제어
 
         # 공격 타격 처리 관련 속성 추가
         self.attack_hit_processed = False  # 현재 공격의 타격 처리 완료 여부
         # SpriteManager와 연동되는 타격 허용 플래그 초기화 (프레임 기반 히트 판정)
         self.can_process_hit = False
-
-        # 캐릭터별 사용 가능한 공격 정의
-        self.available_attacks = {
-            'priest': ['fastMiddleATK', 'strongMiddleATK', 'strongUpperATK', 'strongLowerATK', 'rageSkill', 'guard'],
-            'thief': ['fastMiddleATK', 'strongMiddleATK', 'strongUpperATK', 'strongLowerATK', 'guard'],
-            'fighter': ['fastMiddleATK', 'fastLowerATK', 'fastUpperATK', 'strongMiddleATK', 'strongLowerATK', 'strongUpperATK', 'guard']
-        }
+        # 현재 공격이 시작된 뒤 진행된 프레임 수 (SpriteManager가 셈, frameData의 판정 구간/히트박스 조회용)
+        self.move_frame = 0
 
         # 이동 속도 조정
         self.move_speed_multiplier = 1.0  # 이동 속도 배율
@@ -76,19 +87,20 @@ class Player:
         self.swoosh_sound = None
         self.attack_sound_played = False  # 공격 사운드 재생 여부 플래그
 
+        # 스프라이트 매니저 참조 (캐릭터 변경 시 스프라이트 미리 로딩용)
+        self.sprite_manager = None
+
     def get_character_type(self):
         """현재 캐릭터 타입 반환"""
         return self.character.get_character_type()
 
     def can_use_attack(self, attack_type):
-        """현재 캐릭터가 해당 공격을 사용할 수 있는지 확인"""
-        character_type = self.get_character_type()
-        return attack_type in self.available_attacks.get(character_type, [])
+        """현재 캐릭터가 해당 공격을 사용할 수 있는지 확인 (moveRegistry.AVAILABLE_ATTACKS)"""
+        return self.get_character_type() in moveRegistry.lookup(attack_type).characters
 
     def is_attack_state(self):
         """현재 상태가 공격 상태인지 확인"""
-        attack_states = ['fastMiddleATK', 'fastMiddleATK2', 'fastMiddleATK3', 'strongMiddleATK', 'strongMiddleATK2', 'strongUpperATK', 'strongUpperATK2', 'strongLowerATK', 'fastLowerATK', 'fastUpperATK', 'rageSkill']
-        return self.state in attack_states
+        return moveRegistry.lookup(self.state).is_attack
 
     def get_move_speed(self):
         """현재 캐릭터의 이동속도 반환 (조정된 속도)"""
@@ -115,31 +127,30 @@ class Player:
         self.y = config.GROUND_Y
         self.is_grounded = True
 
-        # 피격 사운드 로드
+        # 피격 사운드 로드 (두 플레이어가 리소스 캐시의 같은 사운드를 공유)
         if self.hit_sound is None:
             hit_sound_path = pathlib.Path.cwd() / 'Resources' / 'Sound' / 'hit.wav'
-            self.hit_sound = pico2d.load_wav(str(hit_sound_path))
+            with profiler.section('sound hit.wav'):
+                self.hit_sound = resources.load_wav(hit_sound_path, owner='player')
             self.hit_sound.set_volume(32)
 
         # 공격 사운드 로드
         if self.swoosh_sound is None:
             swoosh_sound_path = pathlib.Path.cwd() / 'Resources' / 'Sound' / 'swoosh.wav'
-            self.swoosh_sound = pico2d.load_wav(str(swoosh_sound_path))
+            with profiler.section('sound swoosh.wav'):
+                self.swoosh_sound = resources.load_wav(swoosh_sound_path, owner='player')
             self.swoosh_sound.set_volume(32)
 
     def change_character(self, character_type):
         """캐릭터 변경"""
+        if self.sprite_manager:
+            self.sprite_manager.prefetch(character_type)
         self.character = Character(character_type)
         self.character.x, self.character.y = self.x, self.y
         self.character.hp = self.hp
         self.character.initialize()
         # 상태 초기화
-        self.state = 'Idle'
-        self.is_attacking = False
-        self.is_hit = False
-        self.is_guarding = False
-        self.can_combo = False
-        self.combo_reserved = False
+        playerStateMachine.fire(self, 'character_change')
 
     def apply_gravity(self, deltaTime):
         """중력 적용 - airborne 상태 처리 및 개선된 충돌 처리"""
@@ -153,9 +164,10 @@ class Player:
             # 공중에서도 화면 경계 체크 (벽을 뚫고 나가지 않도록)
             CollisionHandler.clamp_to_screen(self)
 
-            # 공중 수평 감속(간단한 댐핑) - 초당 약 6의 감속계수로 자연스럽게 줄어듦
+            # 공중 수평 감속(지수 감쇠) - 초당 약 6의 감속계수로 자연스럽게 줄어듦
+            # (1 - 6*dt) 근사와 달리 스텝 크기와 관계없이 같은 감속
             damping_factor = 6.0
-            self.velocity_x *= max(0.0, 1.0 - damping_factor * deltaTime)
+            self.velocity_x *= math.exp(-damping_factor * deltaTime)
 
             self.y += self.velocity_y * deltaTime
 
@@ -168,8 +180,7 @@ class Player:
                 self.is_grounded = True
 
                 # 공중에서 떨어진 후 착지했을 때 특별 처리
-                if (self.is_hit and hasattr(self.character, 'hit_type') and
-                    self.character.hit_type == 'airborne' and old_y > config.GROUND_Y):
+                if self.is_hit and self.character.hit_type == 'airborne' and old_y > config.GROUND_Y:
                     # airborne에서 착지 - down 상태로 전환하고 기상 가능하게 설정
                     self.character.hit_type = 'down'  # down 상태로 변경
                     self.character.can_get_up = True
@@ -207,88 +218,35 @@ class Player:
 
 
     def start_guard(self):
-        """가드 상태 시작 - 피격 시 자동으로 발동"""
-        # 공격 중이면 가드 불가 (공격 도중 들어오는 공격은 방어하지 않음)
-        if getattr(self, 'is_attacking', False):
-            print("Cannot start guard while attacking")
-            return
-
-        # 피격 중이면 가드 불가
-        if getattr(self, 'is_hit', False):
-            print("Cannot start guard while being hit")
-            return
-
-        # 이미 가드 중이라면 가드를 연장 (애니메이션 리셋)
-        if self.is_guarding:
-            print(f"Guard extended! Position: {self.position_state} - Resetting guard animation")
-            self.guard_animation_reset = True
-            # 반격 창도 연장
-            self.guard_counter_timer = self.guard_counter_window
-            self.can_attack_after_guard = True
-        else:
-            self.is_guarding = True
-            self.guard_animation_reset = False
-            print(f"Auto guard activated! Position: {self.position_state} - Starting guard animation")
-
-            # 가드 시작 시 짧은 반격 창 부여
-            self.guard_counter_timer = self.guard_counter_window
-            self.can_attack_after_guard = True
-            print(f"Guard counter window opened for {self.guard_counter_window} seconds")
-
-        self.state = 'guard'
-        # Character 상태도 즉시 동기화
-        self.character.state = 'guard'
+        """가드 상태 시작 - 피격 시 자동으로 발동, 이미 가드 중이면 연장 (애니메이션 리셋)"""
+        # 공격 중이거나 피격 중이면 가드 불가 (공격 도중 들어오는 공격은 방어하지 않음)
+        if playerStateMachine.fire(self, 'guard') is None:
+            print("Cannot start guard while attacking" if self.is_attacking else "Cannot start guard while being hit")
 
     def should_reset_guard_animation(self):
         """가드 애니메이션 리셋이 필요한지 확인"""
-        if hasattr(self, 'guard_animation_reset') and self.guard_animation_reset:
+        if self.guard_animation_reset:
             self.guard_animation_reset = False  # 플래그 리셋
             return True
         return False
 
-    def update_guard(self, deltaTime):
-        """가드 상태 업데이트 - 애니메이션으로 제어됨"""
-        # 가드 상태는 spriteManager에서 애니메이션 완료 시 자동으로 해제됨
-        # 불필요한 상태 체크 제거
-        pass
-
     def end_guard(self):
         """가드 상태 종료"""
-        if self.is_guarding:
-            self.is_guarding = False
-            if not self.is_attacking and not self.is_hit:
-                self.state = 'Idle'
-                self.character.state = 'Idle'
+        if playerStateMachine.fire(self, 'guard_end'):
             print(f"Guard ended - transitioning to {self.state}")
 
     def can_guard_against_attack(self, attack_type):
         """공격 타입에 따른 가드 가능 여부 확인"""
         # 공격 중이면 가드 불가 (공격이 들어왔을 때 공격 중이면 방어하지 않음)
-        if getattr(self, 'is_attacking', False):
+        if self.is_attacking:
             return False
 
         # 피격 중일 때도 가드 불가
-        if getattr(self, 'is_hit', False):
+        if self.is_hit:
             return False
 
-        guard_mapping = {
-            # 기본 공격
-            'fastUpperATK': 'High',
-            'strongUpperATK': 'High',
-            'fastMiddleATK': 'Middle',
-            'strongMiddleATK': 'Middle',
-            'fastLowerATK': 'Low',
-            'strongLowerATK': 'Low',
-            # 연계 공격 (2단, 3단)
-            'fastMiddleATK2': 'Middle',
-            'fastMiddleATK3': 'Middle',
-            'strongMiddleATK2': 'Middle',
-            'strongUpperATK2': 'High',
-            # rage 스킬은 가드 불가
-            'rageSkill': None
-        }
-
-        required_position = guard_mapping.get(attack_type)
+        # 공격별 가드 위치 (moveRegistry.GUARD_HEIGHTS)
+        required_position = moveRegistry.lookup(attack_type).guard_height
 
         # rage 스킬은 가드 불가
         if required_position is None:
@@ -302,7 +260,7 @@ class Player:
     def get_bb(self):
         """바운딩 박스 좌표 반환 - 방향과 상태에 따라 동적 계산"""
         # down 상태인지 확인
-        hit_type = getattr(self.character, 'hit_type', None) if hasattr(self, 'character') else None
+        hit_type = self.character.hit_type
         is_down = (hit_type == 'down') or (self.is_hit and not self.is_grounded and hit_type == 'airborne')
 
         if is_down:
@@ -329,50 +287,13 @@ class Player:
         return adjusted_x - bb_width, adjusted_y - bb_height, adjusted_x + bb_width, adjusted_y + bb_height
 
     def get_attack_range_bb(self):
-        """공격 범위의 바운딩 박스 반환 (방향에 따라 동적 계산)"""
-        my_bb = self.get_bb()
-
-        # 공격 범위 설정
-        attack_range = 0
-
-        # priest의 상단 강공격은 특별히 범위가 두 배
-        if (self.character.currentCharacter == 'priest' and
-            self.state.lower() == 'strongupperatk'):
-            attack_range = 200  # priest의 상단 강공격은 200
-        elif 'fast' in self.state.lower():
-            attack_range = 70  # fast 계열을 70으로 설정
-        elif 'strong' in self.state.lower():
-            attack_range = 100  # strong 계열을 100으로 설정
-        elif 'rage' in self.state.lower():
-            attack_range = 70
-
-        if attack_range == 0:
+        """공격 범위의 바운딩 박스 반환 (현재 공격 프레임의 히트박스, 판정 프레임이 아니면 None)"""
+        # 히트박스는 frameData에서 (캐릭터, 기술, 프레임)으로 조회 - 바운딩 박스 앞쪽 끝에서 바라보는 방향으로 뻗음
+        # (Lower 공격은 down 상태 타격용으로 바닥 근처까지 내려감)
+        box = frameData.hitbox(self.character.currentCharacter, moveRegistry.lookup(self.state).id, self.move_frame)
+        if box is None:
             return None
-
-        # 공격 범위는 상하는 바운딩 박스와 동일하지만,
-        # Lower 공격은 아래쪽으로 더 넓은 범위를 가짐 (down 상태 타격용)
-        is_lower_attack = 'lower' in self.state.lower()
-
-        if is_lower_attack:
-            # Lower 공격은 바닥 근처까지 범위 확장
-            # down 상태의 바운딩 박스를 확실히 커버하도록 범위 확대
-            range_y1 = config.GROUND_Y - 100  # 더 넓은 범위로 확장 (60 -> 100)
-            range_y2 = my_bb[3]
-        else:
-            # 일반 공격은 바운딩 박스와 동일
-            range_y1 = my_bb[1]
-            range_y2 = my_bb[3]
-
-        if self.facing_right:
-            # 오른쪽을 바라볼 때: 바운딩 박스 오른쪽 끝에서 오른쪽으로 공격
-            range_x1 = my_bb[2]  # 바운딩 박스 오른쪽 끝
-            range_x2 = range_x1 + attack_range
-        else:
-            # 왼쪽을 바라볼 때: 바운딩 박스 왼쪽 끝에서 왼쪽으로 공격
-            range_x2 = my_bb[0]  # 바운딩 박스 왼쪽 끝
-            range_x1 = range_x2 - attack_range
-
-        return range_x1, range_y1, range_x2, range_y2
+        return frameData.attack_box(box, self.get_bb(), self.facing_right)
 
 
     def is_in_attack_range(self, other_player):
@@ -409,9 +330,6 @@ class Player:
             return False
 
         # down 상태는 Lower 공격에 피격될 수 있으므로 특수 처리
-        # character의 hit_type을 확인하여 down 상태를 정확히 감지
-        hit_type = getattr(self.character, 'hit_type', None) if hasattr(self, 'character') else None
-
         # down 상태는 피격 상태이지만 Lower 공격에는 반응할 수 있도록
         # 여기서는 단순히 is_hit만 반환 (충돌 체크에서 hit_type으로 추가 판단)
         return True
@@ -419,79 +337,34 @@ class Player:
     def take_damage(self, damage, attack_state='fastMiddleATK', attacker=None):
         """데미지를 받는 메서드 - 공격 상태에 따른 hit 타입 결정"""
         # 현재 airborne 상태인지 체크 (추가 공격 판정용)
-        was_airborne = (hasattr(self.character, 'hit_type') and
-                       self.character.hit_type == 'airborne' and
-                       not self.is_grounded)
+        was_airborne = self.character.hit_type == 'airborne' and not self.is_grounded
 
         # 공격 상태에 따른 hit 타입 결정
-        # 1순위: Lower 계열은 포물선로 띄우기 위해 airborne 취급
-        if 'lower' in attack_state.lower():
-            attack_type = 'airborne'
-        # 2순위: Upper 계열은 상단 판정
-        elif 'upper' in attack_state.lower():
-            # Upper 계열도 강도에 따라 구분
-            if 'strong' in attack_state.lower():
-                attack_type = 'strong'
-            else:
-                attack_type = 'fast'
-        # 3순위: Middle 계열은 중단 판정
-        elif 'middle' in attack_state.lower():
-            # Middle 계열도 강도에 따라 구분
-            if 'strong' in attack_state.lower():
-                attack_type = 'strong'
-            else:
-                attack_type = 'fast'
-        # 4순위: 기타 공격은 강도만 체크
-        elif 'strong' in attack_state.lower():
-            attack_type = 'strong'
-        else:
-            attack_type = 'fast'
+        # Lower 계열은 포물선로 띄우기 위해 airborne 취급, 나머지는 강도에 따라 strong/fast
+        move = moveRegistry.lookup(attack_state)
+        attack_type = move.hit_type
 
         # Character의 take_damage 호출
         self.character.take_damage(damage, attack_type)
 
-        # Player HP 및 상태 동기화
+        # Player HP 동기화 (상태는 아래 피격 전이에서)
         self.hp = self.character.hp
-        self.is_hit = self.character.is_hit
-        self.state = 'hit'  # Player 상태도 hit로 설정
 
         # 피격 사운드 재생
         if self.hit_sound:
             self.hit_sound.play()
 
         # 포물선 처리: Lower 계열 공격 또는 공중에서 추가 히트
-        should_launch = ('lower' in attack_state.lower()) or was_airborne
+        should_launch = move.launch is not None or was_airborne
 
         if should_launch:
             # 세기 결정
-            if 'lower' in attack_state.lower():
-                # Lower 계열 공격 (지상에서 띄우기 - 위로)
-                if 'strong' in attack_state.lower():
-                    vy = 640.0
-                    vx_mag = 300.0
-                else:
-                    vy = 480.0
-                    vx_mag = 200.0
-                # x 가속도를 80%로 감소
-                vx_mag = vx_mag * 0.8
-            else:
-                # 공중에서 추가 히트 (에어 콤보)
-                if 'strong' in attack_state.lower():
-                    # 강공격: 뒤로 크게 날아가면서 위로도 튀어오름
-                    vy = 400.0  # 수직 속도 증가 (200 -> 400)
-                    vx_mag = 450.0  # 수평 속도 크게 (뒤로 날아가는 효과)
-                elif 'fast' in attack_state.lower():
-                    # 빠른 공격: 위로 올라가며 약간 밀림
-                    vy = 350.0
-                    vx_mag = 180.0
-                else:
-                    # 기타 공격
-                    vy = 400.0
-                    vx_mag = 200.0
-                # 공중 콤보는 x 가속도 감소 없음 (그대로 유지)
+            # Lower 계열 공격은 지상에서 띄우기 (x 가속도 80%),
+            # 공중에서 추가 히트(에어 콤보)는 강공격일수록 뒤로 크게 날아감 (x 가속도 감소 없음)
+            vy, vx_mag = move.launch or move.juggle
 
             # 공격자 위치를 참고해 밀려나는 방향 결정 (공격자 기준 밖으로)
-            if attacker and hasattr(attacker, 'x'):
+            if attacker is not None:
                 if attacker.x < self.x:
                     self.velocity_x = vx_mag
                 else:
@@ -507,38 +380,19 @@ class Player:
                 self.y += 5
 
             hit_type = "AIRBORNE COMBO" if was_airborne else "LAUNCH"
-            combo_type = " (KNOCKBACK)" if was_airborne and 'strong' in attack_state.lower() else ""
+            combo_type = " (KNOCKBACK)" if was_airborne and move.strength == 'strong' else ""
             print(f"Player {hit_type}{combo_type} by {attack_state}! vx:{self.velocity_x}, vy:{self.velocity_y}")
 
-        # 공격 및 가드 상태 초기화 (피격 시 모든 행동 중단)
-        # 공격을 받은 순간 현재 진행중인 공격을 취소하고,
-        # 해당 공격은 더 이상 타격 판정을 발생시키지 않도록 모든 관련 플래그를 초기화한다.
-        self.is_attacking = False
-        # 이미 현재 공격에 대한 타격 처리가 끝난 것으로 마킹하여 이후 판정에서 제외
-        self.attack_hit_processed = True
-        # SpriteManager가 설정하는 타격 허용 플래그도 즉시 비활성화
-        self.can_process_hit = False
-        self.is_guarding = False
-        self.can_combo = False
-        self.combo_reserved = False
+        # 피격 상태로 전이 - 진행 중인 공격과 가드를 취소하고, 취소된 공격은 더 이상 타격 판정을 만들지 않음
+        playerStateMachine.fire(self, 'damage')
 
         print(f"Player took {damage} damage, HP: {self.hp}, hit_type: {attack_type}")
         return self.hp
 
     def reset_hit_state(self):
-        """hit 상태 완전 초기화"""
-        # hit 상태 및 공격 관련 플래그 안전 초기화
-        self.is_hit = False
-        self.character.reset_hit_state()
-        # 공격 관련 플래그도 확실히 비활성화
-        self.is_attacking = False
-        self.can_process_hit = False
-        self.attack_hit_processed = True
-        self.can_combo = False
-        self.combo_reserved = False
-        if self.state == 'hit':
-            self.state = 'Idle'
-        print("Player hit state reset to normal (attack cancelled and flags cleared)")
+        """hit 상태 완전 초기화 (hit 애니메이션 완료 시) - 공격 관련 플래그도 확실히 비활성화"""
+        if playerStateMachine.fire(self, 'recover'):
+            print("Player hit state reset to normal (attack cancelled and flags cleared)")
 
     def update(self, deltaTime, move_input=None, atk_input=None, combo_input=False, char_change_input=None, other_player=None, position_state='Middle', getup_input=False):
         # 위치 상태 업데이트
@@ -551,11 +405,9 @@ class Player:
                 self.can_attack_after_guard = False
                 print("Guard counter window closed")
 
-        # 가드 상태 업데이트 (빈 함수)
-        self.update_guard(deltaTime)
-
-        # 캐릭터 타입 변경 처리 (공격 중이 아니고 가드 중이 아니고 피격 중이 아닐 때만)
-        if char_change_input and not self.is_attacking and not self.is_guarding and not self.is_hit and char_change_input in ['priest', 'thief', 'fighter']:
+        # 캐릭터 타입 변경 처리 (중립 상태 - 공격/가드/피격 중이 아닐 때만)
+        if (char_change_input and char_change_input in ['priest', 'thief', 'fighter'] and
+                playerStateMachine.state_of(self) == playerStateMachine.NEUTRAL):
             current_type = self.get_character_type()
             if current_type != char_change_input:
                 self.set_character_type(char_change_input)
@@ -572,155 +424,11 @@ class Player:
             elif not self.is_hit and self.state == 'hit':
                 self.state = 'Idle'
 
-        # 가드 중일 때 공격키 입력으로 가드 취소 후 즉시 공격 허용
-        if self.is_guarding and not self.is_attacking and atk_input:
-            if self.can_use_attack(atk_input):
-                # 가드 상태 완전 해제
-                self.is_guarding = False
-                self.can_attack_after_guard = False
-                self.guard_counter_timer = 0.0
-                if hasattr(self, 'guard_animation_reset'):
-                    self.guard_animation_reset = False
-
-                # 즉시 공격 시작
-                self.state = atk_input
-                self.character.state = atk_input  # Character 상태 즉시 동기화
-                self.is_attacking = True
-                self.reset_attack_hit_flag()
-
-                # 연계 가능 설정
-                if atk_input in ['fastMiddleATK', 'strongMiddleATK', 'strongUpperATK']:
-                    self.can_combo = True
-                else:
-                    self.can_combo = False
-
-                self.combo_reserved = False
+        # 행동 상태(중립/공격/가드/피격)별 처리 - 공격 시작, 연계 예약, 이동, 가드 취소, 기상
+        playerStateMachine.update(self, deltaTime, move_input, atk_input, combo_input, other_player, getup_input)
 
-                print(f"Guard canceled by attack input -> immediate attack: {atk_input}")
-                return
-            else:
-                print(f"Cannot use attack {atk_input} for current character")
-
-        # 가드 중이면 다른 행동 불가 - 상태 강제 동기화
-        if self.is_guarding:
-            # 가드 중에는 상태가 'guard'로 고정되어야 함
-            if self.state != 'guard':
-                self.state = 'guard'
-            if self.character.state != 'guard':
-                self.character.state = 'guard'
-            # 이동 등 다른 행동은 제한
-            return
-
-        # hit 상태일 때 기상 입력 처리 - airborne과 down 상태 구분
-        if self.is_hit and self.character.can_get_up:
-            # down 상태 (바닥에 떨어진 후)에서만 기상 가능
-            if (hasattr(self.character, 'hit_type') and
-                self.character.hit_type == 'down' and self.is_grounded):
-                # 방향키 입력이 있으면 기상 시도
-                if getup_input:
-                    if self.character.try_get_up():
-                        self.hit_recovery_input = True
-                        print(f"Player attempting to get up from down state!")
-                        return
-            # strong 공격의 일반적인 기상 처리
-            elif (hasattr(self.character, 'hit_type') and
-                  self.character.hit_type == 'strong'):
-                # 방향키 입력이 있으면 기상 시도
-                if getup_input:
-                    if self.character.try_get_up():
-                        self.hit_recovery_input = True
-                        print(f"Player attempting to get up! Current frame: {self.character.frame}")
-                        return
-
-        # hit 상태가 아닐 때만 일반 행동 처리
-        if not self.is_hit:
-            # 연계 공격 처리 (우선순위 1) - 정확한 키 조합으로만 발동
-            if combo_input and self.can_combo and not self.combo_reserved:
-                # combo_input이 연계 타입을 반환 (예: 'fastMiddleATK_combo', 'strongMiddleATK_combo', 'strongUpperATK_combo')
-                # 현재 상태와 맞는 연계인지 확인
-                if (self.state == 'fastMiddleATK' and combo_input == 'fastMiddleATK_combo') or \
-                   (self.state == 'fastMiddleATK2' and combo_input == 'fastMiddleATK_combo') or \
-                   (self.state == 'strongMiddleATK' and combo_input == 'strongMiddleATK_combo') or \
-                   (self.state == 'strongUpperATK' and combo_input == 'strongUpperATK_combo'):
-                    self.combo_reserved = True
-                    print(f"Combo reserved for {self.get_character_type()}: {self.state} -> {combo_input}")
-                    return
-
-            # 새로운 공격 입력 처리 (공격 중이 아닐 때만)
-            if not self.is_attacking and atk_input:
-                # 캐릭터별 공격 제한 확인
-                if self.can_use_attack(atk_input):
-                    # 반격 창 동안 가드 중이면 가드 해제하고 즉시 공격 허용
-                    if self.is_guarding and self.can_attack_after_guard:
-                        self.is_guarding = False
-                        self.can_attack_after_guard = False
-                        self.guard_counter_timer = 0.0
-                        print("Guard canceled to perform immediate attack")
-
-                    self.state = atk_input
-                    self.is_attacking = True
-                    self.reset_attack_hit_flag()  # 새 공격 시작 시 타격 플래그 리셋
-
-                    # 연계 가능한 공격 설정
-                    if atk_input in ['fastMiddleATK', 'strongMiddleATK', 'strongUpperATK']:
-                        self.can_combo = True
-                    else:
-                        self.can_combo = False
-
-                    self.combo_reserved = False
-                    print(f"Starting attack: {atk_input}")
-                    return
-
-            # 이동 처리 - 상대 플레이어의 위치에 따라 동적으로 Walk/BackWalk 결정
-            if not self.is_attacking and not self.is_guarding and not self.is_hit and self.is_grounded:
-                move_speed = self.get_move_speed()
-
-                # 상대방이 내 오른쪽에 있는지 왼쪽에 있는지 판단
-                opponent_on_right = other_player and other_player.x > self.x
-
-                if move_input == 'right':
-                    # 오른쪽으로 이동
-                    if opponent_on_right:
-                        # 상대가 오른쪽에 있으면 Walk (접근)
-                        new_x = self.x + move_speed * deltaTime
-                        self.state = 'Walk'
-                        self.facing_right = True
-                        self.dir = 1
-                    else:
-                        # 상대가 왼쪽에 있으면 BackWalk (후퇴) - Walk와 동일한 속도
-                        new_x = self.x + move_speed * deltaTime
-                        self.state = 'BackWalk'
-                        self.facing_right = False
-                        self.dir = -1
-                    self.update_position(new_x, other_player)
-
-                elif move_input == 'left':
-                    # 왼쪽으로 이동
-                    if opponent_on_right:
-                        # 상대가 오른쪽에 있으면 BackWalk (후퇴) - Walk와 동일한 속도
-                        new_x = self.x - move_speed * deltaTime
-                        self.state = 'BackWalk'
-                        self.facing_right = True
-                        self.dir = 1
-                    else:
-                        # 상대가 왼쪽에 있으면 Walk (접근)
-                        new_x = self.x - move_speed * deltaTime
-                        self.state = 'Walk'
-                        self.facing_right = False
-                        self.dir = -1
-                    self.update_position(new_x, other_player)
-
-                elif not move_input:
-                    self.state = 'Idle'
-                    # Idle 상태에서도 상대방을 바라보도록 방향 업데이트
-                    if opponent_on_right:
-                        self.facing_right = True
-                        self.dir = 1
-                    else:
-                        self.facing_right = False
-                        self.dir = -1
-
-        # 캐릭터 위치 및 상태 동기화
+    def sync_character(self, deltaTime):
+        """캐릭터 위치 및 상태 동기화 후 Character 업데이트"""
         self.character.x, self.character.y = self.x, self.y
         if not self.is_hit and not self.is_guarding:  # hit 상태나 가드 상태가 아닐 때만 상태 동기화
             self.character.state = self.state
@@ -734,17 +442,11 @@ class Player:
     def set_character_type(self, character_type):
         """캐릭터 타입 변경"""
         if character_type in ['priest', 'thief', 'fighter']:
+            if self.sprite_manager:
+                self.sprite_manager.prefetch(character_type)
             self.character.set_character_type(character_type)
-            # 모든 상태 초기화
-            self.is_attacking = False
-            self.is_guarding = False
-            self.is_hit = False  # hit 상태도 초기화
-            self.can_combo = False
-            self.combo_reserved = False
-            self.state = 'Idle'
-            # Character 상태도 동기화
-            self.character.state = 'Idle'
-            self.character.is_hit = False
+            # 모든 상태 초기화 (Character 상태도 동기화)
+            playerStateMachine.fire(self, 'character_change')
 
     def heal(self, amount):
         """체력을 회복하는 메서드"""
@@ -768,11 +470,11 @@ class Player:
         # 바운딩 박스 및 공격 범위 박스 그리기 (F1 키로 토글)
         if config.SHOW_BOUNDING_BOX:
             # 피격 박스 (빨간색)
-            pico2d.draw_rectangle(*self.get_bb())
+            renderBackend.draw_rectangle(*self.get_bb())
 
-            # 공격 범위 박스 (초록색, 공격 중일 때만)
+            # 공격 범위 박스 (초록색, 공격 판정 프레임에만)
             if self.is_attacking:
                 attack_bb = self.get_attack_range_bb()
                 if attack_bb:
                     # 공격 범위 박스 그리기
-                    pico2d.draw_rectangle(*attack_bb)
+                    renderBackend.draw_rectangle(*attack_bb)
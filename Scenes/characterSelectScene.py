@@ -1,6 +1,14 @@
 import pico2d
+import renderBackend
 import config
 import pathlib
+from functools import partial
+
+import assetBundle
+import assetLoader
+import assetManifest
+import spriteMirror
+from resourceCache import resources
 
 class CharacterSelectScene:
     def __init__(self):
@@ -20,6 +28,7 @@ class CharacterSelectScene:
 
         # 캐릭터 스프라이트
         self.character_sprites = {}
+        self.mirrored_sprites = {}  # 2P용 좌우 반전 프레임 (로딩 시 한 번 생성)
         self.sprite_frames = {}
         self.sprite_frame_index = {}
         self.sprite_animation_time = {}
@@ -47,38 +56,97 @@ class CharacterSelectScene:
         # 배경음악
         self.bgm = None
 
-    def initialize(self):
+        # 이미지 로더 (씬을 벗어나면 이미지를 해제하고 다시 들어올 때 재요청)
+        self.loader = None
+        self.images_loaded = False
+
+    def initialize(self, loader=None):
         """캐릭터 선택 스프라이트 로드"""
+        # 이미지는 로더가 백그라운드에서 디코딩 (로더가 없으면 즉시 로딩)
+        self.loader = loader or assetLoader.immediate_loader
+
+        # 폰트/배경음악은 메인 스레드에서만 로딩 가능
+        self.loader.defer(self._load_font_and_music)
+
+        for char in self.characters:
+            self.sprite_frame_index[char] = 0
+            self.sprite_animation_time[char] = 0.0
+        self.load_images()
+
+    def load_images(self):
+        """배경과 캐릭터 선택 애니메이션 이미지 요청 (이미 로딩되어 있으면 무시)"""
+        if self.images_loaded:
+            return
+        self.images_loaded = True
+
         # 배경 이미지 로드
         background_path = pathlib.Path.cwd() / 'Resources' / 'UI' / 'characterSelect.png'
-        if background_path.exists():
-            self.background = pico2d.load_image(str(background_path))
+        if assetBundle.exists(background_path):
+            # 화면 크기로 미리 리샘플링 (렌더링 시 1:1 복사)
+            display_size = (config.windowWidth, config.windowHeight) if config.BAKE_DISPLAY_SCALE else None
+            self.loader.request_image(background_path, self._on_background_loaded,
+                                      owner='scene:character_select:images', size=display_size)
 
+        for char in self.characters:
+            self.character_sprites[char] = []
+            self.mirrored_sprites[char] = []
+            self.sprite_frames[char] = 0  # 모든 프레임이 올라오기 전에는 그리지 않음
+            # 번들에 없으면 개별 파일에서 찾음 ('Thief'처럼 대소문자가 다른 폴더도 찾음)
+            files = assetBundle.list_files(pathlib.Path.cwd() / 'Resources' / 'Character' / char / 'selected', '.png')
+            if not files:
+                dirs, _ = assetManifest.find_dirs(pathlib.Path.cwd() / 'Resources', 'Character', char, 'selected')
+                files = [f for f in dirs[0].iterdir() if f.suffix == '.png'] if dirs else []
+
+            # 해당 폴더의 모든 png 파일 로드 (10.png가 2.png 앞에 오지 않도록 번호순)
+            if files:
+                files.sort(key=lambda f: (not f.stem.isdigit(), int(f.stem) if f.stem.isdigit() else 0, f.name))
+                self.character_sprites[char] = [None] * len(files)
+                for i, file in enumerate(files):
+                    self.loader.request_image(file, partial(self._on_selected_frame_loaded, char, i),
+                                              owner='scene:character_select:images')
+
+    def release_images(self):
+        """씬을 벗어날 때 이미지 해제 (폰트/배경음악은 유지)"""
+        if not self.images_loaded:
+            return
+        self.images_loaded = False
+        self.background = None
+        for char in self.characters:
+            self.character_sprites[char] = []
+            self.mirrored_sprites[char] = []
+            self.sprite_frames[char] = 0
+        resources.release('scene:character_select:images')
+
+    def _load_font_and_music(self):
         # 폰트 로드
         font_path = pathlib.Path.cwd() / 'ENCR10B.TTF'
-        if font_path.exists():
-            self.font = pico2d.load_font(str(font_path), 40)
+        if assetBundle.exists(font_path):
+            self.font = resources.load_font(font_path, 40, owner='scene:character_select')
 
         # 배경음악 로드 (씬 전환 시 재생됨)
         bgm_path = pathlib.Path.cwd() / 'Resources' / 'Sound' / 'SelectMusic.mp3'
-        if bgm_path.exists():
-            self.bgm = pico2d.load_music(str(bgm_path))
+        if assetBundle.exists(bgm_path):
+            self.bgm = resources.load_music(bgm_path, owner='scene:character_select')
             self.bgm.set_volume(8)
 
-        for char in self.characters:
-            self.character_sprites[char] = []
-            path = pathlib.Path.cwd() / 'Resources' / 'Character' / char / 'selected'
-
-            # 해당 폴더의 모든 png 파일 로드
-            if path.exists():
-                files = sorted([f for f in path.iterdir() if f.suffix == '.png'])
-                for file in files:
-                    img = pico2d.load_image(str(file))
-                    self.character_sprites[char].append(img)
-
-            self.sprite_frames[char] = len(self.character_sprites[char])
-            self.sprite_frame_index[char] = 0
-            self.sprite_animation_time[char] = 0.0
+    def _on_background_loaded(self, image):
+        """배경 업로드 완료"""
+        if self.images_loaded:
+            self.background = image
+
+    def _on_selected_frame_loaded(self, char, index, image):
+        """선택 애니메이션 프레임 업로드 완료 - 모두 올라오면 애니메이션 활성화"""
+        frames = self.character_sprites[char]
+        if index >= len(frames):
+            return  # 업로드 전에 씬 이미지가 해제됨
+        frames[index] = image
+        if all(frame is not None for frame in frames):
+            if config.USE_MIRRORED_SPRITES:
+                try:
+                    self.mirrored_sprites[char] = [spriteMirror.mirror_image(frame) for frame in frames]
+                except Exception as e:
+                    print(f"Warning: Mirrored sprite creation failed for {char}: {e}")
+            self.sprite_frames[char] = len(frames)
 
     def reset(self):
         """캐릭터 선택 씬 초기화 (재시작용)"""
@@ -170,7 +238,7 @@ class CharacterSelectScene:
     def render(self):
         """캐릭터 선택 화면 렌더링"""
         # 배경
-        pico2d.clear_canvas()
+        renderBackend.clear_canvas()
 
         # 배경 이미지 그리기
         if self.background:
@@ -245,13 +313,18 @@ class CharacterSelectScene:
                 p2_x = config.windowWidth * 0.65  # 우측 65% 위치 (중심에 더 가깝게)
                 # 캐릭터별 Y 오프셋 적용
                 y_offset = self.character_y_offset.get(self.p2_character, 0)
-                # 좌우 반전하여 그리기
-                img.clip_composite_draw(
-                    0, 0, img.w, img.h,
-                    0, 'h',  # 'h'는 수평 반전을 의미
-                    p2_x, side_y + y_offset,
-                    img.w * large_scale, img.h * large_scale
-                )
+                mirrored = self.mirrored_sprites.get(self.p2_character)
+                if mirrored:
+                    # 미리 반전해 둔 프레임 그리기
+                    mirrored[frame_idx].draw(p2_x, side_y + y_offset, img.w * large_scale, img.h * large_scale)
+                else:
+                    # 좌우 반전하여 그리기
+                    img.clip_composite_draw(
+                        0, 0, img.w, img.h,
+                        0, 'h',  # 'h'는 수평 반전을 의미
+                        p2_x, side_y + y_offset,
+                        img.w * large_scale, img.h * large_scale
+                    )
 
     def draw_selection_box(self, x, y, width, height, color):
         """선택 박스 그리기 (테두리만) - 여러 개의 선으로 두꺼운 테두리 표현"""
@@ -262,25 +335,25 @@ class CharacterSelectScene:
         for i in range(thickness):
             offset = i
             # 위쪽 선
-            pico2d.draw_line(
+            renderBackend.draw_line(
                 x - width // 2 - offset, y + height // 2 + offset,
                 x + width // 2 + offset, y + height // 2 + offset,
                 r, g, b
             )
             # 아래쪽 선
-            pico2d.draw_line(
+            renderBackend.draw_line(
                 x - width // 2 - offset, y - height // 2 - offset,
                 x + width // 2 + offset, y - height // 2 - offset,
                 r, g, b
             )
             # 왼쪽 선
-            pico2d.draw_line(
+            renderBackend.draw_line(
                 x - width // 2 - offset, y - height // 2 - offset,
                 x - width // 2 - offset, y + height // 2 + offset,
                 r, g, b
             )
             # 오른쪽 선
-            pico2d.draw_line(
+            renderBackend.draw_line(
                 x + width // 2 + offset, y - height // 2 - offset,
                 x + width // 2 + offset, y + height // 2 + offset,
                 r, g, b
@@ -357,11 +430,15 @@ class CharacterSelectScene:
                 img = self.character_sprites[self.p2_character][frame_idx]
                 p2_x = config.windowWidth * 0.65 + int(offset_x)
                 y_offset = self.character_y_offset.get(self.p2_character, 0)
-                img.clip_composite_draw(
-                    0, 0, img.w, img.h,
-                    0, 'h',
-                    p2_x, side_y + y_offset,
-                    img.w * large_scale, img.h * large_scale
-                )
+                mirrored = self.mirrored_sprites.get(self.p2_character)
+                if mirrored:
+                    mirrored[frame_idx].draw(p2_x, side_y + y_offset, img.w * large_scale, img.h * large_scale)
+                else:
+                    img.clip_composite_draw(
+                        0, 0, img.w, img.h,
+                        0, 'h',
+                        p2_x, side_y + y_offset,
+                        img.w * large_scale, img.h * large_scale
+                    )
 
 
@@ -1,9 +1,15 @@
-import pico2d
 import pathlib
+import config
+from functools import partial
+
+import assetBundle
+import assetLoader
+from resourceCache import resources
 
 class PlayScene:
     def __init__(self):
         self.background = None
+        self.background_draw_scale = 2  # 배경을 그릴 때 곱할 배율 (960x540 배경을 2배로)
         self.hpbar_bg = None  # HP바 배경
         self.hp_fill = None   # HP바 내부 채우기
         self.count_ui = None
@@ -29,39 +35,50 @@ class PlayScene:
         self.countdown_index = 0  # 현재 카운트다운 인덱스
         self.countdown_duration = 1.0  # 각 카운트당 지속 시간 (초)
 
-    def initialize(self):
+    def initialize(self, loader=None):
+        # 이미지는 로더가 백그라운드에서 디코딩 (로더가 없으면 즉시 로딩)
+        loader = loader or assetLoader.immediate_loader
+
         # 플레이 배경 이미지 로딩
         base_path = pathlib.Path.cwd() / 'Resources' / 'Scene'
-        self.background = pico2d.load_image(str(base_path / 'stage.png'))
+        # 배경은 2배 크기로 미리 리샘플링해 두고 1:1로 그림
+        bake_scale = 2 if config.BAKE_DISPLAY_SCALE else None
+        self.background_draw_scale = 2 / (bake_scale or 1)
+        loader.request_image(base_path / 'stage.png', partial(setattr, self, 'background'),
+                             owner='scene:play', size=bake_scale)
 
         # HP UI 이미지 로딩
         ui_path = pathlib.Path.cwd() / 'Resources' / 'UI'
-        self.hpbar_bg = pico2d.load_image(str(ui_path / 'hpbar.png'))
-        self.hp_fill = pico2d.load_image(str(ui_path / 'hp10.png'))
-        self.count_ui = pico2d.load_image(str(ui_path / 'count.png'))
-        self.win_count = pico2d.load_image(str(ui_path / 'winCount.png'))
+        loader.request_image(ui_path / 'hpbar.png', partial(setattr, self, 'hpbar_bg'), owner='scene:play')
+        loader.request_image(ui_path / 'hp10.png', partial(setattr, self, 'hp_fill'), owner='scene:play')
+        loader.request_image(ui_path / 'count.png', partial(setattr, self, 'count_ui'), owner='scene:play')
+        loader.request_image(ui_path / 'winCount.png', partial(setattr, self, 'win_count'), owner='scene:play')
 
+        # 폰트/사운드는 메인 스레드에서만 로딩 가능 (로딩만 미룸)
+        loader.defer(self._load_fonts_and_sounds)
+
+        # 3판 2선승제 초기화 (로딩이 끝나기 전에 대전이 시작돼도 점수가 지워지지 않도록 바로)
+        self.reset_game()
+
+    def _load_fonts_and_sounds(self):
         # 폰트 로드 (카운트다운용)
         font_path = pathlib.Path.cwd() / 'ENCR10B.TTF'
-        if font_path.exists():
-            self.font = pico2d.load_font(str(font_path), 120)
-            self.small_font = pico2d.load_font(str(font_path), 50)
+        if assetBundle.exists(font_path):
+            self.font = resources.load_font(font_path, 120, owner='scene:play')
+            self.small_font = resources.load_font(font_path, 50, owner='scene:play')
 
         # 라운드 종료 사운드 로드
         round_over_sound_path = pathlib.Path.cwd() / 'Resources' / 'Sound' / 'roundOver.wav'
-        if round_over_sound_path.exists():
-            self.round_over_sound = pico2d.load_wav(str(round_over_sound_path))
+        if assetBundle.exists(round_over_sound_path):
+            self.round_over_sound = resources.load_wav(round_over_sound_path, owner='scene:play')
             self.round_over_sound.set_volume(10)
 
         # 배경음악 로드 (씬 전환 시 재생됨)
         bgm_path = pathlib.Path.cwd() / 'Resources' / 'Sound' / 'playSceneMusic.mp3'
-        if bgm_path.exists():
-            self.bgm = pico2d.load_music(str(bgm_path))
+        if assetBundle.exists(bgm_path):
+            self.bgm = resources.load_music(bgm_path, owner='scene:play')
             self.bgm.set_volume(8)
 
-        # 3판 2선승제 초기화
-        self.reset_game()
-
     def stop_music(self):
         """배경음악 정지"""
         if self.bgm:
@@ -153,7 +170,8 @@ class PlayScene:
         """HP 정보를 받아서 렌더링"""
         if self.background:
             # 배경을 2배 스케일링하여 전체 화면에 맞춤 (960x540 -> 1920x1080)
-            self.background.draw(960, 540, self.background.w * 2, self.background.h * 2)
+            self.background.draw(960, 540, self.background.w * self.background_draw_scale,
+                                 self.background.h * self.background_draw_scale)
         else:
             print("WARNING: Background is None in render!")
 
@@ -327,7 +345,8 @@ class PlayScene:
         """오프셋을 적용하여 렌더링 (슬라이드 효과용)"""
         # 배경 오프셋 적용
         if self.background:
-            self.background.draw(960 + int(offset_x), 540, self.background.w * 2, self.background.h * 2)
+            self.background.draw(960 + int(offset_x), 540, self.background.w * self.background_draw_scale,
+                                 self.background.h * self.background_draw_scale)
 
         # HP바와 UI는 화면에 고정 (오프셋 적용하지 않음)
         # HP바 렌더링
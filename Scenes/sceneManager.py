@@ -1,8 +1,9 @@
-import pico2d
+import renderBackend
 from Scenes import titleScene
 from Scenes import playScene
 from Scenes import characterSelectScene
 import config
+from startupProfiler import profiler
 
 
 class SceneManager:
@@ -20,13 +21,18 @@ class SceneManager:
         self.transition_to = None
         self.transition_offset = 0.0  # 슬라이드 오프셋
 
-    def initialize(self):
-        self.title_scene.initialize()
-        self.character_select_scene.initialize()
-        self.play_scene.initialize()
+    def initialize(self, loader=None):
+        # 타이틀은 첫 화면이므로 즉시 로딩, 나머지 씬은 로더로 백그라운드 로딩
+        with profiler.section('TitleScene.initialize'):
+            self.title_scene.initialize()
+        with profiler.section('CharacterSelectScene.initialize'):
+            self.character_select_scene.initialize(loader)
+        with profiler.section('PlayScene.initialize'):
+            self.play_scene.initialize(loader)
 
     def change_to_character_select(self):
         """캐릭터 선택 씬으로 전환"""
+        self.character_select_scene.load_images()  # 이전에 해제된 이미지 다시 요청
         self.character_select_scene.reset()  # 씬 리셋
         self.start_transition('title', 'character_select')
 
@@ -99,6 +105,9 @@ class SceneManager:
                 # 플레이씬으로 전환 완료 시 카운트다운 시작
                 if self.transition_to == 'play':
                     self.play_scene.start_countdown()
+                # 캐릭터 선택 씬을 벗어나면 선택 화면 이미지 해제
+                if self.transition_from == 'character_select':
+                    self.character_select_scene.release_images()
                 self.transition_from = None
                 self.transition_to = None
                 self.transition_offset = 0.0
@@ -116,7 +125,7 @@ class SceneManager:
         return 1 - pow(1 - t, 3)
 
     def render(self):
-        pico2d.clear_canvas()
+        renderBackend.clear_canvas()
 
         # 전환 중일 때
         if self.is_transitioning:
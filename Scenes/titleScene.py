@@ -1,7 +1,8 @@
-import pico2d
 import config  # 기존 그대로
 import pathlib
 
+from resourceCache import resources
+
 class TitleScene:
     def __init__(self):
         self.image = None
@@ -9,9 +10,11 @@ class TitleScene:
         self.bgm = None
     def initialize(self):
         path = pathlib.Path.cwd() / 'Resources' / 'Scene' / 'title.png'
-        self.image = pico2d.load_image(str(path))
-        self.font = pico2d.load_font('ENCR10B.TTF', 48)
-        self.bgm = pico2d.load_music(str(pathlib.Path.cwd() / 'Resources' / 'Sound' / 'titleMusic.mp3'))
+        # 화면 크기로 미리 리샘플링 (렌더링 시 1:1 복사)
+        display_size = (config.windowWidth, config.windowHeight) if config.BAKE_DISPLAY_SCALE else None
+        self.image = resources.load_image(path, owner='scene:title', size=display_size)
+        self.font = resources.load_font('ENCR10B.TTF', 48, owner='scene:title')
+        self.bgm = resources.load_music(pathlib.Path.cwd() / 'Resources' / 'Sound' / 'titleMusic.mp3', owner='scene:title')
         self.bgm.set_volume(8)
         self.bgm.repeat_play()
 
@@ -0,0 +1,175 @@
+"""
+스프라이트 아틀라스 빌더 (오프라인 도구)
+Resources/Character의 캐릭터별 프레임 PNG를 몇 장의 시트로 묶고 프레임 테이블을 생성
+각 프레임은 알파 경계 상자로 잘라 투명 테두리를 버리고, 원래 프레임 안 위치를 기록
+
+실행 (프로젝트 루트에서):
+    python -m Tools.atlasBuilder [--max-size 2048] [--padding 2] [--no-trim] [캐릭터 ...]
+
+출력:
+    Resources/Atlas/<캐릭터>_<번호>.png  - 시트 이미지
+    Resources/Atlas/<캐릭터>.json        - 프레임 테이블 (spriteAtlas.py가 읽음)
+"""
+import argparse
+import json
+import sys
+
+try:
+    from PIL import Image
+except ImportError:
+    print("Pillow is required for the atlas builder: pip install pillow")
+    sys.exit(1)
+
+import assetManifest
+from spriteAtlas import ATLAS_VERSION, get_atlas_dir
+
+
+def collect_frames(character_type):
+    """캐릭터의 모든 프레임 파일 수집 - 여러 상태가 같은 파일을 쓰면 한 번만 포함
+
+    프레임 목록은 에셋 매니페스트 기준 (검증에 실패한 애니메이션은 빠짐)
+    Returns: (frame_paths, animations) - animations는 상태 이름 -> 프레임 인덱스 리스트
+    """
+    frame_paths = []
+    frame_index = {}
+    animations = {}
+
+    for state, paths in assetManifest.get_frame_paths(character_type).items():
+        indices = []
+        for path in paths:
+            key = str(path.resolve())
+            if key not in frame_index:
+                frame_index[key] = len(frame_paths)
+                frame_paths.append(path)
+            indices.append(frame_index[key])
+        animations[state] = indices
+
+    return frame_paths, animations
+
+
+def pack_shelves(sizes, max_size, padding):
+    """선반(shelf) 방식 사각형 배치 - 높이 내림차순으로 한 줄씩 채우고 넘치면 다음 시트
+
+    Returns: (placements, sheet_sizes) - placements[i] = (sheet, x, y)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    placements = [None] * len(sizes)
+    sheet_sizes = []
+
+    sheet = -1
+    cursor_x = cursor_y = shelf_height = used_width = 0
+
+    for i in order:
+        w, h = sizes[i]
+        if w + padding > max_size or h + padding > max_size:
+            raise ValueError(f"Frame {w}x{h} does not fit in a {max_size}x{max_size} sheet")
+
+        # 현재 줄에 들어가지 않으면 다음 줄로
+        if sheet >= 0 and cursor_x + w + padding > max_size:
+            cursor_x = 0
+            cursor_y += shelf_height
+            shelf_height = 0
+
+        # 시트 높이를 넘으면 새 시트 시작
+        if sheet < 0 or cursor_y + h + padding > max_size:
+            if sheet >= 0:
+                sheet_sizes.append((used_width, cursor_y + shelf_height))
+            sheet += 1
+            cursor_x = cursor_y = shelf_height = used_width = 0
+
+        placements[i] = (sheet, cursor_x, cursor_y)
+        cursor_x += w + padding
+        shelf_height = max(shelf_height, h + padding)
+        used_width = max(used_width, cursor_x)
+
+    if sheet >= 0:
+        sheet_sizes.append((used_width, cursor_y + shelf_height))
+
+    return placements, sheet_sizes
+
+
+def trim_frame(img):
+    """완전히 투명한 테두리를 잘라낸 이미지와 원래 프레임 안 위치 (ox, oy) 반환"""
+    bbox = img.getchannel('A').getbbox()
+    if bbox is None:
+        # 완전히 투명한 프레임은 1x1만 남김
+        bbox = (0, 0, 1, 1)
+    return img.crop(bbox), bbox[0], bbox[1]
+
+
+def sheet_pixels(sizes, max_size, padding):
+    """주어진 프레임 크기들을 배치했을 때의 시트 픽셀 수 합계"""
+    _, sheet_sizes = pack_shelves(sizes, max_size, padding)
+    return sum(w * h for w, h in sheet_sizes)
+
+
+def report_savings(character_type, full_sizes, trimmed_sizes, max_size, padding):
+    """잘라내기 전후의 프레임 면적(매 프레임 블렌딩되는 픽셀)과 시트 메모리 비교 출력"""
+    full_area = sum(w * h for w, h in full_sizes)
+    trimmed_area = sum(w * h for w, h in trimmed_sizes)
+    full_bytes = sheet_pixels(full_sizes, max_size, padding) * 4
+    trimmed_bytes = sheet_pixels(trimmed_sizes, max_size, padding) * 4
+    print(f"  {character_type} trim: fill area {full_area:,} -> {trimmed_area:,} px "
+          f"({100 * (1 - trimmed_area / full_area):.1f}% less), "
+          f"sheet memory {full_bytes / 1024 / 1024:.1f} -> {trimmed_bytes / 1024 / 1024:.1f} MB "
+          f"({100 * (1 - trimmed_bytes / full_bytes):.1f}% less)")
+
+
+def build_character_atlas(character_type, out_dir, max_size=2048, padding=2, trim=True):
+    """캐릭터 하나의 아틀라스 시트와 프레임 테이블 생성"""
+    frame_paths, animations = collect_frames(character_type)
+    images = [Image.open(path).convert('RGBA') for path in frame_paths]
+    full_sizes = [img.size for img in images]
+    if trim:
+        trimmed = [trim_frame(img) for img in images]
+    else:
+        trimmed = [(img, 0, 0) for img in images]
+    placements, sheet_sizes = pack_shelves([img.size for img, _, _ in trimmed], max_size, padding)
+
+    sheets = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in sheet_sizes]
+    frames = []
+    for (img, ox, oy), (fw, fh), (sheet, x, y) in zip(trimmed, full_sizes, placements):
+        sheets[sheet].paste(img, (x, y))
+        frames.append({'sheet': sheet, 'x': x, 'y': y, 'w': img.width, 'h': img.height,
+                       'ox': ox, 'oy': oy, 'fw': fw, 'fh': fh})
+
+    sheet_names = []
+    for n, sheet_img in enumerate(sheets):
+        name = f'{character_type}_{n}.png'
+        sheet_img.save(out_dir / name, optimize=True)
+        sheet_names.append(name)
+
+    table = {
+        'version': ATLAS_VERSION,
+        'character': character_type,
+        'sheets': sheet_names,
+        'frames': frames,
+        'animations': animations,
+    }
+    with open(out_dir / f'{character_type}.json', 'w', encoding='utf-8') as f:
+        json.dump(table, f, indent=1)
+
+    print(f"{character_type}: {len(frames)} frames -> {len(sheets)} sheet(s) "
+          f"{', '.join(f'{w}x{h}' for w, h in sheet_sizes)}")
+    if trim:
+        report_savings(character_type, full_sizes, [img.size for img, _, _ in trimmed], max_size, padding)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pack character frames into texture atlases')
+    parser.add_argument('characters', nargs='*', default=list(assetManifest.ANIMATION_SPECS),
+                        help='characters to build (default: all)')
+    parser.add_argument('--max-size', type=int, default=2048, help='maximum sheet width/height')
+    parser.add_argument('--padding', type=int, default=2, help='transparent gap between frames')
+    parser.add_argument('--no-trim', dest='trim', action='store_false',
+                        help='keep transparent frame borders')
+    args = parser.parse_args(argv)
+
+    out_dir = get_atlas_dir()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for character_type in args.characters:
+        build_character_atlas(character_type, out_dir, args.max_size, args.padding, args.trim)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+"""
+밸런스 스윕 (오프라인 도구)
+캐릭터 조합 x 튜닝 상수 조합마다 봇끼리 matchState 대전을 돌려 승률, 평균 라운드 길이, 기술별 데미지를 CSV로 기록
+
+- 튜닝 상수는 config의 SWEEP_PARAMETERS (데미지, 공격 범위, 공격 프레임 간격) - 지정하지 않은 값은 현재 config 값
+  (프레임 간격은 애니메이션 길이와 frameData의 판정 구간을 같은 비율로 바꿈 - frameData.frames)
+- 작업 하나 = (캐릭터 조합, 상수 조합, 시드)의 --matches 매치, 작업끼리 독립이라 프로세스 풀에서 코어 수만큼 나눠 실행
+- 작업이 끝날 때마다 한 줄씩 기록하고 flush - 중단 후 같은 명령으로 다시 실행하면 기록된 작업(key 열)은 건너뜀
+- 같은 작업은 항상 같은 결과 (시드와 매개변수로 봇 난수 고정)
+
+실행 (프로젝트 루트에서):
+    python -m Tools.balanceSweep --param FAST_DAMAGE=8,10,12 --param STRONG_FRAME_TIME=0.11,0.13 \\
+        [--characters fighter,priest,thief] [--bot scripted|random] [--matches 20] [--seeds 4] \\
+        [--workers 코어 수] [--out balanceSweep.csv]
+"""
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import pathlib
+import random
+import sys
+import time
+
+import config
+import frameData
+import matchState
+import moveRegistry
+from matchState import (BUTTON_DOWN, BUTTON_FAST, BUTTON_LEFT, BUTTON_RIGHT, BUTTON_STRONG, BUTTON_UP,
+                        GUARD_POSITIONS, SIM_DT)
+
+# 스윕할 수 있는 config 상수 -> 값 타입
+SWEEP_PARAMETERS = {
+    'FAST_DAMAGE': int,
+    'STRONG_DAMAGE': int,
+    'RAGE_DAMAGE': int,
+    'FAST_ATTACK_RANGE': int,
+    'STRONG_ATTACK_RANGE': int,
+    'RAGE_ATTACK_RANGE': int,
+    'PRIEST_STRONG_UPPER_RANGE': int,
+    'FAST_FRAME_TIME': float,
+    'STRONG_FRAME_TIME': float,
+}
+
+CHARACTERS = sorted(matchState.FRAME_COUNTS)  # CharacterSelectScene.characters와 같은 목록
+MOVES = sorted(GUARD_POSITIONS)  # 모든 공격 상태
+BOTS = ('scripted', 'random')
+
+COLUMNS = (['key', 'p1', 'p2', 'bot', 'seed', 'matches', 'max_steps'] + list(SWEEP_PARAMETERS) +
+           ['p1_wins', 'p2_wins', 'draws', 'p1_win_rate', 'rounds', 'avg_round_seconds', 'steps', 'elapsed'] +
+           [f'damage_{move}' for move in MOVES])
+
+
+class RandomBot:
+    """무작위 버튼 입력 (matchState의 처리량 측정 입력과 같은 분포)"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.inputs = []
+
+    def next(self, me, other):
+        if not self.inputs:
+            self.inputs = matchState._random_inputs(self.rng, 600)[::-1]
+        return self.inputs.pop()
+
+
+class ScriptedBot:
+    """간단한 규칙 봇 - 멀면 다가가고, 가까우면 공격/가드 자세/뒤로 빠지기 중 하나를 몇 스텝 유지
+
+    키 변화만 인식되므로(카운트다운 중에 누른 키, 연계 입력) 한 동작이 끝나면 항상 잠깐 손을 뗌
+    """
+
+    ATTACKS = (BUTTON_FAST, BUTTON_FAST | BUTTON_UP, BUTTON_FAST | BUTTON_DOWN,
+               BUTTON_STRONG, BUTTON_STRONG | BUTTON_UP, BUTTON_STRONG | BUTTON_DOWN)
+    STANCES = (0, BUTTON_UP, BUTTON_DOWN)
+    REACH = 220  # 이보다 멀면 다가감 (픽셀)
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.buttons = 0
+        self.remaining = 0
+
+    def next(self, me, other):
+        self.remaining -= 1
+        if self.remaining > 0:
+            return self.buttons
+
+        rng = self.rng
+        toward = BUTTON_RIGHT if other.x > me.x else BUTTON_LEFT
+        if me.is_hit:
+            # 기상 입력 (방향키)
+            self.buttons, self.remaining = BUTTON_UP, rng.randint(2, 8)
+        elif self.buttons:
+            self.buttons, self.remaining = 0, rng.randint(1, 6)
+        elif abs(other.x - me.x) > self.REACH:
+            self.buttons, self.remaining = toward, rng.randint(5, 20)
+        else:
+            roll = rng.random()
+            if roll < 0.6:
+                self.buttons, self.remaining = rng.choice(self.ATTACKS), rng.randint(3, 10)
+            elif roll < 0.85:
+                self.buttons, self.remaining = rng.choice(self.STANCES), rng.randint(5, 30)
+            else:
+                away = BUTTON_LEFT if toward == BUTTON_RIGHT else BUTTON_RIGHT
+                self.buttons, self.remaining = away, rng.randint(5, 15)
+        return self.buttons
+
+
+def job_key(job):
+    """작업 식별자 - 조합/매개변수/시드/매치 수가 같으면 같은 값 (이어 하기용)"""
+    text = json.dumps(job, sort_keys=True)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _damage_move(attacker_before, attacker_after):
+    """이번 스텝에 들어간 타격의 기술 이름
+
+    타격 판정은 attacker의 update 직후 상태로 하므로, 스텝 시작에 공격 중이었으면 그 공격,
+    아니면 이번 스텝에 시작한 공격 (가드 반격 등)
+    """
+    return attacker_before if attacker_before in GUARD_POSITIONS else attacker_after
+
+
+def run_job(job):
+    """작업 하나 실행 (풀 프로세스에서 호출) - 결과 행 딕셔너리 반환"""
+    for name, value in job['params'].items():
+        setattr(config, name, value)
+    moveRegistry.rebuild()
+    frameData.build()
+
+    bot_class = ScriptedBot if job['bot'] == 'scripted' else RandomBot
+    rng = random.Random(job_key(job))
+    wins = [0, 0]
+    draws = rounds = total_steps = round_steps = 0
+    damage = dict.fromkeys(MOVES, 0)
+
+    start = time.perf_counter()
+    for _ in range(job['matches']):
+        match = matchState.MatchState(job['p1'], job['p2'])
+        bots = (bot_class(rng), bot_class(rng))
+        round_start = None
+        while not match.game_over and match.step_count < job['max_steps']:
+            p1, p2 = match.p1, match.p2
+            before = (p1.state, p2.state, p1.hp, p2.hp, match.round_over)
+            matchState.advance(match, bots[0].next(p1, p2), bots[1].next(p2, p1))
+
+            if round_start is None and not match.countdown_active:
+                round_start = match.step_count
+            if match.round_over and not before[4]:
+                rounds += 1
+                round_steps += match.step_count - round_start
+            if match.countdown_active:
+                round_start = None
+            if before[4] and not match.round_over:
+                continue  # 라운드가 다시 시작되며 HP가 초기화된 스텝
+            if p2.hp < before[3]:
+                damage[_damage_move(before[0], p1.state)] += before[3] - p2.hp
+            if p1.hp < before[2]:
+                damage[_damage_move(before[1], p2.state)] += before[2] - p1.hp
+
+        total_steps += match.step_count
+        if match.winner == 'Player1':
+            wins[0] += 1
+        elif match.winner == 'Player2':
+            wins[1] += 1
+        else:
+            draws += 1
+
+    row = {'key': job_key(job), 'p1': job['p1'], 'p2': job['p2'], 'bot': job['bot'], 'seed': job['seed'],
+           'matches': job['matches'], 'max_steps': job['max_steps']}
+    row.update(job['params'])
+    row.update({
+        'p1_wins': wins[0],
+        'p2_wins': wins[1],
+        'draws': draws,
+        'p1_win_rate': round(wins[0] / job['matches'], 4),
+        'rounds': rounds,
+        'avg_round_seconds': round(round_steps * SIM_DT / rounds, 3) if rounds else '',
+        'steps': total_steps,
+        'elapsed': round(time.perf_counter() - start, 3),
+    })
+    row.update({f'damage_{move}': value for move, value in damage.items()})
+    return row
+
+
+def parse_param(text):
+    """'NAME=v1,v2,...' -> (NAME, [값, ...])"""
+    name, _, values = text.partition('=')
+    name = name.strip().upper()
+    if name not in SWEEP_PARAMETERS or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=v1,v2 with NAME in {', '.join(SWEEP_PARAMETERS)}")
+    try:
+        return name, [SWEEP_PARAMETERS[name](v) for v in values.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid value in '{text}'")
+
+
+def build_jobs(args):
+    """캐릭터 조합 x 매개변수 조합 x 시드 작업 목록"""
+    grid = {name: [getattr(config, name)] for name in SWEEP_PARAMETERS}
+    grid.update(args.param)
+    characters = args.characters.split(',')
+    for name in characters:
+        if name not in CHARACTERS:
+            raise SystemExit(f"Unknown character '{name}' (choose from {', '.join(CHARACTERS)})")
+
+    jobs = []
+    for p1, p2 in itertools.product(characters, repeat=2):
+        for values in itertools.product(*grid.values()):
+            for seed in range(args.seeds):
+                jobs.append({'p1': p1, 'p2': p2, 'bot': args.bot, 'seed': seed, 'matches': args.matches,
+                             'max_steps': args.max_steps, 'params': dict(zip(grid, values))})
+    return jobs
+
+
+def open_results(path):
+    """결과 CSV를 이어 쓰기용으로 열기 - 이미 기록된 작업 key 집합과 writer 반환
+
+    중단되며 잘린 마지막 줄은 지우고, 열 구성이 다른 기존 파일은 덮어쓰지 않고 중단
+    """
+    done = set()
+    if path.exists() and path.stat().st_size:
+        with open(path, 'rb+') as f:
+            data = f.read()
+            if not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames != COLUMNS:
+                raise SystemExit(f"{path} has different columns - use another --out file")
+            done = {row['key'] for row in reader}
+
+    f = open(path, 'a', newline='', encoding='utf-8')
+    writer = csv.DictWriter(f, fieldnames=COLUMNS)
+    if not done and f.tell() == 0:
+        writer.writeheader()
+    return f, writer, done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sweep characters and tuning constants with bot matches')
+    parser.add_argument('--param', type=parse_param, action='append', default=[], metavar='NAME=v1,v2',
+                        help=f"config constant values to sweep ({', '.join(SWEEP_PARAMETERS)})")
+    parser.add_argument('--characters', default=','.join(CHARACTERS), help='characters to pair up')
+    parser.add_argument('--bot', default='scripted', choices=BOTS, help='input bot for both players')
+    parser.add_argument('--matches', type=int, default=20, help='matches per job')
+    parser.add_argument('--seeds', type=int, default=1, help='jobs per combination (different bot seeds)')
+    parser.add_argument('--max-steps', type=int, default=60 * 60 * 5, help='steps before a match is a draw')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--out', default='balanceSweep.csv', help='result CSV (appended, resumable)')
+    args = parser.parse_args(argv)
+    args.param = dict(args.param)
+
+    path = pathlib.Path(args.out)
+    jobs = build_jobs(args)
+    f, writer, done = open_results(path)
+    pending = [job for job in jobs if job_key(job) not in done]
+    print(f"{len(jobs)} jobs ({len(jobs) - len(pending)} already in {path}), {args.workers} workers")
+
+    start = time.perf_counter()
+    matches = 0
+    try:
+        with multiprocessing.Pool(args.workers) as pool:
+            for index, row in enumerate(pool.imap_unordered(run_job, pending), 1):
+                writer.writerow(row)
+                f.flush()
+                matches += row['matches']
+                print(f"[{index}/{len(pending)}] {row['p1']} vs {row['p2']} seed {row['seed']}: "
+                      f"P1 {row['p1_wins']} - {row['p2_wins']} P2, {row['draws']} draws ({row['elapsed']:.1f} s)")
+    except KeyboardInterrupt:
+        print("Interrupted - run the same command again to resume")
+        sys.exit(1)
+    finally:
+        f.close()
+
+    elapsed = time.perf_counter() - start
+    if pending:
+        print(f"Done: {matches} matches in {elapsed:.1f} s ({matches / elapsed:.1f} matches/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+아틀라스 vs 개별 파일 벤치마크
+스프라이트 로딩 시간과 초당 draw 횟수를 두 경로에서 비교
+
+실행 (프로젝트 루트에서, 먼저 python -m Tools.atlasBuilder 로 아틀라스 생성):
+    python -m Tools.benchAtlas [--draws 20000] [--batch 100]
+"""
+import argparse
+import itertools
+import time
+
+import pico2d
+
+import config
+from spriteManager import SpriteManager
+from Tools.benchUtil import measure_draws
+
+
+def load_manager(use_atlas):
+    """SpriteManager를 지정한 모드로 로딩하고 걸린 시간 반환"""
+    manager = SpriteManager()
+    manager.use_atlas = use_atlas
+    start = time.perf_counter()
+    manager.load_sprites()
+    return manager, time.perf_counter() - start
+
+
+def draws_per_second(manager, total_draws, batch):
+    """모든 캐릭터/상태의 프레임을 번갈아 그리며 초당 draw 횟수 측정 (batch마다 present)"""
+    frames = [frame
+              for sprites in manager.shared_sprites.values()
+              for frame_list in sprites.values()
+              for frame in frame_list]
+    if not frames:
+        return 0.0
+
+    scale = manager.draw_scale
+    flips = itertools.cycle((False, True))
+
+    def draw(frame, x, y):
+        # 실제 렌더링과 같이 절반은 좌우 반전 경로 사용
+        if next(flips):
+            frame.composite_draw(0, 'h', x, y, frame.w * scale, frame.h * scale)
+        else:
+            frame.draw(x, y, frame.w * scale, frame.h * scale)
+
+    return 1.0 / measure_draws(frames, draw, total_draws, batch)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare atlas and loose-file sprite paths')
+    parser.add_argument('--draws', type=int, default=20000, help='draw calls per measurement')
+    parser.add_argument('--batch', type=int, default=100, help='draw calls per update_canvas')
+    args = parser.parse_args(argv)
+
+    pico2d.open_canvas(config.windowWidth, config.windowHeight)
+    try:
+        results = []
+        for label, use_atlas in (('loose', False), ('atlas', True)):
+            manager, load_time = load_manager(use_atlas)
+            frame_count = sum(len(v) for s in manager.shared_sprites.values() for v in s.values())
+            draws_per_sec = draws_per_second(manager, args.draws, args.batch)
+            results.append((label, load_time, frame_count, draws_per_sec))
+            del manager
+
+        print(f"{'mode':<8}{'load (ms)':>12}{'frames':>10}{'draws/s':>12}")
+        for label, load_time, frame_count, draws_per_sec in results:
+            print(f"{label:<8}{load_time * 1000:>12.1f}{frame_count:>10}{draws_per_sec:>12.0f}")
+    finally:
+        pico2d.close_canvas()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+반전 그리기 vs 미리 반전한 스프라이트 벤치마크
+왼쪽을 바라보는 캐릭터를 그리는 두 방법의 draw 1회당 비용을 비교
+
+실행 (프로젝트 루트에서):
+    python -m Tools.benchMirror [--draws 20000] [--batch 100] [--atlas | --loose]
+"""
+import argparse
+import time
+
+import pico2d
+
+import config
+from spriteManager import SpriteManager
+from Tools.benchUtil import measure_draws
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare flipped draws with pre-mirrored sprites')
+    parser.add_argument('--draws', type=int, default=20000, help='draw calls per measurement')
+    parser.add_argument('--batch', type=int, default=100, help='draw calls per update_canvas')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--atlas', dest='use_atlas', action='store_true', default=config.USE_SPRITE_ATLAS,
+                      help='load sprites from the atlas')
+    mode.add_argument('--loose', dest='use_atlas', action='store_false', help='load sprites from loose files')
+    args = parser.parse_args(argv)
+
+    pico2d.open_canvas(config.windowWidth, config.windowHeight)
+    try:
+        manager = SpriteManager()
+        manager.use_atlas = args.use_atlas
+        manager.use_mirrored = True
+        start = time.perf_counter()
+        manager.load_sprites()
+        load_time = time.perf_counter() - start
+
+        frames, mirrored = [], []
+        for character_type, sprites in manager.shared_sprites.items():
+            for state, frame_list in sprites.items():
+                frames.extend(frame_list)
+                mirrored.extend(manager.mirrored_sprites[character_type][state])
+        if not frames:
+            print("No sprites loaded")
+            return
+
+        scale = manager.draw_scale
+        cases = (
+            ('draw (facing right)', frames,
+             lambda f, x, y: f.draw(x, y, f.w * scale, f.h * scale)),
+            ("composite_draw 'h'", frames,
+             lambda f, x, y: f.composite_draw(0, 'h', x, y, f.w * scale, f.h * scale)),
+            ('pre-mirrored draw', mirrored,
+             lambda f, x, y: f.draw(x, y, f.w * scale, f.h * scale)),
+        )
+
+        print(f"{'atlas' if args.use_atlas else 'loose'} sprites: {len(frames)} frames, "
+              f"loaded + mirrored in {load_time * 1000:.1f} ms")
+        print(f"{'path':<22}{'us/draw':>10}")
+        for label, case_frames, draw in cases:
+            per_draw = measure_draws(case_frames, draw, args.draws, args.batch)
+            print(f"{label:<22}{per_draw * 1e6:>10.1f}")
+    finally:
+        pico2d.close_canvas()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Player/Character 벤치마크
+헤드리스로 매치를 잠시 진행한 뒤 Player.update와 Game.check_collision 1회당 시간, Player/Character 인스턴스 메모리를 측정
+
+- update는 상태가 변하지 않는 입력(제자리, 상대 쪽으로 걷다가 막힘)으로 반복 호출
+- check_collision은 공격이 없는 경우와 판정 프레임이지만 사거리 밖인 경우 (타격 처리 없이 판정 경로만 지나감)
+- 메모리는 인스턴스 + __dict__ 크기(바이트)와, 인스턴스를 --instances개 만들 때 늘어난 할당량 / 개수
+
+실행 (프로젝트 루트에서):
+    python -m Tools.benchPlayer [--repeat 100000] [--warmup 600] [--instances 2000]
+"""
+import argparse
+import sys
+import tracemalloc
+
+import config
+import game
+import renderBackend
+from Character.character import Character
+from Player.player import Player
+from Tools.benchUtil import measure
+
+
+def shallow_size(obj):
+    """인스턴스 + __dict__ 크기 (__slots__ 클래스는 인스턴스만)"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(vars(obj))
+    return size
+
+
+def allocated_size(factory, count):
+    """factory()로 count개 만들 때 늘어난 할당량 / count"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time Player.update and Game.check_collision, measure instance size')
+    parser.add_argument('--repeat', type=int, default=100000, help='calls per measurement')
+    parser.add_argument('--warmup', type=int, default=600, help='match steps to play before measuring')
+    parser.add_argument('--instances', type=int, default=2000, help='instances to create for the allocation figure')
+    parser.add_argument('--seed', type=int, default=0, help='demo input seed')
+    args = parser.parse_args(argv)
+
+    config.RECORD_REPLAYS = False
+    renderBackend.enable_headless(renderBackend.InputScript.demo(args.warmup, args.seed))
+    match = game.Game()
+    match.initialize()
+    match.start_match('fighter', 'thief')
+    match.assetLoader.finish_all()
+    match.run_headless(args.warmup, render=False)
+
+    left, right = match.playerLeft, match.playerRight
+    for player in (left, right):
+        if player.is_hit:
+            player.reset_hit_state()
+        player.is_attacking = player.is_guarding = False
+        player.velocity_x = player.velocity_y = 0.0
+        player.y = config.GROUND_Y
+        player.is_grounded = True
+        player.state = 'Idle'
+    left.x, right.x = config.windowWidth * 0.3, config.windowWidth * 0.7
+    dt = match.sim_dt
+
+    def attack_out_of_range():
+        """판정 프레임인 공격 (상대는 사거리 밖)"""
+        left.x = config.windowWidth * 0.3
+        left.state = 'fastMiddleATK'
+        left.is_attacking = left.can_process_hit = True
+        left.attack_hit_processed = False
+        left.move_frame = 15
+        match.check_collision()
+
+    def no_attack():
+        left.is_attacking = left.can_process_hit = False
+        left.state = 'Idle'
+        match.check_collision()
+
+    cases = (
+        ('Player.update (idle)', lambda: left.update(dt, other_player=right)),
+        ('Player.update (walk)', lambda: left.update(dt, move_input='right', other_player=right)),
+        ('check_collision (idle)', no_attack),
+        ('check_collision (attack)', attack_out_of_range),
+    )
+    print(f"{'operation':<28}{'us/call':>10}")
+    for label, function in cases:
+        function()
+        per_call = measure(function, args.repeat)
+        print(f"{label:<28}{per_call * 1e6:>10.3f}")
+
+    print(f"\n{'instance':<12}{'shallow bytes':>15}{'allocated bytes':>17}")
+    print(f"{'Character':<12}{shallow_size(left.character):>15}"
+          f"{allocated_size(Character, args.instances):>17.0f}")
+    print(f"{'Player':<12}{shallow_size(left):>15}{allocated_size(Player, args.instances):>17.0f}")
+    match.assetLoader.shutdown()
+
+
+if __name__ == '__main__':
+    main()
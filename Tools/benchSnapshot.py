@@ -0,0 +1,62 @@
+"""
+대전 상태 스냅샷 벤치마크
+헤드리스로 매치를 잠시 진행한 뒤 gameSnapshot 저장/복원 방식별 1회당 시간과 크기를 비교
+
+실행 (프로젝트 루트에서):
+    python -m Tools.benchSnapshot [--repeat 20000] [--warmup 600]
+"""
+import argparse
+
+import config
+import game
+import gameSnapshot
+import renderBackend
+from Tools.benchUtil import measure
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time match-state snapshot save/restore')
+    parser.add_argument('--repeat', type=int, default=20000, help='calls per measurement')
+    parser.add_argument('--warmup', type=int, default=600, help='match steps to play before measuring')
+    parser.add_argument('--seed', type=int, default=0, help='demo input seed')
+    args = parser.parse_args(argv)
+
+    config.RECORD_REPLAYS = False
+    renderBackend.enable_headless(renderBackend.InputScript.demo(args.warmup, args.seed))
+    match = game.Game()
+    match.initialize()
+    match.start_match('fighter', 'thief')
+    match.assetLoader.finish_all()
+    reference = gameSnapshot.capture(match)  # 리플레이 첫 키프레임 (나머지 키프레임의 압축 기준)
+    match.run_headless(args.warmup, render=False)
+
+    snapshot = gameSnapshot.capture(match)
+    buffer = gameSnapshot.save(match)
+    packed = gameSnapshot.pack(snapshot)
+    delta = gameSnapshot.pack(snapshot, reference)
+    round_buffer = gameSnapshot.save(match, gameSnapshot.ROUND_KEYS)
+    cases = (
+        ('save (marshal buffer)', lambda: gameSnapshot.save(match), len(buffer)),
+        ('load (marshal buffer)', lambda: gameSnapshot.load(match, buffer), len(buffer)),
+        ('save round state', lambda: gameSnapshot.save(match, gameSnapshot.ROUND_KEYS), len(round_buffer)),
+        ('load round state', lambda: gameSnapshot.load(match, round_buffer), len(round_buffer)),
+        ('capture (dict)', lambda: gameSnapshot.capture(match), None),
+        ('restore (dict)', lambda: gameSnapshot.restore(match, snapshot), None),
+        ('pack (file keyframe)', lambda: gameSnapshot.pack(snapshot), len(packed)),
+        ('unpack (file keyframe)', lambda: gameSnapshot.unpack(packed), len(packed)),
+        ('pack (file, vs first)', lambda: gameSnapshot.pack(snapshot, reference), len(delta)),
+        ('unpack (file, vs first)', lambda: gameSnapshot.unpack(delta, reference), len(delta)),
+    )
+
+    fields = sum(len(state) for key, state in snapshot.items() if key != 'characters')
+    print(f"{fields} fields after {args.warmup} steps")
+    print(f"{'operation':<26}{'us/call':>10}{'bytes':>8}")
+    for label, function, size in cases:
+        repeat = args.repeat if 'file' not in label else max(1, args.repeat // 20)
+        per_call = measure(function, repeat)
+        print(f"{label:<26}{per_call * 1e6:>10.2f}{size if size is not None else '':>8}")
+    match.assetLoader.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+벤치마크 공용 측정 함수 (Tools/bench*.py)
+"""
+import time
+
+import pico2d
+
+import config
+
+
+def measure(function, repeat):
+    """function() 1회당 평균 시간(초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def measure_draws(frames, draw, total_draws, batch):
+    """프레임들을 번갈아 draw(frame, x, y)로 화면 가운데에 그리며 draw 1회당 평균 시간(초) 측정 (batch마다 present)"""
+    x, y = config.windowWidth // 2, config.windowHeight // 2
+    start = time.perf_counter()
+    for n in range(total_draws):
+        draw(frames[n % len(frames)], x, y)
+        if n % batch == batch - 1:
+            pico2d.update_canvas()
+    pico2d.update_canvas()
+    return (time.perf_counter() - start) / total_draws
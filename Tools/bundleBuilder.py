@@ -0,0 +1,105 @@
+"""
+에셋 번들 빌더 (오프라인 도구)
+Resources 아래 파일과 프로젝트 루트의 폰트를 하나의 번들 파일로 묶음 (형식은 assetBundle.py 참고)
+번들에는 새로 만든 에셋 매니페스트를 함께 넣어 실행 시 폴더 탐색을 하지 않음
+
+실행 (프로젝트 루트에서):
+    python -m Tools.bundleBuilder [--output Resources.bundle] [--align 16]
+
+아틀라스를 쓰려면 먼저 python -m Tools.atlasBuilder로 Resources/Atlas를 만든 뒤 실행
+"""
+import argparse
+import json
+import pathlib
+
+import assetManifest
+import config
+from assetBundle import BUNDLE_MAGIC, BUNDLE_VERSION, ENTRY, HEADER, bundle_name, get_format
+
+# 번들에 넣지 않는 항목 (Resources 기준, 소문자)
+EXCLUDED_DIRS = {'.scaled'}
+EXCLUDED_SUFFIXES = {'.tmp'}
+
+# Resources 밖에서 함께 넣는 파일 (프로젝트 루트 기준)
+EXTRA_FILES = ('ENCR10B.TTF',)
+
+
+def collect_files(resources):
+    """번들에 넣을 파일 목록 - 대소문자만 다른 같은 경로는 정렬 순서상 앞의 파일만 사용
+
+    Returns: [(번들 이름, 경로)]
+    """
+    manifest_path = assetManifest.get_manifest_path()
+    files = {}
+    for path in sorted(resources.rglob('*')):
+        rel = path.relative_to(resources)
+        if not path.is_file() or rel.parts[0].lower() in EXCLUDED_DIRS:
+            continue
+        if path.suffix.lower() in EXCLUDED_SUFFIXES or path == manifest_path:
+            continue
+        name = bundle_name(path)
+        if name in files:
+            print(f"Warning: {rel.as_posix()} duplicates {files[name].relative_to(resources).as_posix()}, skipped")
+            continue
+        files[name] = path
+    for rel in EXTRA_FILES:
+        path = pathlib.Path.cwd() / rel
+        if path.is_file():
+            files.setdefault(bundle_name(path), path)
+    return [(path.relative_to(pathlib.Path.cwd()).as_posix(), path) for path in files.values()]
+
+
+def write_bundle(output, items, align):
+    """(이름, 내용) 목록을 번들 파일로 저장 - 각 파일 내용은 align 바이트 경계에서 시작
+
+    Returns: 번들 크기 (바이트)
+    """
+    encoded = [(name.encode('utf-8'), data) for name, data in items]
+    index_size = HEADER.size + sum(ENTRY.size + len(name) for name, _ in encoded)
+
+    offsets = []
+    offset = index_size
+    for _, data in encoded:
+        offset += -offset % align
+        offsets.append(offset)
+        offset += len(data)
+
+    tmp_path = output.with_name(output.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(encoded)))
+        for (name, data), (item_name, _), data_offset in zip(encoded, items, offsets):
+            f.write(ENTRY.pack(len(name), data_offset, len(data), get_format(item_name)))
+            f.write(name)
+        for (_, data), data_offset in zip(encoded, offsets):
+            f.write(b'\0' * (data_offset - f.tell()))
+            f.write(data)
+    # 실행 중인 게임이 읽는 번들이 중간 상태로 보이지 않도록 완성 후 교체
+    tmp_path.replace(output)
+    return offset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pack Resources into a single asset bundle')
+    parser.add_argument('--output', default=config.ASSET_BUNDLE, help='bundle file (project root relative)')
+    parser.add_argument('--align', type=int, default=16, help='byte alignment of each file in the bundle')
+    args = parser.parse_args(argv)
+
+    resources = assetManifest.get_resources_dir()
+    files = collect_files(resources)
+
+    # 번들과 같은 시점의 매니페스트를 함께 저장
+    manifest = assetManifest.load_manifest(rebuild=True)
+    manifest_name = assetManifest.get_manifest_path().relative_to(pathlib.Path.cwd()).as_posix()
+
+    items = [(name, path.read_bytes()) for name, path in files]
+    items.append((manifest_name, json.dumps(manifest).encode('utf-8')))
+
+    output = pathlib.Path.cwd() / args.output
+    total = write_bundle(output, items, max(1, args.align))
+    loose_bytes = sum(len(data) for _, data in items)
+    print(f"{output.name}: {len(items)} files, {loose_bytes / 1024 / 1024:.1f} MB data, "
+          f"{total / 1024 / 1024:.1f} MB bundle")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""
+Game / matchState 락스텝 비교 도구 (오프라인 도구)
+헤드리스 Game과 matchState.advance에 같은 무작위 입력을 넣고 매 스텝 두 쪽 상태를 비교
+(위치, HP, 상태, move_frame, 애니메이션 프레임, 라운드 승수) - 하나라도 다르면 첫 불일치 스텝을 출력하고 종료 코드 1
+
+- 입력은 플레이어별로 눌려 있는 키 비트 (inputReplay.PLAYER_KEYS 순서)
+  Game에는 inputReplay.key_events로 만든 키 이벤트로, matchState에는 같은 키의 버튼 비트마스크로 넣음
+- Game은 start_match 후 플레이 씬 전환이 끝난 스텝부터 비교 (matchState는 플레이 씬 진입 직후 상태에서 시작)
+- 매치가 끝나면 같은 캐릭터로 새 매치를 시작해 --steps 스텝까지 계속 (매치마다 눌린 키 없이 시작)
+
+실행 (프로젝트 루트에서):
+    python -m Tools.lockstepCheck [--steps 20000] [--seed 0] [--p1 thief] [--p2 priest]
+"""
+import argparse
+import random
+import sys
+
+import config
+import game as game_module
+import inputReplay
+import matchState
+import renderBackend
+from ioManager import IOManager
+
+KEY_NAMES = tuple(tuple(name for name, _ in keys) for keys in inputReplay.PLAYER_KEYS)
+BUTTON_MAPS = (matchState.PLAYER1_KEYS, matchState.PLAYER2_KEYS)
+
+
+class HeldKeyScript:
+    """스텝마다 정해 둔 키 비트를 키 이벤트로 바꿔 주는 입력 스크립트 (renderBackend 헤드리스 입력)"""
+
+    def __init__(self):
+        self.values = (0, 0)  # 다음 스텝에 눌려 있을 키 비트
+        self.held = [0, 0]
+
+    def next_events(self):
+        events = []
+        for player, value in enumerate(self.values):
+            player_events, self.held[player] = inputReplay.key_events(player, value, self.held[player])
+            events.extend(player_events)
+        return events
+
+
+def random_held_keys(rng, player, steps):
+    """무작위 키 비트 목록 (키 하나를 2~40스텝 누르고 1~20스텝 쉼, 가끔 두 키를 같이 누름)"""
+    names = [name for name in KEY_NAMES[player] if name in BUTTON_MAPS[player]]
+    values = []
+    while len(values) < steps:
+        bits = 1 << KEY_NAMES[player].index(rng.choice(names))
+        if rng.random() < 0.2:
+            bits |= 1 << KEY_NAMES[player].index(rng.choice(names))
+        values.extend([bits] * rng.randint(2, 40))
+        values.extend([0] * rng.randint(1, 20))
+    return values[:steps]
+
+
+def to_buttons(player, bits):
+    """키 비트 -> matchState 버튼 비트마스크"""
+    buttons = 0
+    for i, name in enumerate(KEY_NAMES[player]):
+        if bits >> i & 1 and name in BUTTON_MAPS[player]:
+            buttons |= BUTTON_MAPS[player][name]
+    return buttons
+
+
+def game_values(game):
+    """Game 쪽 비교 값"""
+    values = []
+    for player, animation in zip((game.playerLeft, game.playerRight), game.spriteManager.animations):
+        values.append((player.x, player.y, player.hp, player.state, player.move_frame, animation.frame))
+    play_scene = game.sceneManager.play_scene
+    values.append((play_scene.player1_rounds_won, play_scene.player2_rounds_won))
+    return values
+
+
+def match_values(match):
+    """matchState 쪽 비교 값"""
+    values = []
+    for fighter in (match.p1, match.p2):
+        values.append((fighter.x, fighter.y, fighter.hp, fighter.state, fighter.move_frame, fighter.anim_frame))
+    values.append((match.player1_rounds_won, match.player2_rounds_won))
+    return values
+
+
+class HeadlessGame:
+    """헤드리스 Game을 키 비트 입력으로 1스텝씩 진행 (batchSimulator의 Game 비교에서도 사용)"""
+
+    def __init__(self):
+        config.RECORD_REPLAYS = False
+        self.script = HeldKeyScript()
+        renderBackend.enable_headless(self.script)
+        self.game = game_module.Game()
+        self.game.initialize()
+        title_music = self.game.sceneManager.title_scene.bgm
+        if title_music:
+            title_music.stop()
+        self.started = False
+
+    def start_match(self, p1, p2):
+        """매치 시작 후 플레이 씬 전환이 끝날 때까지 입력 없이 진행 (matchState.MatchState 생성 직후와 같은 시점)
+
+        IOManager도 새로 만들어 첫 매치처럼 눌린 키/연계 입력 없이 시작 (직전 매치의 키 상태를 이어받지 않음)
+        """
+        game = self.game
+        if self.started:
+            game.reset_to_title()
+        self.started = True
+        game.ioManager = IOManager()
+        self.script.values = (0, 0)
+        self.script.held = [0, 0]
+        game.start_match(p1, p2)
+        game.assetLoader.finish_all()  # 스프라이트 로딩 시점이 프레임 수에 영향을 주지 않도록
+        while game.sceneManager.check_is_transitioning():
+            game.step()
+
+    def step(self, values):
+        """키 비트 (player1, player2)로 1스텝 진행"""
+        self.script.values = values
+        self.game.assetLoader.pump(budget=float('inf'))
+        self.game.step()
+
+    def values(self):
+        return game_values(self.game)
+
+    def game_over(self):
+        return self.game.game_over
+
+
+def run(steps, seed, p1, p2):
+    """steps 스텝 락스텝 비교 - (첫 불일치 스텝 또는 None, Game 값, matchState 값, 매치 수) 반환"""
+    runner = HeadlessGame()
+    rng = random.Random(seed)
+    inputs = list(zip(random_held_keys(rng, 0, steps), random_held_keys(rng, 1, steps)))
+    matches = 0
+    match = None
+    for step, values in enumerate(inputs):
+        if match is None or match.game_over:
+            # 매치가 끝나면 게임 오버 화면을 건너뛰고 같은 캐릭터로 다시 시작
+            runner.start_match(p1, p2)
+            match = matchState.MatchState(p1, p2)
+            matches += 1
+        runner.step(values)
+        matchState.advance(match, to_buttons(0, values[0]), to_buttons(1, values[1]))
+        expected = match_values(match)
+        actual = runner.values()
+        if actual != expected:
+            return step, actual, expected, matches
+    return None, None, None, matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Step a headless Game and matchState with the same inputs '
+                                                 'and compare them every step')
+    parser.add_argument('--steps', type=int, default=20000, help='steps to compare')
+    parser.add_argument('--seed', type=int, default=0, help='random input seed')
+    parser.add_argument('--p1', default='thief', choices=sorted(matchState.FRAME_COUNTS), help='player 1 character')
+    parser.add_argument('--p2', default='priest', choices=sorted(matchState.FRAME_COUNTS), help='player 2 character')
+    args = parser.parse_args()
+
+    step, actual, expected, matches = run(args.steps, args.seed, args.p1, args.p2)
+    if step is None:
+        print(f"In lockstep: {args.steps} steps, {matches} matches ({args.p1} vs {args.p2}, seed {args.seed})")
+        return 0
+    print(f"Mismatch at step {step} (match {matches}, {args.p1} vs {args.p2}, seed {args.seed})")
+    for label, game_side, match_side in zip(('Player1', 'Player2', 'rounds'), actual, expected):
+        marker = '' if game_side == match_side else '  <- differs'
+        print(f"  {label:8} game {game_side}")
+        print(f"  {'':8} sim  {match_side}{marker}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+롤백 넷플레이 테스트 하네스 (오프라인 도구)
+실제 네트워크 없이 로컬 UDP 중계기를 사이에 두고 헤드리스 넷플레이(main.py --net-side) 두 개를 실행한 뒤
+되감기 빈도/깊이, 프레임당 재시뮬레이션 비용, 양쪽 확정 상태 해시 일치 여부를 출력
+
+- 중계기는 방향마다 지연(--delay, 한쪽 방향) + 지터(--jitter, 균등 분포 ±) + 손실(--loss 비율)을 주입
+  (지터가 있으면 패킷 순서도 바뀜, 같은 --seed면 같은 지연/손실 순서)
+- 두 쪽 입력은 서로 다른 시드의 무작위 데모 입력 (renderBackend.InputScript.demo)
+- 매치가 끝나거나 --frames 프레임에서 양쪽이 함께 멈춤
+
+실행 (프로젝트 루트에서):
+    python -m Tools.netHarness [--delay 40] [--jitter 10] [--loss 0.05] [--frames 1800] \\
+        [--p1 fighter] [--p2 thief] [--seed 0]
+"""
+import argparse
+import heapq
+import json
+import pathlib
+import random
+import select
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+class UdpRelay(threading.Thread):
+    """두 포트로 받은 패킷을 지연/지터/손실을 주어 반대쪽 피어로 전달"""
+
+    def __init__(self, targets, delay, jitter, loss, seed=0):
+        super().__init__(name='UdpRelay', daemon=True)
+        self.delay = delay
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        # 포트 i로 받은 패킷은 targets[1 - i]로 (i쪽 피어가 보내는 주소)
+        self.sockets = []
+        for _ in targets:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind(('127.0.0.1', 0))
+            self.sockets.append(sock)
+        self.ports = [sock.getsockname()[1] for sock in self.sockets]
+        self.targets = targets
+        self.queue = []  # (전달 시각, 순번, 소켓, 주소, 데이터)
+        self.count = 0
+        self.forwarded = 0
+        self.dropped = 0
+        self.running = True
+
+    def run(self):
+        while self.running:
+            now = time.perf_counter()
+            while self.queue and self.queue[0][0] <= now:
+                _, _, sock, target, data = heapq.heappop(self.queue)
+                try:
+                    sock.sendto(data, target)
+                    self.forwarded += 1
+                except OSError:
+                    pass
+            timeout = min(0.005, self.queue[0][0] - now) if self.queue else 0.005
+            readable, _, _ = select.select(self.sockets, [], [], max(0.0, timeout))
+            for sock in readable:
+                try:
+                    data, _ = sock.recvfrom(2048)
+                except OSError:
+                    continue
+                if self.rng.random() < self.loss:
+                    self.dropped += 1
+                    continue
+                side = self.sockets.index(sock)
+                latency = max(0.0, self.delay + self.rng.uniform(-self.jitter, self.jitter)) / 1000
+                self.count += 1
+                heapq.heappush(self.queue, (time.perf_counter() + latency, self.count, sock,
+                                            self.targets[1 - side], data))
+
+    def stop(self):
+        self.running = False
+        self.join()
+        for sock in self.sockets:
+            sock.close()
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def parse_stats(output):
+    for line in output.splitlines():
+        if line.startswith('NETSTATS '):
+            return json.loads(line[len('NETSTATS '):])
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run two headless rollback netplay peers through a lossy UDP relay')
+    parser.add_argument('--delay', type=float, default=40.0, help='one-way delay in ms')
+    parser.add_argument('--jitter', type=float, default=10.0, help='uniform jitter in ms (+/-)')
+    parser.add_argument('--loss', type=float, default=0.05, help='packet loss ratio')
+    parser.add_argument('--frames', type=int, default=1800, help='frames to play (0 = until the match ends)')
+    parser.add_argument('--p1', default='fighter', help='player 1 character')
+    parser.add_argument('--p2', default='thief', help='player 2 character')
+    parser.add_argument('--seed', type=int, default=0, help='relay and input bot seed')
+    parser.add_argument('--timeout', type=float, default=600.0, help='seconds before the peers are killed')
+    args = parser.parse_args(argv)
+
+    ports = [free_port(), free_port()]
+    relay = UdpRelay([('127.0.0.1', port) for port in ports], args.delay, args.jitter, args.loss, args.seed)
+    relay.start()
+    print(f"Relay: {args.delay:.0f} ms +/- {args.jitter:.0f} ms one-way, {args.loss:.0%} loss "
+          f"(ports {relay.ports[0]}, {relay.ports[1]})")
+
+    # 출력은 파일로 (파이프가 차서 한쪽 피어가 print에서 멈추지 않도록)
+    peers, logs = [], []
+    for side in (0, 1):
+        command = [sys.executable, 'main.py', '--headless', '--net-side', str(side),
+                   '--net-port', str(ports[side]), '--net-peer', f'127.0.0.1:{relay.ports[side]}',
+                   '--net-frames', str(args.frames), '--p1', args.p1, '--p2', args.p2,
+                   '--seed', str(args.seed * 2 + side), '--steps', str(max(args.frames, 36000) * 2)]
+        logs.append(tempfile.TemporaryFile('w+', encoding='utf-8'))
+        peers.append(subprocess.Popen(command, cwd=ROOT, stdout=logs[-1], stderr=subprocess.STDOUT, text=True))
+    start = time.perf_counter()
+    outputs = []
+    try:
+        for peer, log in zip(peers, logs):
+            peer.wait(timeout=max(1.0, args.timeout - (time.perf_counter() - start)))
+            log.seek(0)
+            outputs.append(log.read())
+            log.close()
+    except subprocess.TimeoutExpired:
+        for peer in peers:
+            peer.kill()
+        print(f"Peers did not finish in {args.timeout:.0f} s")
+        return 1
+    finally:
+        relay.stop()
+    elapsed = time.perf_counter() - start
+
+    stats = [parse_stats(output) for output in outputs]
+    for side, (output, side_stats) in enumerate(zip(outputs, stats)):
+        if side_stats is None:
+            print(f"Side {side} reported no stats:\n{output}")
+            return 1
+    print(f"Relay forwarded {relay.forwarded} packets, dropped {relay.dropped} ({elapsed:.1f} s)")
+    for s in stats:
+        print(f"Side {s['side']}: {s['reason']} at frame {s['frames']}, "
+              f"{s['rollbacks']} rollbacks ({s['rollback_rate']:.1%} of frames, {s['resim_frames']} frames resimulated), "
+              f"depth avg {s['depth_avg']:.2f} / max {s['depth_max']}, "
+              f"resim {s['resim_ms_avg']:.3f} ms/frame (p95 {s['resim_ms_p95']:.3f}), "
+              f"{s['stalls']} stalls, {s['sync_waits']} sync waits, frame advantage {s['frame_advantage']:+.1f}")
+        print(f"    depth histogram: {s['depth_histogram']}")
+
+    # 양쪽이 각자 계산한 확정 상태 해시 비교 (모든 체크포인트)
+    left, right = (s['checkpoints'] for s in stats)
+    common = sorted(set(left) & set(right), key=int)
+    mismatched = [frame for frame in common if left[frame] != right[frame]]
+    if mismatched or not common:
+        print(f"DESYNC: {len(mismatched)} of {len(common)} checkpoints differ (first at frame {mismatched[0]})"
+              if mismatched else "No common checkpoints to compare")
+        return 1
+    print(f"In sync: {len(common)} checkpoints match (last at frame {common[-1]})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
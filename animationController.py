@@ -0,0 +1,73 @@
+"""
+엔티티별 애니메이션 컨트롤러
+엔티티(플레이어) 하나의 애니메이션 상태(상태, 프레임, 경과 시간)와 그리기 위치를 담는 객체
+SpriteManager는 컨트롤러 목록을 들고 있고, 스텝마다 advance_all로 모든 컨트롤러의 시간을 한 번에 진행한 뒤
+프레임 경계를 넘은 컨트롤러만 프레임 규칙(피격, 가드, 연계)을 처리함
+
+- 시간은 정수 단위 (1초 = UNITS_PER_SECOND) - 60Hz 스텝과 모든 프레임 간격(0.08, 0.13, 0.8/7 초 등)이 정확히 나누어떨어짐
+  실수 타이머처럼 더할수록 오차가 쌓이지 않음 (예전 실수 누적은 0.25초 = 15스텝 프레임이 16스텝째에 넘어감)
+- elapsed는 현재 프레임이 시작된 뒤 지난 시간 - 프레임 경계를 넘으면 넘친 만큼만 남기고 다음 프레임으로
+  프레임 경계에서 다른 애니메이션으로 넘어갈 때(연계, 가드 연장/종료, 피격/공격 종료)도 넘친 시간을 그대로 이어감 (play)
+  상태가 바뀐 스텝부터 새로 시작할 때만 0부터 (reset)
+- 표시할 수 없는 간격은 가장 가까운 단위로 반올림 (1단위 = 약 3.3마이크로초)
+"""
+
+# 60 * 5040 (5040 = 7!, 1~10 모든 수의 공배수 - 최소공배수 2520의 2배)
+# 1/60초 스텝(5040단위), 0.01초 단위 고정 간격(0.08, 0.13), 0.05초 단위 지속시간을 1~10장으로 나눈 간격이 모두 정수
+UNITS_PER_SECOND = 302400
+
+
+def to_units(seconds):
+    """초 -> 시간 단위 (가장 가까운 정수)"""
+    return round(seconds * UNITS_PER_SECOND)
+
+
+class AnimationController:
+    __slots__ = ('owner', 'label', 'character_type', 'state', 'frame', 'elapsed', 'frame_count', 'frame_units',
+                 'settled', 'x', 'y', 'dir', 'prev_x', 'prev_y')
+
+    def __init__(self, label, character_type, x, y, direction=-1):
+        self.owner = None  # 애니메이션을 따라갈 Player (None이면 상태를 바꾸지 않고 현재 애니메이션만 재생)
+        self.label = label  # 로그용 이름 (Player1, Player2)
+        self.character_type = character_type
+        self.state = 'Idle'
+        self.frame = 0
+        self.elapsed = 0  # 현재 프레임 시작 후 지난 시간 (단위)
+        self.frame_count = 0  # 현재 애니메이션 스프라이트 수 (0이면 스프라이트가 없어 진행하지 않음)
+        self.frame_units = 0  # 현재 애니메이션 프레임 간격 (단위, 0이면 진행하지 않음)
+        self.settled = True  # 이번 스텝에 연계 가능 시점을 확인할지 (애니메이션이 끝나거나 바뀐 스텝은 건너뜀)
+        self.x = x
+        self.y = y
+        self.dir = direction  # 방향 (1: 왼쪽, -1: 오른쪽)
+        # 직전 시뮬레이션 스텝의 위치 (렌더링 시 현재 위치와 보간)
+        self.prev_x, self.prev_y = x, y
+
+    def reset(self, state=None):
+        """이번 스텝부터 애니메이션을 처음부터 재생 (state를 주면 그 상태로)"""
+        if state is not None:
+            self.state = state
+        self.frame = 0
+        self.elapsed = 0
+
+    def play(self, state):
+        """프레임 경계에서 다음 애니메이션으로 - 넘친 시간은 이어감"""
+        self.state = state
+        self.frame = 0
+
+    def due(self):
+        """현재 프레임이 끝났는지 (프레임 경계를 넘었으면 넘친 시간만 남기고 True)"""
+        if self.frame_units and self.elapsed >= self.frame_units:
+            self.elapsed -= self.frame_units
+            return True
+        return False
+
+
+def advance_all(controllers, units):
+    """모든 컨트롤러의 시간을 units만큼 진행 - 프레임 경계를 넘은 컨트롤러 목록 반환 (정수 덧셈/비교만)"""
+    due = []
+    for controller in controllers:
+        if controller.frame_units:
+            controller.elapsed += units
+            if controller.elapsed >= controller.frame_units:
+                due.append(controller)
+    return due
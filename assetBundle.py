@@ -0,0 +1,252 @@
+"""
+단일 파일 에셋 번들
+Tools/bundleBuilder.py가 만든 번들 파일을 mmap으로 열고, 파일 내용을 복사 없이
+SDL_RWops로 디코더(IMG/Mix/TTF)에 넘김. 번들에 없는 파일은 개별 파일에서 읽음 (개발용)
+
+번들 형식 (리틀 엔디언):
+    헤더   : magic(4) 'P2DB', version(u16), 항목 수(u32)
+    항목들 : 이름 길이(u16), 오프셋(u64), 크기(u64), 포맷(4바이트), 이름(UTF-8)
+    데이터 : 각 파일 내용 (오프셋은 파일 처음 기준)
+이름은 프로젝트 루트 기준 '/' 구분 상대 경로, 찾을 때는 대소문자 무시
+pico2d/SDL은 디코더로 넘기는 함수 안에서만 import (번들 읽기와 assetManifest는 pico2d 없이 사용 - matchState)
+"""
+import ctypes
+import mmap
+import pathlib
+import struct
+import threading
+
+import config
+from startupProfiler import profiler
+
+BUNDLE_MAGIC = b'P2DB'
+BUNDLE_VERSION = 1
+HEADER = struct.Struct('<4sHI')
+ENTRY = struct.Struct('<HQQ4s')
+
+# 확장자 -> 포맷 태그
+FORMATS = {
+    '.png': b'png ',
+    '.jpg': b'jpg ',
+    '.jpeg': b'jpg ',
+    '.wav': b'wav ',
+    '.mp3': b'mp3 ',
+    '.ogg': b'ogg ',
+    '.ttf': b'ttf ',
+    '.json': b'json',
+}
+
+_bundle = None
+_bundle_checked = False
+_bundle_lock = threading.Lock()
+
+
+def get_bundle_path():
+    """번들 파일 경로 반환 (프로젝트 루트 기준)"""
+    return pathlib.Path.cwd() / config.ASSET_BUNDLE
+
+
+def get_format(name):
+    """파일 이름의 포맷 태그 (모르는 확장자는 'data')"""
+    return FORMATS.get(pathlib.PurePosixPath(name).suffix.lower(), b'data')
+
+
+def bundle_name(path):
+    """경로를 번들 항목 이름으로 변환 (프로젝트 루트 밖이면 None)"""
+    path = pathlib.Path(path)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(pathlib.Path.cwd())
+        except ValueError:
+            return None
+    return path.as_posix().lower()
+
+
+class AssetBundle:
+    """mmap으로 연 번들 - 항목 내용을 memoryview/SDL_RWops로 복사 없이 제공"""
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self.file = open(self.path, 'rb')
+        # 쓰기 가능한(copy-on-write) 매핑이어야 ctypes로 주소를 얻을 수 있음 - 읽기만 하므로 복사는 일어나지 않음
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.base_address = ctypes.addressof(ctypes.c_char.from_buffer(self.data))
+        self.mtime_ns = self.path.stat().st_mtime_ns
+        self.entries = {}  # 소문자 이름 -> (이름, 오프셋, 크기, 포맷)
+        self._read_index()
+
+    def _read_index(self):
+        """헤더 인덱스 읽기"""
+        magic, version, count = HEADER.unpack_from(self.data, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise IOError(f"{self.path}: not a version {BUNDLE_VERSION} asset bundle")
+        pos = HEADER.size
+        for _ in range(count):
+            name_len, offset, size, fmt = ENTRY.unpack_from(self.data, pos)
+            pos += ENTRY.size
+            name = bytes(self.data[pos:pos + name_len]).decode('utf-8')
+            pos += name_len
+            self.entries[name.lower()] = (name, offset, size, fmt)
+
+    def find(self, path):
+        """경로에 해당하는 항목 (없으면 None)"""
+        name = bundle_name(path)
+        return self.entries.get(name) if name is not None else None
+
+    def view(self, path):
+        """항목 내용의 memoryview (복사 없음)"""
+        _, offset, size, _ = self.find(path)
+        return memoryview(self.data)[offset:offset + size]
+
+    def open_rw(self, path):
+        """항목 내용을 가리키는 SDL_RWops (디코더가 freesrc로 해제)"""
+        from sdl2 import SDL_GetError, SDL_RWFromConstMem
+        _, offset, size, _ = self.find(path)
+        rw = SDL_RWFromConstMem(ctypes.c_void_p(self.base_address + offset), size)
+        if not rw:
+            raise IOError(f"cannot open {path} in bundle: {SDL_GetError().decode('utf-8', 'replace')}")
+        return rw
+
+    def list_files(self, directory, suffix=None):
+        """폴더 바로 아래 항목 이름 목록 (대소문자 무시)"""
+        prefix = bundle_name(directory).rstrip('/') + '/'
+        names = []
+        for key, (name, _, _, _) in self.entries.items():
+            if key.startswith(prefix) and '/' not in key[len(prefix):]:
+                if suffix is None or key.endswith(suffix):
+                    names.append(name)
+        return names
+
+
+def get_bundle():
+    """번들이 있으면 열어서 반환 (없거나 사용하지 않으면 None) - 처음 호출 시 한 번만 열기"""
+    global _bundle, _bundle_checked
+    if _bundle_checked:
+        return _bundle
+    with _bundle_lock:
+        if not _bundle_checked:
+            path = get_bundle_path()
+            if config.USE_ASSET_BUNDLE and path.exists():
+                try:
+                    _bundle = AssetBundle(path)
+                    print(f"Asset bundle: {path.name} ({len(_bundle.entries)} files)")
+                except (OSError, struct.error) as e:
+                    print(f"Warning: Cannot open asset bundle {path}: {e}")
+            _bundle_checked = True
+    return _bundle
+
+
+def _find(path):
+    """번들 항목 찾기 (번들이 없으면 None)"""
+    bundle = get_bundle()
+    return bundle if bundle is not None and bundle.find(path) is not None else None
+
+
+def _record_read(path):
+    """시작 프로파일러에 파일 읽기 기록"""
+    if profiler.enabled:
+        profiler.record_file(path, get_size(path))
+
+
+def open_rw(path):
+    """번들에 있으면 SDL_RWops, 없으면 None (개별 파일에서 읽어야 함)"""
+    _record_read(path)
+    bundle = _find(path)
+    return bundle.open_rw(path) if bundle else None
+
+
+def exists(path):
+    """번들 또는 개별 파일로 존재하는지 확인"""
+    return _find(path) is not None or pathlib.Path(path).exists()
+
+
+def read_bytes(path, limit=None):
+    """파일 내용 읽기 (번들 우선) - limit이 있으면 앞부분만"""
+    _record_read(path)
+    bundle = _find(path)
+    if bundle:
+        return bytes(bundle.view(path)[:limit])
+    with open(path, 'rb') as f:
+        return f.read(-1 if limit is None else limit)
+
+
+def get_size(path):
+    """파일 크기 (번들 우선, 없으면 0)"""
+    bundle = _find(path)
+    if bundle:
+        return bundle.find(path)[2]
+    try:
+        return pathlib.Path(path).stat().st_size
+    except OSError:
+        return 0
+
+
+def get_mtime_ns(path):
+    """수정 시각 - 번들에 있으면 번들 파일의 시각"""
+    bundle = _find(path)
+    if bundle:
+        return bundle.mtime_ns
+    return pathlib.Path(path).stat().st_mtime_ns
+
+
+def list_files(directory, suffix=None):
+    """번들의 폴더 항목 경로 목록 (번들에 없으면 빈 리스트)"""
+    bundle = get_bundle()
+    if bundle is None:
+        return []
+    return [pathlib.Path.cwd() / name for name in bundle.list_files(directory, suffix)]
+
+
+def load_wav(path):
+    """효과음 로딩 (번들 우선)"""
+    import pico2d
+    import renderBackend
+    from pico2d import pico2d as pico2d_core
+    from sdl2.sdlmixer import Mix_LoadWAV_RW
+    if renderBackend.headless:
+        return renderBackend.NullSound()
+    rw = open_rw(path)
+    if rw is None:
+        return pico2d.load_wav(str(path))
+    if not pico2d_core.audio_on:
+        raise IOError('audio is not available')
+    data = Mix_LoadWAV_RW(rw, 1)
+    if not data:
+        raise IOError(f"cannot load {path}")
+    return pico2d.Wav(data)
+
+
+def load_music(path):
+    """배경음악 로딩 (번들 우선, 재생 중에도 mmap 영역에서 스트리밍)"""
+    import pico2d
+    import renderBackend
+    from pico2d import pico2d as pico2d_core
+    from sdl2.sdlmixer import Mix_LoadMUS_RW
+    if renderBackend.headless:
+        return renderBackend.NullSound()
+    rw = open_rw(path)
+    if rw is None:
+        return pico2d.load_music(str(path))
+    if not pico2d_core.audio_on:
+        raise IOError('audio is not available')
+    data = Mix_LoadMUS_RW(rw, 1)
+    if not data:
+        raise IOError(f"cannot load {path}")
+    return pico2d.Music(data)
+
+
+def load_font(path, size):
+    """폰트 로딩 (번들 우선)"""
+    import pico2d
+    import renderBackend
+    from sdl2.sdlttf import TTF_OpenFontRW
+    if renderBackend.headless:
+        return renderBackend.NullFont()
+    rw = open_rw(path)
+    if rw is None:
+        return pico2d.load_font(str(path), size)
+    font = pico2d.Font.__new__(pico2d.Font)
+    font.font = TTF_OpenFontRW(rw, 1, size)
+    if not font.font:
+        raise IOError(f"cannot load {path}")
+    return font
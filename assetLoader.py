@@ -0,0 +1,157 @@
+"""
+백그라운드 에셋 로더
+PNG 디코딩(및 최종 크기 리샘플링)은 스레드 풀에서 RGBA 서피스로 수행하고,
+텍스처 업로드와 폰트/음악 로딩은 메인 스레드에서 프레임당 정해진 시간 안에서만 처리
+"""
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import config
+from imageScaler import load_surface, upload_surface
+from resourceCache import estimate_image_bytes, make_key, resources
+
+
+class AssetLoader:
+    """디코딩 스레드 풀 + 메인 스레드 업로드 예산 관리
+
+    max_workers=0 이면 요청 즉시 동기 로딩 (툴/테스트용)
+    """
+
+    def __init__(self, max_workers=4, upload_budget=None):
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='asset-decode') if max_workers > 0 else None
+        # 프레임당 업로드/메인 스레드 작업에 쓸 수 있는 최대 시간 (초)
+        self.upload_budget = config.ASSET_UPLOAD_BUDGET if upload_budget is None else upload_budget
+        self.completed = queue.Queue()  # 디코딩 완료된 (요청, 서피스 또는 예외)
+        self.main_thread_jobs = deque()  # 폰트/음악 등 메인 스레드에서만 가능한 로딩
+        self.group_futures = {}  # 그룹 이름 -> 디코딩 future 리스트
+        self.in_flight = {}  # 캐시 키 -> (future, 대기 중인 (on_loaded, on_error, owner) 리스트)
+        self.pending_count = 0
+
+    def request_image(self, path, on_loaded, on_error=None, group=None, owner=None, size=None):
+        """이미지 비동기 로딩 요청 - 업로드가 끝나면 메인 스레드에서 on_loaded(image) 호출
+
+        리소스 캐시에 있으면 바로 on_loaded 호출, 같은 파일을 디코딩 중이면 그 결과를 공유
+        owner는 리소스 캐시 참조 소유자 (resources.release(owner)로 해제)
+        size는 화면에 그릴 최종 크기 (배율 또는 (너비, 높이)) - 워커 스레드에서 미리 리샘플링
+        """
+        key = make_key('image', path, size)
+        cached = resources.lookup(key, owner)
+        if cached is not None:
+            on_loaded(cached)
+            return
+
+        waiter = (on_loaded, on_error, owner)
+        if key in self.in_flight:
+            future, waiters = self.in_flight[key]
+            waiters.append(waiter)
+        else:
+            request = (path, key, size)
+            self.in_flight[key] = (None, [waiter])
+            if self.executor is None:
+                self._finish(request, self._decode_safely(path, size))
+                return
+            self.pending_count += 1
+            future = self.executor.submit(self._decode_into_queue, request)
+            self.in_flight[key] = (future, [waiter])
+
+        if group is not None:
+            self.group_futures.setdefault(group, []).append(future)
+
+    def defer(self, job):
+        """메인 스레드 작업 예약 (pump에서 예산 안에서 실행)"""
+        if self.executor is None:
+            job()
+        else:
+            self.main_thread_jobs.append(job)
+
+    def pump(self, budget=None):
+        """완료된 디코딩 결과 업로드 및 예약 작업 실행 - budget(초)을 넘기면 다음 프레임으로"""
+        budget = self.upload_budget if budget is None else budget
+        deadline = time.perf_counter() + budget
+
+        # 업로드 우선 (스레드가 이미 디코딩을 끝낸 결과)
+        while time.perf_counter() < deadline:
+            try:
+                request, result = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            self.pending_count -= 1
+            self._finish(request, result)
+
+        while self.main_thread_jobs and time.perf_counter() < deadline:
+            job = self.main_thread_jobs.popleft()
+            try:
+                job()
+            except Exception as e:
+                print(f"Warning: Deferred asset job failed: {e}")
+
+        # 디코딩이 모두 끝난 그룹 정리
+        for group in [g for g, futures in self.group_futures.items() if all(f.done() for f in futures)]:
+            del self.group_futures[group]
+
+    def wait(self, group):
+        """그룹의 디코딩이 끝날 때까지 기다리고 바로 업로드 (즉시 필요한 에셋용)"""
+        futures = self.group_futures.pop(group, [])
+        wait(futures)
+        # 디코딩이 끝난 결과는 이미 큐에 들어있으므로 모두 업로드
+        self.pump(budget=float('inf'))
+
+    def finish_all(self):
+        """남은 요청을 모두 처리 (프로파일링/종료 전 정리용)"""
+        for group in list(self.group_futures):
+            self.wait(group)
+        while self.pending_count > 0 or self.main_thread_jobs:
+            self.pump(budget=float('inf'))
+            if self.pending_count > 0:
+                time.sleep(0.001)
+
+    def is_idle(self):
+        """처리할 요청이 없는지 확인"""
+        return self.pending_count == 0 and not self.main_thread_jobs
+
+    def shutdown(self):
+        """스레드 풀 종료"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def _decode_into_queue(self, request):
+        """워커 스레드 작업 - future가 끝나기 전에 결과를 큐에 넣어 wait() 직후 업로드 가능"""
+        path, _, size = request
+        self.completed.put((request, self._decode_safely(path, size)))
+
+    def _decode_safely(self, path, size=None):
+        """디코딩 예외를 결과로 전달 (워커 스레드에서 예외가 사라지지 않도록)"""
+        try:
+            return load_surface(path, size)
+        except Exception as e:
+            return e
+
+    def _finish(self, request, result):
+        """업로드 후 리소스 캐시에 등록하고 대기 중인 콜백 모두 호출"""
+        path, key, _ = request
+        _, waiters = self.in_flight.pop(key)
+        try:
+            if isinstance(result, Exception):
+                raise result
+            image = upload_surface(result)
+        except Exception as e:
+            for _, on_error, _ in waiters:
+                if on_error:
+                    on_error(e)
+                else:
+                    print(f"Warning: Asset loading failed: {path}: {e}")
+            return
+
+        for n, (on_loaded, _, owner) in enumerate(waiters):
+            if n == 0:
+                resources.insert(key, image, estimate_image_bytes(image), owner)
+            else:
+                resources.lookup(key, owner)
+            on_loaded(image)
+
+
+# 로더 없이 호출된 경우에 쓰는 동기 로더 (기존 동작과 동일하게 즉시 로딩)
+immediate_loader = AssetLoader(max_workers=0)
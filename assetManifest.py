@@ -0,0 +1,284 @@
+"""
+캐릭터 에셋 매니페스트
+Resources/Character를 한 번 스캔해 상태별 프레임 파일 목록을 만들고,
+폴더 수정 시각과 함께 디스크에 캐시해 다음 실행부터는 폴더 탐색을 건너뜀
+
+- 폴더 이름은 대소문자를 무시하고 찾음 ('Thief'/'thief', 'fastmiddleATK'/'fastMiddleATK')
+- 'Character'와 'character'처럼 대소문자만 다른 폴더에 프레임이 나뉘어 있어도 합쳐서 사용
+- 프레임이 빠진 애니메이션은 해당 애니메이션만 오류로 기록하고 나머지는 그대로 사용
+
+실행 (프로젝트 루트에서, 매니페스트 재생성 및 검증 결과 출력):
+    python assetManifest.py
+"""
+import hashlib
+import json
+import pathlib
+
+import assetBundle
+from startupProfiler import profiler
+
+MANIFEST_VERSION = 1
+
+# 캐릭터별 리소스 폴더 이름 (Resources/Character 아래, 대소문자 무시)
+CHARACTER_DIRS = {
+    'priest': 'priest',
+    'thief': 'Thief',
+    'fighter': 'fighter'
+}
+
+# 캐릭터별 애니메이션 정의: 상태 이름 -> (폴더 이름, 시작 프레임, 프레임 수)
+# 프레임 수가 None이면 같은 폴더의 다음 구간 시작(없으면 폴더의 마지막 프레임)까지 사용
+# 개별 파일 로딩과 아틀라스 빌더(Tools/atlasBuilder.py)가 같은 정의를 사용
+ANIMATION_SPECS = {
+    'priest': {
+        'Idle': ('idle', 0, None),
+        'Walk': ('walk', 0, None),
+        'BackWalk': ('BackWalk', 0, None),
+        'fastMiddleATK': ('fastMiddleATK', 0, None),
+        'strongMiddleATK': ('strongMiddleATK', 0, None),
+        'strongMiddleATK2': ('strongMiddleATK', 6, None),
+        'strongUpperATK': ('strongUpperATK', 0, 12),  # 폴더에는 13장, 마지막 장은 사용하지 않음
+        'strongLowerATK': ('strongLowerATK', 0, None),
+        'hit': ('hit', 0, None),
+        'guard': ('guard', 0, None),
+    },
+    'thief': {
+        'Idle': ('idle', 0, None),
+        'Walk': ('walk', 0, None),
+        'BackWalk': ('BackWalk', 0, None),
+        'fastMiddleATK': ('fastMiddleATK', 0, None),
+        'fastMiddleATK2': ('fastMiddleATK', 6, None),
+        'fastMiddleATK3': ('fastMiddleATK', 12, None),
+        'strongMiddleATK': ('strongMiddleATK', 0, None),
+        'strongMiddleATK2': ('strongMiddleATK', 5, None),
+        'strongUpperATK': ('strongUpperATK', 0, None),
+        'strongUpperATK2': ('strongUpperATK', 5, None),
+        'strongLowerATK': ('strongLowerATK', 0, None),
+        'hit': ('hit', 0, None),
+        'guard': ('Guard', 0, None),
+    },
+    'fighter': {
+        'Idle': ('idle', 0, None),
+        'Walk': ('walk', 0, None),
+        'BackWalk': ('BackWalk', 0, None),
+        'fastMiddleATK': ('fastMiddleATK', 0, None),
+        'fastMiddleATK2': ('fastMiddleATK', 4, None),
+        'fastMiddleATK3': ('fastMiddleATK', 7, None),
+        'strongMiddleATK': ('strongMiddleATK', 0, None),
+        'strongLowerATK': ('strongLowerATK', 0, None),
+        'strongUpperATK': ('strongUpperATK', 0, None),
+        'strongUpperATK2': ('strongUpperATK', 4, None),
+        'fastLowerATK': ('fastLowerATK', 0, None),
+        'fastUpperATK': ('fastUpperATK', 0, None),
+        'hit': ('hit', 0, None),
+        'guard': ('Guard', 0, None),
+    },
+}
+
+_manifest = None  # 프로세스 내 캐시 (get_manifest)
+
+
+def get_resources_dir():
+    """Resources 폴더 경로 반환"""
+    return pathlib.Path.cwd() / 'Resources'
+
+
+def get_manifest_path():
+    """매니페스트 캐시 파일 경로 반환"""
+    return get_resources_dir() / '.assetManifest.json'
+
+
+def find_dirs(base, *parts):
+    """대소문자를 무시하고 경로를 찾아 일치하는 폴더를 모두 반환 (중간 폴더 포함 목록도 함께)
+
+    Returns: (matches, visited) - visited는 탐색한 모든 폴더 (캐시 검증용)
+    """
+    candidates = [base]
+    visited = [base]
+    for part in parts:
+        next_candidates = []
+        for path in candidates:
+            if path.is_dir():
+                next_candidates.extend(p for p in sorted(path.iterdir())
+                                       if p.is_dir() and p.name.lower() == part.lower())
+        candidates = next_candidates
+        visited.extend(candidates)
+    return candidates, visited
+
+
+def scan_frames(dirs):
+    """폴더들의 '<번호>.png' 파일을 프레임 번호 -> 경로로 수집 (같은 번호는 앞 폴더 우선)"""
+    frames = {}
+    for directory in dirs:
+        for path in sorted(directory.iterdir()):
+            if path.suffix.lower() == '.png' and path.stem.isdigit():
+                frames.setdefault(int(path.stem), path)
+    return frames
+
+
+def _spec_key():
+    """애니메이션 정의 해시 - 정의가 바뀌면 캐시 무효화"""
+    text = json.dumps({'dirs': CHARACTER_DIRS, 'specs': ANIMATION_SPECS}, sort_keys=True)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _segment_ends(animations, frames_by_folder):
+    """프레임 수가 없는 구간의 끝 프레임 계산 - 같은 폴더의 다음 구간 시작 또는 폴더 끝"""
+    ends = {}
+    for state, (folder, start, count) in animations.items():
+        if count is not None:
+            ends[state] = start + count
+            continue
+        later_starts = [s for f, s, _ in animations.values() if f.lower() == folder.lower() and s > start]
+        frames = frames_by_folder[folder.lower()]
+        ends[state] = min(later_starts) if later_starts else (max(frames) + 1 if frames else start)
+    return ends
+
+
+def build_manifest():
+    """Resources/Character를 스캔해 매니페스트 생성
+
+    구조: {'version', 'spec_key', 'dirs': {폴더: mtime_ns},
+           'characters': {캐릭터: {'animations': {상태: [경로]}, 'errors': {상태: 메시지}}}}
+    경로는 Resources 기준 상대 경로
+    """
+    resources = get_resources_dir()
+    scanned = {}
+    characters = {}
+
+    for character_type, animations in ANIMATION_SPECS.items():
+        char_dirs, visited = find_dirs(resources, 'Character', CHARACTER_DIRS[character_type])
+        scanned.update((p, None) for p in visited)
+
+        frames_by_folder = {}
+        for folder, _, _ in animations.values():
+            if folder.lower() in frames_by_folder:
+                continue
+            folder_dirs = [p for d in char_dirs for p in d.iterdir()
+                           if p.is_dir() and p.name.lower() == folder.lower()]
+            scanned.update((p, None) for p in folder_dirs)
+            frames_by_folder[folder.lower()] = scan_frames(folder_dirs)
+
+        entry = {'animations': {}, 'errors': {}}
+        ends = _segment_ends(animations, frames_by_folder)
+        for state, (folder, start, _) in animations.items():
+            frames = frames_by_folder[folder.lower()]
+            missing = [i for i in range(start, ends[state]) if i not in frames]
+            if not frames:
+                entry['errors'][state] = f"folder '{folder}' not found"
+            elif ends[state] <= start:
+                entry['errors'][state] = f"no frames from {start} in '{folder}'"
+            elif missing:
+                entry['errors'][state] = f"missing frames {missing} in '{folder}'"
+            else:
+                entry['animations'][state] = [frames[i].relative_to(resources).as_posix()
+                                              for i in range(start, ends[state])]
+        characters[character_type] = entry
+
+    return {
+        'version': MANIFEST_VERSION,
+        'spec_key': _spec_key(),
+        'dirs': {p.relative_to(resources).as_posix() if p != resources else '.': p.stat().st_mtime_ns
+                 for p in scanned},
+        'characters': characters,
+    }
+
+
+def is_manifest_current(manifest):
+    """캐시된 매니페스트가 현재 디스크 상태와 정의에 맞는지 확인 (폴더 mtime 비교)"""
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('spec_key') != _spec_key():
+        return False
+    resources = get_resources_dir()
+    try:
+        return all((resources / rel).stat().st_mtime_ns == mtime for rel, mtime in manifest['dirs'].items())
+    except (OSError, KeyError):
+        return False
+
+
+def is_bundle_manifest_current(manifest, bundle):
+    """번들에 넣은 매니페스트를 그대로 써도 되는지 - 번들을 만든 뒤 개별 폴더가 바뀌었으면 False
+
+    폴더 mtime이 번들을 만들 때 기록한 값과 다르고 번들 파일보다 새로우면 바뀐 것으로 봄
+    (개별 폴더가 없으면 번들만 배포한 경우 - 번들 매니페스트 사용)
+    """
+    resources = get_resources_dir()
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('spec_key') != _spec_key():
+        # 애니메이션 정의가 바뀌었으면 개별 폴더가 있을 때만 다시 스캔
+        return not find_dirs(resources, 'Character')[0]
+    for rel, mtime in manifest.get('dirs', {}).items():
+        try:
+            current = (resources / rel).stat().st_mtime_ns
+        except OSError:
+            continue
+        if current != mtime and current > bundle.mtime_ns:
+            return False
+    return True
+
+
+def load_manifest(rebuild=False):
+    """디스크 캐시에서 매니페스트를 읽고, 없거나 오래됐으면 다시 스캔해 저장
+
+    에셋 번들이 있으면 번들을 만들 때 함께 저장한 매니페스트를 사용
+    (번들을 만든 뒤 개별 폴더가 바뀌었으면 개별 폴더 기준 매니페스트 - is_bundle_manifest_current)
+    """
+    path = get_manifest_path()
+    bundle = assetBundle.get_bundle()
+    if not rebuild and bundle is not None and bundle.find(path) is not None:
+        manifest = json.loads(assetBundle.read_bytes(path).decode('utf-8'))
+        if is_bundle_manifest_current(manifest, bundle):
+            return manifest
+        print("Asset bundle manifest is older than Resources/Character, using the loose files "
+              "(rebuild with python -m Tools.bundleBuilder)")
+
+    if not rebuild and path.exists():
+        try:
+            profiler.record_file(path, path.stat().st_size)
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if is_manifest_current(manifest):
+                return manifest
+        except (OSError, ValueError):
+            pass
+
+    with profiler.section('assetManifest.build_manifest'):
+        manifest = build_manifest()
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+    except OSError as e:
+        print(f"Warning: Cannot write asset manifest cache: {e}")
+    report_errors(manifest)
+    return manifest
+
+
+def get_manifest():
+    """프로세스 내에서 한 번만 읽은 매니페스트 반환"""
+    global _manifest
+    if _manifest is None:
+        _manifest = load_manifest()
+    return _manifest
+
+
+def get_frame_paths(character_type):
+    """캐릭터의 상태별 프레임 파일 절대 경로 목록 (검증에 실패한 애니메이션은 제외)"""
+    resources = get_resources_dir()
+    entry = get_manifest()['characters'].get(character_type, {})
+    return {
+        state: [resources / rel for rel in paths]
+        for state, paths in entry.get('animations', {}).items()
+    }
+
+
+def report_errors(manifest):
+    """애니메이션별 검증 오류 출력"""
+    for character_type, entry in manifest['characters'].items():
+        for state, message in entry['errors'].items():
+            print(f"Warning: {character_type}/{state}: {message}")
+
+
+if __name__ == '__main__':
+    result = load_manifest(rebuild=True)
+    for name, character in result['characters'].items():
+        frame_count = sum(len(paths) for paths in character['animations'].values())
+        print(f"{name}: {len(character['animations'])} animations, {frame_count} frames, "
+              f"{len(character['errors'])} errors")
@@ -42,6 +42,47 @@ GROUND_Y = 300 * 1.5  # 그라운드 Y 좌표 (450픽셀) - 1.5배 스케일링
 FAST_FRAME_TIME = 0.08  # 0.8초 -> 0.08초로 수정
 STRONG_FRAME_TIME = 0.13  # 0.13초 유지
 
+# 공격 데미지/범위 (Game.calculate_damage, Player.get_attack_range_bb, matchState가 함께 사용)
+FAST_DAMAGE = 10
+STRONG_DAMAGE = 20
+RAGE_DAMAGE = 30
+FAST_ATTACK_RANGE = 70  # 픽셀 (바운딩 박스 앞쪽 끝부터)
+STRONG_ATTACK_RANGE = 100
+RAGE_ATTACK_RANGE = 70
+PRIEST_STRONG_UPPER_RANGE = 200  # priest의 상단 강공격만 특별히 넓음
+
 # 디버그 설정
 SHOW_BOUNDING_BOX = False  # 바운딩 박스 표시 여부 (F1 키로 토글)
 
+
+# 스프라이트 아틀라스 사용 여부 (Tools/atlasBuilder.py로 Resources/Atlas 생성 필요, 없으면 개별 파일 로딩)
+USE_SPRITE_ATLAS = True
+
+# 왼쪽을 바라보는 스프라이트를 로딩 시 미리 반전해 두고 사용 (텍스처 메모리 2배, 매 프레임 반전 그리기 생략)
+USE_MIRRORED_SPRITES = True
+
+# 스프라이트/배경을 로딩 시 화면에 그릴 크기로 미리 리샘플링 (Resources/.scaled에 캐시, 렌더링은 1:1 복사)
+BAKE_DISPLAY_SCALE = True
+
+# 단일 파일 에셋 번들 (Tools/bundleBuilder.py로 생성, 없거나 번들에 없는 파일은 개별 파일에서 로딩)
+USE_ASSET_BUNDLE = True
+ASSET_BUNDLE = 'Resources.bundle'
+
+# 프레임 페이싱 (framePacer.py)
+TARGET_FPS = 60  # 목표 렌더 fps (60/120/144, 0이면 제한 없음) - 시뮬레이션은 항상 60Hz
+FRAME_SPIN_MARGIN = 0.002  # 프레임 마감 전 이 시간(초)부터는 sleep 대신 spin으로 대기
+FRAME_STATS_WINDOW = 600  # 프레임 시간 백분위수를 계산할 최근 프레임 수
+
+# 백그라운드 에셋 로딩 (assetLoader.py)
+ASSET_DECODE_WORKERS = 4  # PNG 디코딩 스레드 수
+ASSET_UPLOAD_BUDGET = 0.004  # 프레임당 텍스처 업로드/폰트·음악 로딩에 쓰는 최대 시간 (초)
+
+# 대전 입력 리플레이 (inputReplay.py) - 매치마다 REPLAY_DIR에 .rpl 파일 저장
+RECORD_REPLAYS = True
+REPLAY_DIR = 'Replays'
+REPLAY_KEYFRAME_INTERVAL = 1800  # 대전 상태 키프레임 간격 (스텝, 30초) - 탐색 시 최대 이만큼 다시 시뮬레이션 (최대 속도로 0.1초 미만)
+
+# 롤백 넷플레이 (rollbackNet.py) - 두 쪽이 각자 시뮬레이션하고 상대 입력은 예측, 다르면 되감아 다시 시뮬레이션
+NET_INPUT_DELAY = 2  # 로컬 입력을 이만큼 뒤 프레임에 적용 (되감기 빈도/깊이를 줄임)
+NET_MAX_PREDICTION = 8  # 상대 입력 없이 앞서 나갈 수 있는 최대 프레임 수 (넘으면 대기)
+NET_CHECKPOINT_INTERVAL = 60  # 확정 상태 해시를 상대와 비교하는 간격 (프레임)
@@ -0,0 +1,176 @@
+"""
+캐릭터별 공격 프레임 데이터
+공격마다 발생(startup) / 판정(active) / 후딜(recovery) 프레임 수와 판정 프레임별 공격 범위(히트박스)를 정해 두고,
+시작할 때 (캐릭터, 기술 ID, 프레임) 하나로 바로 찾는 평평한 표로 만들어 둠 (타격 판정은 표 조회 한 번)
+
+- 1프레임 = 시뮬레이션 1스텝 (60Hz), 공격 상태가 된 뒤 애니메이션이 진행된 스텝 수를 1부터 셈 (Player.move_frame)
+  startup 프레임이 지난 뒤 active 프레임 동안만 can_process_hit가 켜짐
+- recovery는 판정이 끝난 뒤 애니메이션이 끝날 때까지의 프레임 수 (공격이 끝나는 시점과 연계는 여전히 애니메이션이 정함)
+- 지금 값은 예전 규칙(스프라이트 프레임 수의 중앙 ±1 프레임, config의 프레임 간격)과 같은 스텝에 판정이 켜지도록 맞춘 값
+  스프라이트 프레임 수를 바꿔도 판정 시점은 그대로 - 바꾸려면 여기 값을 고침
+- 값은 REFERENCE_FRAME_TIMES의 프레임 간격 기준 - config의 FAST/STRONG_FRAME_TIME이 다르면 build()가 같은 비율로 늘이거나 줄임
+  (판정 시점이 애니메이션 속도를 따라감, 기본 config에서는 적어 둔 값 그대로)
+- 히트박스는 바운딩 박스 앞쪽 끝에서 offset만큼 떨어진 곳부터 reach 폭, 아래쪽 끝은 bottom (None이면 바운딩 박스 아래쪽 끝)
+  HITBOXES에 없는 공격은 모든 판정 프레임에 기술 기본 범위 (moveRegistry의 사거리, Lower 공격은 바닥 근처까지)
+- 기본 범위가 config 값을 쓰므로 실행 중에 config를 바꾸면 moveRegistry.rebuild() 다음에 build()를 불러야 함
+
+확인 (프로젝트 루트에서, 프레임 데이터 길이와 애니메이션 길이 비교):
+    python frameData.py
+"""
+import collections
+
+import config
+import moveRegistry
+
+# 캐릭터 -> 공격 -> (startup, active, recovery)
+FRAME_DATA = {
+    'priest': {
+        'fastMiddleATK': (14, 14, 1),
+        'strongMiddleATK': (23, 23, 1),
+        'strongMiddleATK2': (31, 23, 9),
+        'strongUpperATK': (46, 24, 24),
+        'strongLowerATK': (31, 23, 17),
+    },
+    'thief': {
+        'fastMiddleATK': (14, 14, 1),
+        'fastMiddleATK2': (14, 14, 1),
+        'fastMiddleATK3': (14, 14, 1),
+        'strongMiddleATK': (15, 24, 0),
+        'strongMiddleATK2': (15, 24, 0),
+        'strongUpperATK': (15, 24, 0),
+        'strongUpperATK2': (15, 24, 0),
+        'strongLowerATK': (15, 17, 0),
+    },
+    'fighter': {
+        'fastMiddleATK': (9, 11, 0),
+        'fastMiddleATK2': (4, 11, 0),
+        'fastMiddleATK3': (4, 11, 0),
+        'fastUpperATK': (14, 14, 1),
+        'fastLowerATK': (9, 11, 0),
+        'strongMiddleATK': (15, 24, 0),
+        'strongUpperATK': (15, 17, 0),
+        'strongUpperATK2': (15, 17, 0),
+        'strongLowerATK': (15, 24, 0),
+    },
+}
+
+# FRAME_DATA를 맞춘 공격 세기별 고정 프레임 간격 (초) - config 기본값
+REFERENCE_FRAME_TIMES = {'fast': 0.08, 'strong': 0.13}
+
+LOW_HITBOX_BOTTOM = config.GROUND_Y - 100  # Lower 공격 히트박스 아래쪽 끝 (다운된 상대 타격용)
+
+# 판정 프레임 하나의 공격 범위
+Hitbox = collections.namedtuple('Hitbox', ('offset', 'reach', 'bottom'))
+
+# 캐릭터 -> 공격 -> 판정 프레임마다 Hitbox (active 프레임 수만큼, 없으면 기본 범위)
+# 예: 'fighter': {'fastUpperATK': (Hitbox(0, 40, None),) * 4 + (Hitbox(0, 70, None),) * 10}
+HITBOXES = {}
+
+_table = ()  # (캐릭터, 기술 ID, 프레임) -> Hitbox 또는 None
+_offsets = {}  # 캐릭터 -> _table에서 그 캐릭터 구간 시작 위치
+_move_count = 0  # 표에 들어 있는 기술 ID 수
+_stride = 1  # 기술 하나의 프레임 칸 수 (가장 긴 공격 + 1)
+
+
+def default_hitbox(character, move):
+    """기술 기본 범위 (moveRegistry 사거리, 범위가 없는 기술이면 None)"""
+    reach = move.character_reach.get(character, move.reach)
+    if reach == 0:
+        return None
+    return Hitbox(0, reach, LOW_HITBOX_BOTTOM if move.reach_extends_down else None)
+
+
+def frames(character, name):
+    """현재 프레임 간격에 맞춘 (startup, active, recovery) - 구간 경계를 비율대로 옮겨 반올림 (active는 최소 1)"""
+    startup, active, recovery = FRAME_DATA[character][name]
+    move = moveRegistry.lookup(name)
+    reference = REFERENCE_FRAME_TIMES.get(move.strength)
+    if move.frame_time is None or reference is None or move.frame_time == reference:
+        return startup, active, recovery
+    ratio = move.frame_time / reference
+    start = round(startup * ratio)
+    end = max(start + 1, round((startup + active) * ratio))
+    total = max(end, round((startup + active + recovery) * ratio))
+    return start, end - start, total - end
+
+
+def build():
+    """FRAME_DATA/HITBOXES -> 조회 표 (시작할 때 한 번, config를 바꾼 뒤 다시)"""
+    global _table, _offsets, _move_count, _stride
+    move_count = len(moveRegistry.MOVES)
+    scaled = {character: {name: frames(character, name) for name in moves} for character, moves in FRAME_DATA.items()}
+    stride = 1 + max(sum(move_frames) for moves in scaled.values() for move_frames in moves.values())
+    table = []
+    offsets = {}
+    for character, moves in FRAME_DATA.items():
+        offsets[character] = len(table)
+        rows = [None] * (move_count * stride)
+        for name, (_, authored_active, _) in moves.items():
+            move = moveRegistry.lookup(name)
+            if move.id >= move_count:
+                raise ValueError(f"{character}: {name} is not a registered move")
+            startup, active, _ = scaled[character][name]
+            boxes = HITBOXES.get(character, {}).get(name)
+            if boxes is None:
+                boxes = (default_hitbox(character, move),) * active
+            elif len(boxes) != authored_active:
+                raise ValueError(f"{character}: {name} has {len(boxes)} hitboxes for {authored_active} active frames")
+            elif active != authored_active:
+                # 프레임 간격을 바꿨으면 판정 프레임별 히트박스도 같은 비율로 늘이거나 줄임
+                boxes = tuple(boxes[i * authored_active // active] for i in range(active))
+            start = move.id * stride + startup + 1
+            rows[start:start + active] = boxes
+        table.extend(rows)
+    _table, _offsets, _move_count, _stride = tuple(table), offsets, move_count, stride
+
+
+def max_move_frames():
+    """가장 긴 공격의 프레임 수 (현재 프레임 간격 기준, 이보다 뒤 프레임은 판정 없음)"""
+    return _stride - 1
+
+
+def hitbox(character, move_id, frame):
+    """공격 시작 후 frame번째 스텝(1부터)의 히트박스 - 판정 프레임이 아니면 None"""
+    if move_id < _move_count and 0 < frame < _stride:
+        offset = _offsets.get(character)
+        if offset is not None:
+            return _table[offset + move_id * _stride + frame]
+    return None
+
+
+def attack_box(box, bb, facing_right):
+    """히트박스 + 공격자 바운딩 박스 -> 공격 범위 (x1, y1, x2, y2)"""
+    bottom = bb[1] if box.bottom is None else box.bottom
+    if facing_right:
+        front = bb[2] + box.offset
+        return front, bottom, front + box.reach, bb[3]
+    front = bb[0] - box.offset
+    return front - box.reach, bottom, front, bb[3]
+
+
+build()
+
+
+if __name__ == '__main__':
+    import matchState
+
+    # 애니메이션이 끝나는 스텝 (SpriteManager와 같은 정수 시간 단위)
+    print(f"{'character':<10}{'move':<18}{'startup':>8}{'active':>8}{'recovery':>9}{'total':>7}{'animation':>10}")
+    for character, moves in FRAME_DATA.items():
+        for name in moves:
+            move_frames = frames(character, name)
+            count = matchState.FRAME_COUNTS[character].get(name, 0)
+            animation = 0
+            if count:
+                frame_units = matchState._frame_units(name, count)
+                elapsed, ticks = 0, 0
+                while ticks < count:
+                    animation += 1
+                    elapsed += matchState.STEP_UNITS
+                    if elapsed >= frame_units:
+                        elapsed -= frame_units
+                        ticks += 1
+            mark = '' if animation == sum(move_frames) else '  <- differs'
+            startup, active, recovery = move_frames
+            print(f"{character:<10}{name:<18}{startup:>8}{active:>8}{recovery:>9}{sum(move_frames):>7}"
+                  f"{animation:>10}{mark}")
@@ -0,0 +1,90 @@
+"""
+프레임 페이서
+perf_counter 기준 마감 시각까지 대기해 목표 fps로 프레임 간격을 맞추고,
+최근 프레임 시간의 p50/p95/p99와 드롭 프레임 수를 집계
+
+- time.sleep은 OS 타이머 해상도만큼 늦게 깨어나므로, 마감 직전(spin_margin)까지만 자고
+  남은 시간은 perf_counter를 확인하며 기다림 (sleep 후 spin)
+- 마감 시각은 이전 마감 + 프레임 간격으로 잡아 대기 오차가 누적되지 않음
+"""
+import collections
+import time
+
+
+class FramePacer:
+    """목표 fps 프레임 간격 유지 + 프레임 시간 통계"""
+
+    def __init__(self, target_fps=60, spin_margin=0.002, window=600):
+        self.spin_margin = spin_margin  # 마감 전 이 시간(초)부터는 sleep 대신 spin
+        self.frame_times = collections.deque(maxlen=window)  # 최근 프레임 시간 (초)
+        self.frame_count = 0
+        self.dropped_frames = 0
+        self.last_time = None
+        self.next_deadline = None
+        self.set_target_fps(target_fps)
+
+    def set_target_fps(self, target_fps):
+        """목표 fps 변경 (0 또는 None이면 제한 없음)"""
+        self.target_fps = target_fps or 0
+        self.frame_interval = 1.0 / self.target_fps if self.target_fps else 0.0
+        self.next_deadline = None
+
+    def wait(self):
+        """다음 프레임 시작 시각까지 대기하고 직전 프레임부터 흐른 시간(초) 반환"""
+        now = time.perf_counter()
+        if self.frame_interval and self.next_deadline is not None:
+            remaining = self.next_deadline - now
+            if remaining > self.spin_margin:
+                time.sleep(remaining - self.spin_margin)
+            while time.perf_counter() < self.next_deadline:
+                pass
+            now = time.perf_counter()
+
+        if self.frame_interval:
+            if self.next_deadline is None or now - self.next_deadline > self.frame_interval:
+                # 처음이거나 한 프레임 넘게 밀렸으면 지금 기준으로 다시 맞춤 (몰아서 빨리 그리지 않도록)
+                self.next_deadline = now + self.frame_interval
+            else:
+                self.next_deadline += self.frame_interval
+
+        delta = now - self.last_time if self.last_time is not None else self.frame_interval
+        self.last_time = now
+        self._record(delta)
+        return delta
+
+    def _record(self, delta):
+        """프레임 시간 기록 - 목표 간격의 1.5배를 넘으면 드롭 프레임으로 집계"""
+        self.frame_count += 1
+        self.frame_times.append(delta)
+        if self.frame_interval and delta > self.frame_interval * 1.5:
+            self.dropped_frames += 1
+
+    def percentiles(self, *points):
+        """최근 프레임 시간 백분위수 (초) - 예: percentiles(50, 95, 99)"""
+        if not self.frame_times:
+            return [0.0 for _ in points]
+        ordered = sorted(self.frame_times)
+        last = len(ordered) - 1
+        return [ordered[min(last, int(round(p / 100 * last)))] for p in points]
+
+    def stats(self):
+        """프레임 시간 통계 (밀리초)"""
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        average = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        return {
+            'target_fps': self.target_fps,
+            'frames': self.frame_count,
+            'dropped_frames': self.dropped_frames,
+            'fps': 1.0 / average if average else 0.0,
+            'p50_ms': p50 * 1000,
+            'p95_ms': p95 * 1000,
+            'p99_ms': p99 * 1000,
+        }
+
+    def report(self):
+        """통계 출력"""
+        s = self.stats()
+        target = f"{s['target_fps']} fps" if s['target_fps'] else 'uncapped'
+        print(f"Frame pacing ({target}): {s['frames']} frames, {s['fps']:.1f} fps, "
+              f"p50 {s['p50_ms']:.2f} / p95 {s['p95_ms']:.2f} / p99 {s['p99_ms']:.2f} ms, "
+              f"{s['dropped_frames']} dropped")
@@ -1,12 +1,20 @@
 import pico2d
 import config
-import time
+import gameSnapshot
+import inputReplay
+import moveRegistry
+import playerStateMachine
+import renderBackend
 
 from Scenes.sceneManager import SceneManager
 from Player.player import Player
 from ioManager import IOManager
 from spriteManager import SpriteManager
 from handle_collision import CollisionHandler
+from assetLoader import AssetLoader
+from framePacer import FramePacer
+from resourceCache import resources
+from startupProfiler import profiler
 
 
 class Game:
@@ -18,37 +26,49 @@ class Game:
         self.playerRight = Player('right')
         self.ioManager = IOManager()
         self.spriteManager = SpriteManager()
-        self.last_time = 0
-        self.target_fps = 60  # 60fps로 조정
-        self.frame_time = 1.0 / self.target_fps
+        self.assetLoader = AssetLoader(config.ASSET_DECODE_WORKERS)  # 백그라운드 이미지 디코딩
+        # 렌더 프레임 간격 유지 및 프레임 시간 통계 (config.TARGET_FPS, 0이면 제한 없음)
+        self.pacer = FramePacer(config.TARGET_FPS, config.FRAME_SPIN_MARGIN, config.FRAME_STATS_WINDOW)
         self.game_over = False
-        self.max_delta_time = 1.0 / 30.0  # 최대 deltaTime 제한 (30fps 이하로 떨어지지 않도록)
+        # 고정 60Hz 시뮬레이션 - 렌더링 속도와 관계없이 항상 같은 deltaTime으로 업데이트
+        self.sim_dt = 1.0 / 60.0
+        self.accumulator = 0.0  # 아직 시뮬레이션하지 않은 누적 시간
+        # 렌더 프레임당 최대 따라잡기 스텝 수 - 이보다 느린 환경에서만 게임이 느려짐 (12fps 미만)
+        self.max_steps_per_frame = 5
         self.round_end_timer = 0.0  # 라운드 종료 타이머 추가
+        self.round_start = None  # 매치 시작 시 플레이어/캐릭터/스프라이트 상태 (gameSnapshot.save) - 라운드 리셋 시 복원
+        # 대전 입력 리플레이 기록 (config.RECORD_REPLAYS), 재생 중에는 ReplayPlayer
+        self.replay_recorder = inputReplay.ReplayRecorder() if config.RECORD_REPLAYS else None
+        self.replay_player = None
+        self.net_session = None  # 롤백 넷플레이 (rollbackNet.RollbackSession)
 
     def initialize(self):
-        pico2d.open_canvas(config.windowWidth, config.windowHeight)
-        self.sceneManager.initialize()
-        self.playerLeft.initialize()
-        self.playerRight.initialize()
+        with profiler.section('open_canvas'):
+            renderBackend.open_canvas(config.windowWidth, config.windowHeight)
+        with profiler.section('SceneManager.initialize'):
+            self.sceneManager.initialize(self.assetLoader)
+        with profiler.section('Player.initialize (left)'):
+            self.playerLeft.initialize()
+        with profiler.section('Player.initialize (right)'):
+            self.playerRight.initialize()
         # 초기 스폰 시 플레이어가 겹치지 않도록 보정
         CollisionHandler.prevent_overlap_on_spawn(self.playerLeft, self.playerRight)
-        self.spriteManager.load_sprites()
+        # 스프라이트는 캐릭터 선택 후 필요한 캐릭터만 로딩 (SpriteManager.prefetch)
         self.spriteManager.set_player_references(self.playerLeft, self.playerRight)
-        self.last_time = time.time()
+        self.spriteManager.loader = self.assetLoader
 
     def check_collision(self):
         """플레이어 간 충돌 및 공격 판정 - 공격 범위 기반"""
         # Player1이 공격 중이고 타격 처리 가능한 상태인지 확인
         if (self.playerLeft.is_attacking and
-            hasattr(self.playerLeft, 'can_process_hit') and
             self.playerLeft.can_process_hit and
             self.playerLeft.can_hit_target()):
 
             # PlayerRight가 down 상태일 때 Lower 계열 공격은 히트 가능하도록 허용
-            attacker_state = (self.playerLeft.state or '').lower()
+            is_lower_attack = moveRegistry.lookup(self.playerLeft.state or '').height == 'lower'
             target = self.playerRight
             # 대상의 현재 hit_type 확인 (down 또는 airborne일 때 특별 처리 허용)
-            target_hit_type = getattr(target.character, 'hit_type', None) if hasattr(target, 'character') else None
+            target_hit_type = target.character.hit_type
             target_is_down = (target_hit_type == 'down')
             target_is_airborne = (target_hit_type == 'airborne') and not target.is_grounded
             target_is_hit = target.is_in_hit_state()
@@ -57,14 +77,14 @@ class Game:
             # 1. 일반적으로 피격 상태가 아니면 히트 가능
             # 2. Lower 계열 공격은 down 상태에도 히트 가능
             # 3. 공중(airborne) 상태는 항상 히트 가능 (에어 콤보)
-            allow_hit_on_down = ('lower' in attacker_state) and target_is_down
+            allow_hit_on_down = is_lower_attack and target_is_down
             allow_hit_on_airborne = target_is_airborne
 
             # 히트 판정: 피격 상태가 아니거나 특수 조건 만족 시
             can_hit = (not target_is_hit) or allow_hit_on_down or allow_hit_on_airborne
 
             # 디버그: down 상태 충돌 판정 로그
-            if target_is_down and 'lower' in attacker_state:
+            if target_is_down and is_lower_attack:
                 print(f"[DEBUG] Player1 Lower attack on DOWN Player2: can_hit={can_hit}, target_is_down={target_is_down}, target_hit_type={target_hit_type}")
 
             if can_hit:
@@ -72,7 +92,7 @@ class Game:
                 # Player1의 공격 범위에 Player2가 있는지 확인
                 if self.playerLeft.is_in_attack_range(self.playerRight):
                     # 타격음(swoosh)은 공격 범위에 들어왔을 때 항상 재생
-                    if not self.playerLeft.attack_sound_played and hasattr(self.playerLeft, 'swoosh_sound') and self.playerLeft.swoosh_sound:
+                    if not self.playerLeft.attack_sound_played and self.playerLeft.swoosh_sound:
                         self.playerLeft.swoosh_sound.play()
                         self.playerLeft.attack_sound_played = True
 
@@ -107,21 +127,17 @@ class Game:
 
         # Player2가 공격 중이고 타격 처리 가능한 상태인지 확인
         if (self.playerRight.is_attacking and
-            hasattr(self.playerRight, 'can_process_hit') and
             self.playerRight.can_process_hit and
             self.playerRight.can_hit_target()):
 
             # PlayerLeft가 down 상태일 때 Lower 계열 공격은 히트 가능하도록 허용
-            attacker_state = (self.playerRight.state or '').lower()
+            is_lower_attack = moveRegistry.lookup(self.playerRight.state or '').height == 'lower'
             target = self.playerLeft
-            target_hit_type = getattr(target.character, 'hit_type', None) if hasattr(target, 'character') else None
+            target_hit_type = target.character.hit_type
             target_is_down = (target_hit_type == 'down') and target.is_grounded
             target_is_airborne = (target_hit_type == 'airborne') and not target.is_grounded
             target_is_hit = target.is_in_hit_state()
 
-            # Lower 공격인지 확인
-            is_lower_attack = 'lower' in attacker_state
-
             # 충돌 조건을 더 유연하게 수정
             # 1. 일반적으로 피격 상태가 아니면 히트 가능
             # 2. Lower 계열 공격은 down 상태에도 히트 가능
@@ -141,7 +157,7 @@ class Game:
                 # Player2의 공격 범위에 Player1이 있는지 확인
                 if self.playerRight.is_in_attack_range(self.playerLeft):
                     # 타격음(swoosh)은 공격 범위에 들어왔을 때 항상 재생
-                    if not self.playerRight.attack_sound_played and hasattr(self.playerRight, 'swoosh_sound') and self.playerRight.swoosh_sound:
+                    if not self.playerRight.attack_sound_played and self.playerRight.swoosh_sound:
                         self.playerRight.swoosh_sound.play()
                         self.playerRight.attack_sound_played = True
 
@@ -175,25 +191,58 @@ class Game:
                     self.playerRight.can_process_hit = False
 
     def calculate_damage(self, attack_state):
-        """공격 상태에 따른 데미지 계산"""
-        # fast 공격들은 모두 10데미지
-        if 'fast' in attack_state.lower():
-            return 10
-        # strong 공격들은 모두 20데미지
-        elif 'strong' in attack_state.lower():
-            return 20
-        # rage 스킬은 특별히 30데미지
-        elif 'rage' in attack_state.lower():
-            return 30
-        else:
-            # 기본 데미지 (혹시 모를 다른 공격들)
-            return 5
+        """공격 상태에 따른 데미지 계산 (fast/strong/rage 계열별 config 값, 그 외 5)"""
+        return moveRegistry.lookup(attack_state).damage
 
-    def update(self, deltaTime):
-        # deltaTime 제한 - 너무 큰 값이 들어오면 제한
-        deltaTime = min(deltaTime, self.max_delta_time)
+    def start_match(self, p1_char, p2_char):
+        """선택한 캐릭터로 대전 준비 후 플레이 씬으로 전환 (캐릭터 선택 완료, 리플레이 재생 시작)"""
+        # 선택이 끝난 캐릭터 스프라이트 로딩 요청 (캐릭터 선택 중에 이미 요청했으면 그대로)
+        self.spriteManager.prefetch(p1_char)
+        self.spriteManager.prefetch(p2_char)
+
+        # 플레이어 캐릭터 설정
+        self.playerLeft.change_character(p1_char)
+        self.playerRight.change_character(p2_char)
+
+        # 플레이어 초기 위치 설정
+        self.playerLeft.x = config.windowWidth * 0.35
+        self.playerRight.x = config.windowWidth * 0.65
+        self.playerLeft.y = config.GROUND_Y
+        self.playerRight.y = config.GROUND_Y
 
-        events = pico2d.get_events()
+        # 플레이어 방향 설정
+        self.playerLeft.dir = 1
+        self.playerRight.dir = -1
+        self.playerLeft.facing_right = True
+        self.playerRight.facing_right = False
+
+        # spriteManager 캐릭터 타입 즉시 업데이트
+        for animation, character_type in zip(self.spriteManager.animations, (p1_char, p2_char)):
+            animation.character_type = character_type
+        # 이번 매치에서 쓰지 않는 캐릭터 스프라이트 해제
+        self.spriteManager.evict_unused_characters()
+
+        # spriteManager 위치 및 상태 동기화
+        self.spriteManager.sync_positions()
+        self.spriteManager.snap_positions()
+
+        # 플레이어 상태를 Idle로 초기화하고 spriteManager에 반영
+        self.playerLeft.state = 'Idle'
+        self.playerRight.state = 'Idle'
+        for animation in self.spriteManager.animations:
+            animation.reset('Idle')
+
+        # 라운드마다 이 상태로 되돌림
+        self.round_start = gameSnapshot.save(self, gameSnapshot.ROUND_KEYS)
+
+        # 플레이 씬으로 전환
+        self.sceneManager.change_to_play_scene()
+
+    def update(self, deltaTime):
+        """시뮬레이션 1스텝 (deltaTime은 항상 sim_dt)"""
+        events = self.net_session.frame_events() if self.net_session else renderBackend.get_events()
+        if self.replay_recorder:
+            self.replay_recorder.observe(events)
 
         # F1 키로 바운딩 박스 토글
         if self.ioManager.checkF1Toggle(events):
@@ -226,47 +275,17 @@ class Game:
             # 씬 매니저 업데이트 호출 (애니메이션 재생을 위해)
             self.sceneManager.update(deltaTime)
 
+            # 선택이 끝난 캐릭터는 대기 시간 동안 스프라이트를 미리 로딩
+            for selected_char in char_select.get_selected_characters():
+                if selected_char:
+                    self.spriteManager.prefetch(selected_char)
+
             # 두 플레이어 모두 선택 완료시 플레이 씬으로 전환
             if char_select.is_both_selected():
                 p1_char, p2_char = char_select.get_selected_characters()
-                # 플레이어 캐릭터 설정
-                self.playerLeft.change_character(p1_char)
-                self.playerRight.change_character(p2_char)
-
-                # 플레이어 초기 위치 설정
-                self.playerLeft.x = config.windowWidth * 0.35
-                self.playerRight.x = config.windowWidth * 0.65
-                self.playerLeft.y = config.GROUND_Y
-                self.playerRight.y = config.GROUND_Y
-
-                # 플레이어 방향 설정
-                self.playerLeft.dir = 1
-                self.playerRight.dir = -1
-                self.playerLeft.facing_right = True
-                self.playerRight.facing_right = False
-
-                # spriteManager 캐릭터 타입 즉시 업데이트
-                self.spriteManager.player1_character_type = p1_char
-                self.spriteManager.player2_character_type = p2_char
-
-                # spriteManager 위치 및 상태 동기화
-                self.spriteManager.update_player1_position(self.playerLeft.x, self.playerLeft.y)
-                self.spriteManager.update_player2_position(self.playerRight.x, self.playerRight.y)
-                self.spriteManager.update_player1_direction(self.playerLeft.dir)
-                self.spriteManager.update_player2_direction(self.playerRight.dir)
-
-                # 플레이어 상태를 Idle로 초기화하고 spriteManager에 반영
-                self.playerLeft.state = 'Idle'
-                self.playerRight.state = 'Idle'
-                self.spriteManager.player1_state = 'Idle'
-                self.spriteManager.player2_state = 'Idle'
-                self.spriteManager.player1_frame = 0
-                self.spriteManager.player2_frame = 0
-                self.spriteManager.frame_timer = 0.0
-                self.spriteManager.player2_frame_timer = 0.0
-
-                # 플레이 씬으로 전환
-                self.sceneManager.change_to_play_scene()
+                self.start_match(p1_char, p2_char)
+                if self.replay_recorder:
+                    self.replay_recorder.start(self, p1_char, p2_char)
             return
 
         # 씬 전환 중일 때는 씬 매니저 업데이트만 하고 게임 로직 멈춤
@@ -344,16 +363,14 @@ class Game:
             self.game_over = True
 
         # SpriteManager에 플레이어 상태 전달 - 플레이어 업데이트 후에 실행
-        self.spriteManager.update_player1_state(self.playerLeft.state, deltaTime)
-        self.spriteManager.update_player1_position(self.playerLeft.x, self.playerLeft.y)
-        self.spriteManager.update_player1_direction(self.playerLeft.dir)
+        self.spriteManager.update(deltaTime)
 
-        self.spriteManager.update_player2_state(self.playerRight.state, deltaTime)
-        self.spriteManager.update_player2_position(self.playerRight.x, self.playerRight.y)
-        self.spriteManager.update_player2_direction(self.playerRight.dir)
+        # 서로 바라보도록 방향 갱신 (다음 스텝의 공격 범위 판정에 사용)
+        self.spriteManager.update_facing()
 
-    def render(self):
-        pico2d.clear_canvas()
+    def render(self, alpha=1.0):
+        """화면 그리기 - alpha는 직전/현재 시뮬레이션 스텝 사이 보간 비율"""
+        renderBackend.clear_canvas()
 
         # 플레이씬으로 전환 중이거나 플레이 씬일 때
         is_play_or_transitioning = (
@@ -378,32 +395,80 @@ class Game:
 
         # 플레이 씬이거나 플레이씬으로 전환 중일 때 플레이어 렌더링
         if is_play_or_transitioning:
-            self.spriteManager.render()
+            self.spriteManager.render(alpha)
             # 바운딩 박스 렌더링을 위해 플레이어 render 호출 (HP는 플레이씬에서 렌더링)
             self.playerLeft.render()
             self.playerRight.render()
 
 
-        pico2d.update_canvas()
+        renderBackend.update_canvas()
 
     def run(self):
-        current_time = time.time()
-        deltaTime = current_time - self.last_time
+        # 목표 fps에 맞춰 대기 (sleep 후 spin) - 직전 프레임부터 흐른 시간
+        deltaTime = self.pacer.wait()
 
-        # 첫 프레임에서 deltaTime이 너무 크지 않도록 제한
-        if self.last_time == 0:
-            deltaTime = self.frame_time
+        # 디코딩이 끝난 에셋을 프레임당 예산 안에서만 업로드 (프레임 끊김 방지)
+        self.assetLoader.pump()
 
-        # 프레임 제한 - 너무 빠르면 대기
-        if deltaTime < self.frame_time:
-            time.sleep(self.frame_time - deltaTime)
-            current_time = time.time()
-            deltaTime = current_time - self.last_time
+        # 흐른 시간만큼 고정 스텝으로 시뮬레이션 - 밀린 시간은 max_steps_per_frame까지만 따라잡고 버림
+        self.accumulator += min(deltaTime, self.max_steps_per_frame * self.sim_dt)
+        while self.accumulator >= self.sim_dt and self.running:
+            self.step()
+            self.accumulator -= self.sim_dt
 
-        self.last_time = current_time
+        # 남은 시간 비율만큼 직전 스텝과 현재 스텝 사이를 보간해 그리기
+        self.render(self.accumulator / self.sim_dt)
 
-        self.update(deltaTime)
-        self.render()
+    def step(self):
+        """시뮬레이션 1스텝 진행 (넷플레이에서 상대 입력을 기다리는 중이면 진행하지 않음)"""
+        if self.net_session and not self.net_session.before_step(self):
+            return
+        self.spriteManager.save_previous_positions()
+        self.update(self.sim_dt)
+        if self.replay_recorder:
+            self.replay_recorder.after_step(self)
+        if self.replay_player:
+            self.replay_player.after_step(self)
+        if self.net_session:
+            self.net_session.after_step(self)
+
+    def run_headless(self, steps, render=True):
+        """헤드리스 모드: 실제 시간과 관계없이 최대 속도로 steps 스텝 실행 (render면 Null 렌더링도 매 스텝 수행)
+
+        Returns: 실제로 실행한 스텝 수 (ESC/종료 입력 시 중간에 끝남)
+        """
+        count = 0
+        while count < steps and self.running:
+            self.assetLoader.pump(budget=float('inf'))
+            self.step()
+            if render:
+                self.render()
+            count += 1
+        return count
+
+    def profile_startup(self, report_path):
+        """--profile-startup: 초기화 후 지연 로딩과 전체 스프라이트 로딩까지 측정해 JSON 보고서 저장
+
+        스프라이트는 평소 캐릭터 선택 후 필요한 것만 로딩하지만, 어떤 에셋을 미룰지 판단할 수 있도록
+        모든 캐릭터를 캐릭터/애니메이션별로 측정한 뒤 상주 한도를 넘는 캐릭터는 다시 해제
+        """
+        with profiler.section('AssetLoader.finish_all (deferred scene assets)'):
+            self.assetLoader.finish_all()
+        with profiler.section('SpriteManager.load_sprites'):
+            self.spriteManager.load_sprites()
+        self.spriteManager.evict_unused_characters()
+        profiler.write_report(report_path)
+
+    def shutdown(self):
+        """종료 정리 - 디코딩 스레드 종료 및 리소스 캐시/프레임 시간 통계 출력"""
+        if self.replay_recorder:
+            self.replay_recorder.finish(self, complete=False)  # 대전 중에 종료하면 거기까지 저장
+        if self.net_session:
+            self.net_session.finish(self, 'shutdown')  # 이미 끝난 세션이면 아무것도 하지 않음
+        self.assetLoader.shutdown()
+        resources.report()
+        if self.pacer.frame_count:
+            self.pacer.report()
 
     def _try_trigger_counterattack_from_input(self, target_player, is_player2=False):
         """가드 성공 직후 현재 입력으로 즉시 반격 시작 시도
@@ -439,32 +504,9 @@ class Game:
         # 후보 공격이 있는 경우 처리
         if candidate_attack:
             # 사용 가능한 공격인지 확인
-            if hasattr(target_player, 'can_use_attack') and target_player.can_use_attack(candidate_attack):
-                # 현재 공격 중이 아니어야 함
-                if not target_player.is_attacking:
-                    # 가드 상태 해제 및 공격 시작
-                    target_player.is_guarding = False
-                    if hasattr(target_player, 'can_attack_after_guard'):
-                        target_player.can_attack_after_guard = False
-                    if hasattr(target_player, 'guard_counter_timer'):
-                        target_player.guard_counter_timer = 0.0
-                    if hasattr(target_player, 'guard_animation_reset'):
-                        target_player.guard_animation_reset = False
-
-                    target_player.state = candidate_attack
-                    target_player.character.state = candidate_attack  # Character 상태도 동기화
-                    target_player.is_attacking = True
-                    if hasattr(target_player, 'reset_attack_hit_flag'):
-                        target_player.reset_attack_hit_flag()
-
-                    # 연계 가능 설정 (기존 로직과 동일)
-                    if candidate_attack in ['fastMiddleATK', 'strongMiddleATK', 'strongUpperATK']:
-                        target_player.can_combo = True
-                    else:
-                        target_player.can_combo = False
-
-                    target_player.combo_reserved = False
-
+            if target_player.can_use_attack(candidate_attack):
+                # 현재 공격 중이 아니면 가드 상태 해제 및 공격 시작 (가드 중 공격 입력과 같은 전이)
+                if not target_player.is_attacking and playerStateMachine.fire(target_player, 'attack', candidate_attack):
                     print(f"Counterattack triggered immediately after guard: {candidate_attack} (Player {'2' if is_player2 else '1'})")
                     return True
                 else:
@@ -475,100 +517,16 @@ class Game:
         return False
 
     def reset_round(self):
-        """라운드 리셋 - 플레이어 위치 및 HP 초기화"""
-        # 플레이어 HP 리셋
-        self.playerLeft.hp = self.playerLeft.max_hp
-        self.playerRight.hp = self.playerRight.max_hp
-
-        # Character HP도 동기화
-        self.playerLeft.character.hp = self.playerLeft.max_hp
-        self.playerRight.character.hp = self.playerRight.max_hp
-
-        # 플레이어 위치 리셋
-        self.playerLeft.x = config.windowWidth * 0.35
-        self.playerRight.x = config.windowWidth * 0.65
-        self.playerLeft.y = config.GROUND_Y
-        self.playerRight.y = config.GROUND_Y
-
-        # 플레이어 상태 리셋
-        self.playerLeft.state = 'Idle'
-        self.playerRight.state = 'Idle'
-        self.playerLeft.is_attacking = False
-        self.playerRight.is_attacking = False
-        self.playerLeft.is_hit = False
-        self.playerRight.is_hit = False
-        self.playerLeft.is_grounded = True
-        self.playerRight.is_grounded = True
-        self.playerLeft.velocity_x = 0.0
-        self.playerRight.velocity_x = 0.0
-        self.playerLeft.velocity_y = 0.0
-        self.playerRight.velocity_y = 0.0
-
-        # 추가 플레이어 상태 리셋
-        self.playerLeft.position_state = 'Middle'
-        self.playerRight.position_state = 'Middle'
-        self.playerLeft.hit_recovery_input = False
-        self.playerRight.hit_recovery_input = False
-        self.playerLeft.can_combo = False
-        self.playerRight.can_combo = False
-        self.playerLeft.combo_reserved = False
-        self.playerRight.combo_reserved = False
-        self.playerLeft.is_guarding = False
-        self.playerRight.is_guarding = False
-        self.playerLeft.attack_hit_processed = False
-        self.playerRight.attack_hit_processed = False
-        self.playerLeft.can_process_hit = False
-        self.playerRight.can_process_hit = False
-        self.playerLeft.can_attack_after_guard = False
-        self.playerRight.can_attack_after_guard = False
-        self.playerLeft.guard_counter_timer = 0.0
-        self.playerRight.guard_counter_timer = 0.0
-
-        # 플레이어 방향 리셋
-        self.playerLeft.dir = 1
-        self.playerRight.dir = -1
-        self.playerLeft.facing_right = True
-        self.playerRight.facing_right = False
-
-        # 캐릭터 피격 상태 리셋
-        self.playerLeft.character.is_hit = False
-        self.playerRight.character.is_hit = False
-        self.playerLeft.character.hit_type = None
-        self.playerRight.character.hit_type = None
-        self.playerLeft.character.can_get_up = False
-        self.playerRight.character.can_get_up = False
-        self.playerLeft.character.state = 'Idle'
-        self.playerRight.character.state = 'Idle'
-        self.playerLeft.character.frame = 0
-        self.playerRight.character.frame = 0
-        self.playerLeft.character.velocity_y = 0.0
-        self.playerRight.character.velocity_y = 0.0
-        self.playerLeft.character.is_grounded = True
-        self.playerRight.character.is_grounded = True
-
-        # 캐릭터 위치 동기화
-        self.playerLeft.character.x = self.playerLeft.x
-        self.playerLeft.character.y = self.playerLeft.y
-        self.playerRight.character.x = self.playerRight.x
-        self.playerRight.character.y = self.playerRight.y
-
-        # spriteManager 상태 동기화
-        self.spriteManager.player1_state = 'Idle'
-        self.spriteManager.player2_state = 'Idle'
-        self.spriteManager.player1_frame = 0
-        self.spriteManager.player2_frame = 0
-        self.spriteManager.frame_timer = 0.0
-        self.spriteManager.player2_frame_timer = 0.0
-        self.spriteManager.update_player1_position(self.playerLeft.x, self.playerLeft.y)
-        self.spriteManager.update_player2_position(self.playerRight.x, self.playerRight.y)
-        self.spriteManager.update_player1_direction(self.playerLeft.dir)
-        self.spriteManager.update_player2_direction(self.playerRight.dir)
+        """라운드 리셋 - 플레이어/캐릭터/스프라이트를 매치 시작 상태로 (점수와 눌린 키는 유지)"""
+        gameSnapshot.load(self, self.round_start)
 
         # 플레이씬의 라운드 리셋
         self.sceneManager.play_scene.reset_round()
 
         # 겹침 방지
         CollisionHandler.prevent_overlap_on_spawn(self.playerLeft, self.playerRight)
+        self.spriteManager.sync_positions()
+        self.spriteManager.snap_positions()
 
         print("Round reset! New round starting...")
 
@@ -581,43 +539,8 @@ class Game:
         # 플레이씬 초기화
         self.sceneManager.play_scene.reset_game()
 
-        # 플레이어 초기화
-        self.playerLeft.hp = self.playerLeft.max_hp
-        self.playerRight.hp = self.playerRight.max_hp
-        self.playerLeft.character.hp = self.playerLeft.max_hp
-        self.playerRight.character.hp = self.playerRight.max_hp
-
-        # 플레이어 위치 리셋
-        self.playerLeft.x = config.windowWidth * 0.35
-        self.playerRight.x = config.windowWidth * 0.65
-        self.playerLeft.y = config.GROUND_Y
-        self.playerRight.y = config.GROUND_Y
-
-        # spriteManager 위치 업데이트
-        self.spriteManager.update_player1_position(self.playerLeft.x, self.playerLeft.y)
-        self.spriteManager.update_player2_position(self.playerRight.x, self.playerRight.y)
-
-        # 플레이어 상태 리셋
-        self.playerLeft.state = 'Idle'
-        self.playerRight.state = 'Idle'
-        self.playerLeft.is_attacking = False
-        self.playerRight.is_attacking = False
-        self.playerLeft.is_hit = False
-        self.playerRight.is_hit = False
-
-        # 캐릭터 상태 리셋
-        self.playerLeft.character.state = 'Idle'
-        self.playerRight.character.state = 'Idle'
-        self.playerLeft.character.is_hit = False
-        self.playerRight.character.is_hit = False
-
-        # spriteManager 상태 리셋
-        self.spriteManager.player1_state = 'Idle'
-        self.spriteManager.player2_state = 'Idle'
-        self.spriteManager.player1_frame = 0
-        self.spriteManager.player2_frame = 0
-        self.spriteManager.frame_timer = 0.0
-        self.spriteManager.player2_frame_timer = 0.0
+        # 플레이어/캐릭터/스프라이트 초기화 (매치 시작 상태)
+        gameSnapshot.load(self, self.round_start)
 
         # 플레이 씬 배경음악 정지
         self.sceneManager.play_scene.stop_music()
@@ -0,0 +1,195 @@
+"""
+대전 상태 스냅샷
+Game/Player/Character/AnimationController/SceneManager/PlayScene/IOManager에서 대전 진행에 영향을 주는 값만 모아 저장하고 되돌림
+(이미지/사운드/로딩 상태 같은 리소스는 건드리지 않음 - 같은 매치 안에서 상태를 되감는 용도)
+
+- 저장하는 필드는 아래 *_FIELDS 목록 (새 상태 변수를 추가하면 여기에도 추가해야 라운드 리셋/되감기/리플레이 탐색에 반영됨)
+- 나중에 생기는 필드는 있을 때만 저장하고, 없던 필드는 복원 시 지움
+- Player/Character/AnimationController는 __slots__ 클래스 (모든 필드가 항상 있음) - attrgetter 한 번으로 읽고 필드별 setattr로 복원
+  (스냅샷에 없는 필드는 그대로 둠)
+- 'animations'는 SpriteManager의 모든 애니메이션 컨트롤러 (컨트롤러마다 ANIMATION_FIELDS 한 줄, 목록 순서대로)
+- save/load는 필드 이름 없이 값만 정해진 순서로 담은 marshal 버퍼 (전체 상태 1KB 미만, 저장/복원 수십 마이크로초)
+  나머지 대상의 복원은 __dict__.update 한 번 (필드별 setattr 없음) / 같은 실행 안에서만 사용 - 라운드 시작 상태, 넷플레이 되감기
+- pack/unpack은 파일용 repr + zlib (파이썬 버전과 무관, 실수는 repr로 정확히 복원, 파일에서 읽어도 코드 실행 없음)
+  기준 스냅샷을 주면 그 repr을 zlib 사전으로 사용 - 필드 이름/구조가 같으므로 기준과 다른 값만큼만 커짐 (약 1KB -> 약 160바이트)
+
+벤치마크: python -m Tools.benchSnapshot
+"""
+import ast
+import marshal
+import operator
+import zlib
+
+GAME_FIELDS = ('game_over', 'round_end_timer')
+PLAYER_FIELDS = ('x', 'y', 'prev_x', 'dir', 'facing_right', 'hp', 'velocity_x', 'velocity_y', 'is_grounded',
+                 'state', 'position_state', 'is_attacking', 'is_hit', 'hit_recovery_input', 'can_combo',
+                 'combo_reserved', 'is_guarding', 'guard_animation_reset', 'guard_counter_timer',
+                 'can_attack_after_guard', 'attack_hit_processed', 'can_process_hit', 'attack_sound_played',
+                 'move_frame')
+CHARACTER_FIELDS = ('frame', 'x', 'y', 'state', 'hp', 'is_hit', 'hit_type', 'hit_frame_range', 'hit_frame_start',
+                    'can_get_up', 'velocity_y', 'is_grounded')
+ANIMATION_FIELDS = ('state', 'frame', 'elapsed', 'x', 'y', 'dir', 'prev_x', 'prev_y')
+SCENE_FIELDS = ('current_scene', 'is_transitioning', 'transition_timer', 'transition_from', 'transition_to',
+                'transition_offset')
+PLAY_SCENE_FIELDS = ('player1_rounds_won', 'player2_rounds_won', 'game_over', 'round_over', 'winner',
+                     'countdown_active', 'countdown_timer', 'countdown_index')
+IO_FIELDS = ('player1_keys', 'player2_keys', 'player1_combo_input', 'player2_combo_input')
+
+# 스냅샷 키 -> 필드 목록
+TARGET_FIELDS = {
+    'game': GAME_FIELDS,
+    'left': PLAYER_FIELDS,
+    'right': PLAYER_FIELDS,
+    'left_character': CHARACTER_FIELDS,
+    'right_character': CHARACTER_FIELDS,
+    'animations': ANIMATION_FIELDS,
+    'scenes': SCENE_FIELDS,
+    'play_scene': PLAY_SCENE_FIELDS,
+    'io': IO_FIELDS,
+}
+# 라운드마다 처음 상태로 돌아가는 대상 (점수, 씬, 눌린 키는 유지)
+ROUND_KEYS = ('left', 'right', 'left_character', 'right_character', 'animations')
+LIST_KEYS = frozenset(('animations',))  # 객체 목록 대상 (항목마다 같은 필드, __slots__ 객체)
+
+_FIELD_SETS = {key: frozenset(fields) for key, fields in TARGET_FIELDS.items()}
+_DICT_FIELDS = frozenset(('player1_keys', 'player2_keys'))  # 복사해서 저장/복원하는 필드 (키 상태 딕셔너리)
+_MISSING = ...  # save 버퍼에서 없는 필드 자리 (marshal로 저장할 수 있는 값)
+_MISSING_ROWS = {key: (_MISSING,) * len(fields) for key, fields in TARGET_FIELDS.items()}
+_GETTERS = {key: operator.attrgetter(*fields) for key, fields in TARGET_FIELDS.items()}  # __slots__ 대상용
+
+
+def _targets(game):
+    """(스냅샷 키, 객체)"""
+    return (
+        ('game', game),
+        ('left', game.playerLeft),
+        ('right', game.playerRight),
+        ('left_character', game.playerLeft.character),
+        ('right_character', game.playerRight.character),
+        ('animations', game.spriteManager.animations),
+        ('scenes', game.sceneManager),
+        ('play_scene', game.sceneManager.play_scene),
+        ('io', game.ioManager),
+    )
+
+
+def capture(game, keys=None):
+    """현재 대전 상태 스냅샷 (딕셔너리) - keys를 주면 그 대상만 (캐릭터 종류는 저장하지 않음)"""
+    snapshot = {}
+    if keys is None:
+        snapshot['characters'] = (game.playerLeft.get_character_type(), game.playerRight.get_character_type())
+    for key, target in _targets(game):
+        if keys is not None and key not in keys:
+            continue
+        if key in LIST_KEYS:
+            snapshot[key] = [dict(zip(TARGET_FIELDS[key], _GETTERS[key](item))) for item in target]
+            continue
+        if hasattr(target, '__dict__'):
+            values = vars(target)
+            state = {name: values[name] for name in TARGET_FIELDS[key] if name in values}
+        else:
+            state = dict(zip(TARGET_FIELDS[key], _GETTERS[key](target)))
+        for name in _DICT_FIELDS.intersection(state):
+            state[name] = dict(state[name])
+        snapshot[key] = state
+    return snapshot
+
+
+def restore(game, snapshot):
+    """스냅샷 상태로 되돌리기 - 캐릭터 종류가 있고 그 사이 바뀌었으면 캐릭터부터 되돌림, 스냅샷에 없는 대상은 그대로"""
+    characters = snapshot.get('characters')
+    if characters:
+        _restore_characters(game, characters)
+    for key, target in _targets(game):
+        state = snapshot.get(key)
+        if state is None:
+            continue
+        if key in LIST_KEYS:
+            for item, item_state in zip(target, state):
+                for name, value in item_state.items():
+                    setattr(item, name, value)
+            continue
+        if not hasattr(target, '__dict__'):
+            for name, value in state.items():
+                setattr(target, name, dict(value) if name in _DICT_FIELDS else value)
+            continue
+        values = vars(target)
+        values.update(state)
+        for name in _DICT_FIELDS.intersection(state):
+            values[name] = dict(state[name])
+        for name in _FIELD_SETS[key] - state.keys():
+            values.pop(name, None)
+
+
+def _restore_characters(game, characters):
+    for player, character_type in zip((game.playerLeft, game.playerRight), characters):
+        if player.get_character_type() != character_type:
+            player.set_character_type(character_type)
+    # 애니메이션은 따라가는 플레이어의 캐릭터로
+    for animation in game.spriteManager.animations:
+        if animation.owner:
+            animation.character_type = animation.owner.get_character_type()
+
+
+def save(game, keys=None):
+    """현재 대전 상태 -> marshal 버퍼 (같은 실행 안에서 load로 복원) - keys를 주면 그 대상만 (캐릭터 종류 제외)"""
+    characters = None
+    if keys is None:
+        characters = (game.playerLeft.get_character_type(), game.playerRight.get_character_type())
+    states = []
+    for key, target in _targets(game):
+        if keys is not None and key not in keys:
+            states.append(None)
+        elif key in LIST_KEYS:
+            states.append(tuple(map(_GETTERS[key], target)))
+        elif hasattr(target, '__dict__'):
+            states.append(tuple(map(vars(target).get, TARGET_FIELDS[key], _MISSING_ROWS[key])))
+        else:
+            states.append(_GETTERS[key](target))
+    return marshal.dumps((characters, tuple(states)))
+
+
+def load(game, buffer):
+    """save 버퍼 상태로 되돌리기 (딕셔너리 값은 marshal.loads가 새로 만듦)"""
+    characters, states = marshal.loads(buffer)
+    if characters:
+        _restore_characters(game, characters)
+    for (key, target), state in zip(_targets(game), states):
+        if state is None:
+            continue
+        if key in LIST_KEYS:
+            for item, row in zip(target, state):
+                for name, value in zip(TARGET_FIELDS[key], row):
+                    setattr(item, name, value)
+            continue
+        if not hasattr(target, '__dict__'):
+            for name, value in zip(TARGET_FIELDS[key], state):
+                if value is not _MISSING:
+                    setattr(target, name, value)
+            continue
+        values = vars(target)
+        if _MISSING in state:
+            for name, value in zip(TARGET_FIELDS[key], state):
+                if value is _MISSING:
+                    values.pop(name, None)
+                else:
+                    values[name] = value
+        else:
+            values.update(zip(TARGET_FIELDS[key], state))
+
+
+def pack(snapshot, reference=None):
+    """스냅샷 -> 압축 바이트 (파일용) - reference: 사전으로 쓸 기준 스냅샷 (unpack에도 같은 기준 필요)"""
+    encoded = repr(snapshot).encode('utf-8')
+    if reference is None:
+        return zlib.compress(encoded, 9)
+    compressor = zlib.compressobj(9, zdict=repr(reference).encode('utf-8'))
+    return compressor.compress(encoded) + compressor.flush()
+
+
+def unpack(data, reference=None):
+    """압축 바이트 -> 스냅샷 (pack에 준 것과 같은 기준 스냅샷)"""
+    if reference is None:
+        return ast.literal_eval(zlib.decompress(data).decode('utf-8'))
+    decompressor = zlib.decompressobj(zdict=repr(reference).encode('utf-8'))
+    return ast.literal_eval((decompressor.decompress(data) + decompressor.flush()).decode('utf-8'))
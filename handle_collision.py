@@ -65,12 +65,12 @@ class CollisionHandler:
             return  # 실제로 겹치지 않음
 
         # 피격 중인 플레이어는 물리 계산으로 이동하므로 충돌 해결에서 제외
-        player1_is_hit = getattr(player1, 'is_hit', False)
-        player2_is_hit = getattr(player2, 'is_hit', False)
+        player1_is_hit = player1.is_hit
+        player2_is_hit = player2.is_hit
 
         # 공중에 떠있는 플레이어 체크
-        player1_is_airborne = not getattr(player1, 'is_grounded', True)
-        player2_is_airborne = not getattr(player2, 'is_grounded', True)
+        player1_is_airborne = not player1.is_grounded
+        player2_is_airborne = not player2.is_grounded
 
         # 양쪽 다 피격 중이거나 공중에 있으면 충돌 무시 (서로 날아가는 중)
         if (player1_is_hit and player2_is_hit) or (player1_is_airborne and player2_is_airborne):
@@ -101,8 +101,8 @@ class CollisionHandler:
         push_distance = overlap_x / 2.0
 
         # 공격 중인 플레이어는 덜 밀림 (우선권)
-        player1_attacking = getattr(player1, 'is_attacking', False)
-        player2_attacking = getattr(player2, 'is_attacking', False)
+        player1_attacking = player1.is_attacking
+        player2_attacking = player2.is_attacking
 
         if player1_attacking and not player2_attacking:
             # player1이 공격 중 -> player2를 더 많이 밀어냄
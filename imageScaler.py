@@ -0,0 +1,156 @@
+"""
+이미지 디코딩/최종 크기 리샘플링
+화면에 그릴 크기로 미리 리샘플링한 텍스처를 만들어 렌더링 시 1:1로 복사되도록 함
+리샘플링 결과는 (에셋, 배율)별로 Resources/.scaled에 PNG로 캐시
+
+- 디코딩/리샘플링/캐시 저장은 렌더러를 쓰지 않으므로 워커 스레드에서 실행 가능
+- 런타임 렌더링과 같은 최근접(nearest) 샘플링 사용 (SDL 기본 렌더 스케일 품질)
+"""
+import hashlib
+import os
+import pathlib
+import struct
+import threading
+
+import pico2d
+from pico2d import pico2d as pico2d_core
+from sdl2 import (SDL_BLENDMODE_NONE, SDL_BlitScaled, SDL_ConvertSurfaceFormat, SDL_CreateRGBSurfaceWithFormat,
+                  SDL_CreateTextureFromSurface, SDL_FreeSurface, SDL_GetError, SDL_PIXELFORMAT_RGBA32,
+                  SDL_SetSurfaceBlendMode)
+from sdl2.sdlimage import IMG_Load, IMG_Load_RW, IMG_SavePNG
+
+import assetBundle
+import renderBackend
+
+
+def get_scaled_cache_dir():
+    """리샘플링 캐시 폴더 경로 반환"""
+    return pathlib.Path.cwd() / 'Resources' / '.scaled'
+
+
+def _sdl_error():
+    return SDL_GetError().decode('utf-8', 'replace')
+
+
+def decode_image(path):
+    """PNG를 RGBA32 서피스로 디코딩 (워커 스레드에서 실행, 렌더러를 사용하지 않음)
+
+    번들에 있으면 mmap 영역을 복사 없이 디코더에 넘김
+    """
+    rw = assetBundle.open_rw(path)
+    if rw is not None:
+        surface = IMG_Load_RW(rw, 1)
+    else:
+        surface = IMG_Load(str(path).encode('utf-8'))
+    if not surface:
+        raise IOError(f"cannot decode {path}: {_sdl_error()}")
+    # 업로드 시 포맷 변환이 일어나지 않도록 미리 RGBA32로 변환
+    rgba = SDL_ConvertSurfaceFormat(surface, SDL_PIXELFORMAT_RGBA32, 0)
+    SDL_FreeSurface(surface)
+    if not rgba:
+        raise IOError(f"cannot convert {path} to RGBA")
+    return rgba
+
+
+def read_image_size(path):
+    """이미지 크기 읽기 - PNG는 헤더만 읽고, 그 외 포맷(확장자만 png인 JPEG 등)은 디코딩해서 확인"""
+    header = assetBundle.read_bytes(path, 24)
+    if header[:8] == b'\x89PNG\r\n\x1a\n':
+        return struct.unpack('>II', header[16:24])
+    surface = decode_image(path)
+    size = surface.contents.w, surface.contents.h
+    SDL_FreeSurface(surface)
+    return size
+
+
+def upload_surface(surface):
+    """디코딩된 서피스를 텍스처로 올리고 pico2d Image로 감싸기 (메인 스레드 전용)"""
+    if renderBackend.headless:
+        return surface
+    texture = SDL_CreateTextureFromSurface(pico2d_core.renderer, surface)
+    SDL_FreeSurface(surface)
+    if not texture:
+        raise IOError(f"cannot create texture: {_sdl_error()}")
+    return pico2d.Image(texture)
+
+
+def scaled_size(w, h, size):
+    """목표 크기 계산 - size는 배율(float) 또는 (너비, 높이)"""
+    if isinstance(size, (tuple, list)):
+        return int(size[0]), int(size[1])
+    return max(1, round(w * size)), max(1, round(h * size))
+
+
+def size_tag(size):
+    """캐시 파일 이름에 쓰는 크기 표기 ('1.5x' 또는 '1920x1080')"""
+    if isinstance(size, (tuple, list)):
+        return f'{int(size[0])}x{int(size[1])}'
+    return f'{size:g}x'
+
+
+def get_cache_path(path, size):
+    """(에셋, 배율)별 캐시 파일 경로 - 같은 이름의 다른 폴더 파일과 겹치지 않도록 경로 해시 포함"""
+    resolved = str(pathlib.Path(path).resolve())
+    digest = hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:10]
+    return get_scaled_cache_dir() / f'{pathlib.Path(path).stem}-{digest}@{size_tag(size)}.png'
+
+
+def scale_surface(surface, w, h):
+    """서피스를 w x h로 최근접 리샘플링한 새 서피스 반환 (원본은 그대로)"""
+    scaled = SDL_CreateRGBSurfaceWithFormat(0, w, h, 32, SDL_PIXELFORMAT_RGBA32)
+    if not scaled:
+        raise IOError(f"cannot create {w}x{h} surface: {_sdl_error()}")
+    # 알파를 그대로 복사 (블렌딩 없이)
+    SDL_SetSurfaceBlendMode(surface, SDL_BLENDMODE_NONE)
+    if SDL_BlitScaled(surface, None, scaled, None) != 0:
+        SDL_FreeSurface(scaled)
+        raise IOError(f"cannot scale surface: {_sdl_error()}")
+    return scaled
+
+
+def load_surface(path, size=None):
+    """이미지를 디코딩하고 size가 있으면 최종 크기로 리샘플링 (디스크 캐시 사용, 워커 스레드 가능)
+
+    헤드리스 모드에서는 디코딩 없이 최종 크기의 NullImage 반환
+    """
+    if renderBackend.headless:
+        w, h = read_image_size(path)
+        return renderBackend.NullImage(*(scaled_size(w, h, size) if size is not None else (w, h)))
+    if size is None or size == 1:
+        return decode_image(path)
+
+    cache_path = get_cache_path(path, size)
+    try:
+        # 원본보다 새로운 캐시만 사용
+        if cache_path.stat().st_mtime_ns >= assetBundle.get_mtime_ns(path):
+            return decode_image(cache_path)
+    except (OSError, IOError):
+        pass
+
+    surface = decode_image(path)
+    w, h = scaled_size(surface.contents.w, surface.contents.h, size)
+    if (w, h) == (surface.contents.w, surface.contents.h):
+        return surface
+    try:
+        scaled = scale_surface(surface, w, h)
+    finally:
+        SDL_FreeSurface(surface)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # 여러 스레드가 같은 파일을 쓰더라도 완성된 파일만 보이도록 임시 파일 후 교체
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            if IMG_SavePNG(scaled, str(tmp_path).encode('utf-8')) == 0:
+                os.replace(tmp_path, cache_path)
+        finally:
+            # 저장 실패(또는 예외) 시 남은 임시 파일 정리 - 교체에 성공했으면 이미 없음
+            tmp_path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Warning: Cannot write scaled image cache {cache_path}: {e}")
+    return scaled
+
+
+def load_image(path, size=None):
+    """최종 크기 이미지 동기 로딩 (메인 스레드)"""
+    return upload_surface(load_surface(path, size))
@@ -0,0 +1,402 @@
+"""
+입력 리플레이 기록/재생
+대전마다 시뮬레이션 스텝당 두 플레이어의 키 상태를 3바이트로 기록하고, 같은 키 이벤트로 다시 만들어 Game에 넣어 재생
+
+- 기록은 IOManager와 같은 규칙으로 추적한 키 상태 (player1_keys/player2_keys 순서의 비트)
+  + 공격 키를 누른 스텝 표시(연계 입력, 키 반복 포함) + Player1 캐릭터 변경 키
+- config.REPLAY_KEYFRAME_INTERVAL 스텝마다 대전 상태 키프레임(gameSnapshot)을 함께 저장
+  탐색(seek)은 가까운 앞 키프레임을 복원하고 최대 한 구간만 다시 시뮬레이션 (처음부터 다시 돌리지 않음)
+- 두 번째 키프레임부터는 첫 키프레임을 기준으로 압축 (기준과 다른 값만큼만 저장, 탐색 시 풀어야 하는 키프레임은 최대 두 개)
+- 매치가 끝나면 압축/파일 쓰기는 백그라운드 스레드에서 (프레임 루프를 멈추지 않음)
+- 구간마다 스텝별 상태 해시를 저장하고 재생 중 비교 (어느 구간부터 달라졌는지 확인)
+
+파일 구조 (정수는 little endian):
+    MAGIC(4) + 버전(1) + 헤더 길이(4) + 헤더 JSON
+    구간마다: 키프레임(gameSnapshot.pack, 첫 구간 외에는 첫 키프레임 기준) + zlib(구간의 스텝 기록)
+        스텝 기록은 바이트 위치별로 모아서 압축 (Player1 바이트 전부 + Player2 바이트 전부 + 캐릭터 키 전부 - 같은 값이 이어져 더 잘 압축됨)
+    zlib(인덱스 JSON) - 구간별 [시작 스텝, 키프레임 위치/크기, 기록 위치/크기, 눌린 키, 상태 해시]
+    인덱스 위치(8) + 인덱스 크기(4) + INDEX_MAGIC(4)
+
+재생 (프로젝트 루트에서):
+    python main.py --replay Replays/<파일>.rpl [--seek 스텝]             # 실제 속도로 화면에 재생
+    python main.py --replay Replays/<파일>.rpl [--seek 스텝] --uncapped  # 렌더링 없이 최대 속도로 재생 후 검증 결과 출력
+"""
+import hashlib
+import json
+import pathlib
+import struct
+import threading
+import time
+import zlib
+
+import pico2d
+
+import config
+import frameData
+import gameSnapshot
+import moveRegistry
+
+MAGIC = b'RPLY'
+VERSION = 5
+INDEX_MAGIC = b'RIDX'
+PREFIX = '<4sBI'
+FOOTER = '<QI4s'
+RECORD_SIZE = 3  # 스텝당 바이트
+
+# 플레이어별 (IOManager 키 이름, SDL 키 코드들) - 비트 순서는 IOManager 키 딕셔너리 순서
+PLAYER_KEYS = (
+    (('w', (pico2d.SDLK_w,)), ('s', (pico2d.SDLK_s,)), ('a', (pico2d.SDLK_a,)), ('d', (pico2d.SDLK_d,)),
+     ('f', (pico2d.SDLK_f,)), ('g', (pico2d.SDLK_g,)), ('h', (pico2d.SDLK_h,))),
+    (('up', (pico2d.SDLK_UP,)), ('down', (pico2d.SDLK_DOWN,)), ('left', (pico2d.SDLK_LEFT,)),
+     ('right', (pico2d.SDLK_RIGHT,)), ('slash', (pico2d.SDLK_SLASH,)),
+     ('shift', (pico2d.SDLK_LSHIFT, pico2d.SDLK_RSHIFT)), ('three', (pico2d.SDLK_KP_3,))),
+)
+ATTACK_KEYS = (('f', 'g'), ('slash', 'shift'))  # 누르면 IOManager가 연계 입력으로 기록하는 키
+PRESS_BIT = 1 << 7
+CHARACTER_KEYS = ((pico2d.SDLK_1, 'priest'), (pico2d.SDLK_2, 'thief'), (pico2d.SDLK_3, 'fighter'))
+
+# 재생 결과에 영향을 주는 config 상수 (헤더에 저장하고 재생 전에 적용)
+CONFIG_KEYS = ('windowWidth', 'windowHeight', 'GRAVITY', 'GROUND_Y', 'FAST_FRAME_TIME', 'STRONG_FRAME_TIME',
+               'FAST_DAMAGE', 'STRONG_DAMAGE', 'RAGE_DAMAGE', 'FAST_ATTACK_RANGE', 'STRONG_ATTACK_RANGE',
+               'RAGE_ATTACK_RANGE', 'PRIEST_STRONG_UPPER_RANGE')
+
+_KEY_BITS = [{code: 1 << i for i, (_, codes) in enumerate(keys) for code in codes} for keys in PLAYER_KEYS]
+_ATTACK_BITS = [sum(1 << [name for name, _ in keys].index(a) for a in attacks)
+                for keys, attacks in zip(PLAYER_KEYS, ATTACK_KEYS)]
+
+
+def state_signature(game):
+    """재현 확인용 스텝별 게임 상태 (위치, HP, 상태, 애니메이션 프레임, 라운드)"""
+    left, right = game.playerLeft, game.playerRight
+    play_scene = game.sceneManager.play_scene
+    return repr((left.x, left.y, left.hp, left.state, right.x, right.y, right.hp, right.state) +
+                tuple(animation.frame for animation in game.spriteManager.animations) +
+                (play_scene.player1_rounds_won, play_scene.player2_rounds_won)).encode('utf-8')
+
+
+class KeyTracker:
+    """입력 이벤트로 두 플레이어의 눌린 키를 IOManager 규칙대로 추적 (리플레이 기록, 넷플레이 로컬 입력)"""
+
+    def __init__(self):
+        self.held = [0, 0]
+        self.pressed = [0, 0]  # 마지막 take 이후 공격 키를 누른 적 있으면 PRESS_BIT
+        self.character = 0  # 마지막 take 이후 처음 누른 캐릭터 변경 키 (CHARACTER_KEYS 번호, 없으면 0)
+
+    def observe(self, events):
+        for event in events:
+            if event.type != pico2d.SDL_KEYDOWN and event.type != pico2d.SDL_KEYUP:
+                continue
+            down = event.type == pico2d.SDL_KEYDOWN
+            for player in (0, 1):
+                bit = _KEY_BITS[player].get(event.key)
+                if bit is None:
+                    continue
+                if down:
+                    self.held[player] |= bit
+                    if bit & _ATTACK_BITS[player]:
+                        self.pressed[player] = PRESS_BIT
+                else:
+                    self.held[player] &= ~bit
+            if down and not self.character:
+                for index, (code, _) in enumerate(CHARACTER_KEYS, 1):
+                    if event.key == code:
+                        self.character = index
+
+    def take(self, player):
+        """플레이어의 입력 바이트 (눌린 키 | PRESS_BIT) - 누름 표시는 지움"""
+        value = self.held[player] | self.pressed[player]
+        self.pressed[player] = 0
+        return value
+
+    def take_character(self):
+        character, self.character = self.character, 0
+        return character
+
+
+def key_events(player, value, held):
+    """입력 바이트를 직전 눌린 키(held)와 비교해 키 이벤트로 변환
+
+    Returns: (events, 새 held)
+    """
+    events = []
+    new_held = value & ~PRESS_BIT
+    changed = new_held ^ held
+    for i, (_, codes) in enumerate(PLAYER_KEYS[player]):
+        if changed & (1 << i):
+            events.append(_key_event(pico2d.SDL_KEYDOWN if new_held & (1 << i) else pico2d.SDL_KEYUP, codes[0]))
+    # 상태 변화 없이 공격 키를 누른 스텝 (키 반복, 한 스텝 안에서 눌렀다 뗌) - 연계 입력만 다시 만듦
+    if value & PRESS_BIT and not (changed & new_held & _ATTACK_BITS[player]):
+        attacks = [i for i in range(len(PLAYER_KEYS[player])) if (1 << i) & _ATTACK_BITS[player]]
+        held_attacks = [i for i in attacks if new_held & (1 << i)]
+        code = PLAYER_KEYS[player][(held_attacks or attacks)[0]][1][0]
+        events.append(_key_event(pico2d.SDL_KEYDOWN, code))
+        if not held_attacks:
+            events.append(_key_event(pico2d.SDL_KEYUP, code))
+    return events, new_held
+
+
+def character_event(character):
+    """캐릭터 변경 키 이벤트 목록 (character: CHARACTER_KEYS 번호, 0이면 없음)"""
+    return [_key_event(pico2d.SDL_KEYDOWN, CHARACTER_KEYS[character - 1][0])] if character else []
+
+
+def save_replay(path, header, records, segments, interval):
+    """리플레이 파일 쓰기 - segments: [{'step', 'held', 'snapshot', 'digest'}] (구간 시작 순서)"""
+    header_bytes = json.dumps(header).encode('utf-8')
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index = []
+    with open(path, 'wb') as f:
+        f.write(struct.pack(PREFIX, MAGIC, VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for number, segment in enumerate(segments):
+            start = segment['step']
+            keyframe = gameSnapshot.pack(segment['snapshot'], segments[0]['snapshot'] if number else None)
+            chunk = zlib.compress(_planar(records[start * RECORD_SIZE:(start + interval) * RECORD_SIZE]), 9)
+            keyframe_offset = f.tell()
+            f.write(keyframe)
+            f.write(chunk)
+            index.append([start, keyframe_offset, len(keyframe), keyframe_offset + len(keyframe), len(chunk),
+                          segment['held'], segment['digest']])
+        index_bytes = zlib.compress(json.dumps({'interval': interval, 'segments': index}).encode('utf-8'), 9)
+        index_offset = f.tell()
+        f.write(index_bytes)
+        f.write(struct.pack(FOOTER, index_offset, len(index_bytes), INDEX_MAGIC))
+
+
+def _planar(records):
+    """스텝별 기록 -> 바이트 위치별로 모은 기록"""
+    return b''.join(bytes(records[i::RECORD_SIZE]) for i in range(RECORD_SIZE))
+
+
+def _interleaved(planar):
+    """_planar의 역변환"""
+    steps = len(planar) // RECORD_SIZE
+    records = bytearray(len(planar))
+    for i in range(RECORD_SIZE):
+        records[i::RECORD_SIZE] = planar[i * steps:(i + 1) * steps]
+    return bytes(records)
+
+
+def load_replay(path):
+    """리플레이 파일 읽기 (구간 기록/키프레임은 필요할 때 압축 해제)
+
+    Returns: (header, index, data)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, header_size = struct.unpack_from(PREFIX, data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay")
+    offset = struct.calcsize(PREFIX)
+    header = json.loads(data[offset:offset + header_size].decode('utf-8'))
+    index_offset, index_size, index_magic = struct.unpack_from(FOOTER, data, len(data) - struct.calcsize(FOOTER))
+    if index_magic != INDEX_MAGIC:
+        raise ValueError(f"{path} is truncated (no index)")
+    index = json.loads(zlib.decompress(data[index_offset:index_offset + index_size]).decode('utf-8'))
+    return header, index, data
+
+
+class ReplayRecorder:
+    """매 스텝 키 이벤트를 추적하고, 대전 중에는 스텝 기록과 키프레임을 모음"""
+
+    def __init__(self, directory=None, interval=None):
+        self.directory = pathlib.Path(directory or config.REPLAY_DIR)
+        self.interval = interval or config.REPLAY_KEYFRAME_INTERVAL
+        self.keys = KeyTracker()  # 대전 밖에서도 계속 추적
+        self.recording = False
+        self.header = None
+        self.records = bytearray()
+        self.segments = []
+        self.digest = None
+        self.last_path = None
+
+    def observe(self, events):
+        """이번 스텝의 입력 이벤트 반영 - 기록 중이면 스텝 기록 추가"""
+        self.keys.observe(events)
+        record = (self.keys.take(0), self.keys.take(1), self.keys.take_character())
+        if self.recording:
+            self.records.extend(record)
+
+    def start(self, game, p1_character, p2_character):
+        """대전 기록 시작 (캐릭터 선택이 끝난 스텝에서 호출, 첫 키프레임은 이 스텝이 끝난 뒤)"""
+        self.recording = True
+        self.records = bytearray()
+        self.segments = []
+        self.digest = None
+        self.header = {
+            'p1': p1_character,
+            'p2': p2_character,
+            'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'config': {name: getattr(config, name) for name in CONFIG_KEYS},
+        }
+
+    def after_step(self, game):
+        """스텝이 끝난 뒤 상태 해시 갱신, 구간 시작이면 키프레임 저장 - 게임이 끝나면 저장"""
+        if not self.recording:
+            return
+        steps = len(self.records) // RECORD_SIZE
+        if steps:
+            self.digest.update(state_signature(game))
+        if game.game_over:
+            self.finish(game)
+            return
+        if steps % self.interval == 0:
+            if self.segments:
+                self.segments[-1]['digest'] = self.digest.hexdigest()
+            self.segments.append({'step': steps, 'held': list(self.keys.held),
+                                  'snapshot': gameSnapshot.capture(game)})
+            self.digest = hashlib.sha1()
+
+    def finish(self, game, complete=True):
+        """기록 종료 후 백그라운드 저장 (중간에 종료하면 complete=False로 남은 부분까지 저장)"""
+        if not self.recording:
+            return
+        self.recording = False
+        steps = len(self.records) // RECORD_SIZE
+        if not steps:
+            return
+        # 마지막 구간 마무리 - 기록이 없는 구간(마지막 스텝에서 막 시작한 키프레임)은 버림
+        segments = [segment for segment in self.segments if segment['step'] < steps]
+        segments[-1]['digest'] = self.digest.hexdigest()
+        play_scene = game.sceneManager.play_scene
+        self.header.update({
+            'steps': steps,
+            'complete': complete,
+            'winner': play_scene.get_winner() if complete else None,
+            'score': [play_scene.player1_rounds_won, play_scene.player2_rounds_won],
+        })
+        name = f"{time.strftime('%Y%m%d_%H%M%S')}_{self.header['p1']}_vs_{self.header['p2']}"
+        path = self.directory / f'{name}.rpl'
+        index = 1
+        while path.exists() or path == self.last_path:
+            index += 1
+            path = self.directory / f'{name}_{index}.rpl'
+        self.last_path = path
+        # 압축/파일 쓰기는 프레임 루프 밖에서 (인터프리터 종료 시에도 끝까지 쓰도록 daemon 아님)
+        threading.Thread(target=self._save, args=(path, self.header, bytes(self.records), segments, self.interval),
+                         name='ReplayWriter').start()
+
+    @staticmethod
+    def _save(path, header, records, segments, interval):
+        try:
+            save_replay(path, header, records, segments, interval)
+            print(f"Replay saved: {path} ({path.stat().st_size} bytes, {header['steps']} steps, "
+                  f"{len(segments)} keyframes)")
+        except OSError as e:
+            print(f"Warning: Cannot write replay {path}: {e}")
+
+
+class ReplayPlayer:
+    """리플레이 재생 입력 - renderBackend 입력 스크립트로 사용 (next_events)"""
+
+    def __init__(self, header, index, data):
+        self.header = header
+        self.data = data
+        self.interval = index['interval']
+        self.segments = index['segments']
+        self.steps = header['steps']
+        self.step = 0
+        self.held = [0, 0]
+        self.segment = None  # 압축을 푼 구간 번호
+        self.reference = None  # 첫 키프레임 스냅샷 (나머지 키프레임의 압축 기준)
+        self.records = b''
+        self.digest = None
+        self.checked_step = 0  # 상태 해시를 반영한 마지막 스텝
+        self.start_step = 0  # 재생(또는 탐색)을 시작한 스텝
+        self.result = None  # 재생이 끝나면 True(일치)/False(불일치)
+
+    @classmethod
+    def load(cls, path):
+        return cls(*load_replay(path))
+
+    def apply_config(self):
+        """기록 당시의 게임 규칙 상수 적용 (Game 생성 전에 호출)"""
+        for name, value in self.header['config'].items():
+            setattr(config, name, value)
+        moveRegistry.rebuild()
+        frameData.build()
+
+    def begin(self, game):
+        """기록을 시작한 시점의 대전 상태 만들기 (캐릭터 선택 완료 직후 = 첫 키프레임)"""
+        title_music = game.sceneManager.title_scene.bgm
+        if title_music:
+            title_music.stop()
+        game.start_match(self.header['p1'], self.header['p2'])
+        game.assetLoader.finish_all()  # 최대 속도 재생에서도 스프라이트 로딩 시점이 결과에 영향을 주지 않도록
+        self._restore_keyframe(game, 0)
+
+    def seek(self, game, step):
+        """step 스텝까지 재생한 상태로 이동 - 앞 키프레임 복원 후 최대 한 구간만 다시 시뮬레이션"""
+        step = max(0, min(step, self.steps))
+        self._restore_keyframe(game, min(step // self.interval, len(self.segments) - 1))
+        while self.step < step and game.running:
+            game.step()
+        game.spriteManager.snap_positions()
+
+    def _restore_keyframe(self, game, segment):
+        start, offset, size, _, _, held, _ = self.segments[segment]
+        reference = None
+        if segment:
+            if self.reference is None:
+                _, first_offset, first_size, _, _, _, _ = self.segments[0]
+                self.reference = gameSnapshot.unpack(self.data[first_offset:first_offset + first_size])
+            reference = self.reference
+        gameSnapshot.restore(game, gameSnapshot.unpack(self.data[offset:offset + size], reference))
+        self.step = self.checked_step = self.start_step = start
+        self.held = list(held)
+        self.digest = hashlib.sha1()
+        self.result = None
+
+    def _load_segment(self, segment):
+        _, _, _, offset, size, _, _ = self.segments[segment]
+        self.records = _interleaved(zlib.decompress(self.data[offset:offset + size]))
+        self.segment = segment
+
+    def finished(self):
+        return self.step >= self.steps
+
+    def next_events(self):
+        """다음 스텝 기록을 키 이벤트로 변환 (끝나면 빈 목록)"""
+        if self.finished():
+            return []
+        segment, position = divmod(self.step, self.interval)
+        if segment != self.segment:
+            self._load_segment(segment)
+        record = self.records[position * RECORD_SIZE:(position + 1) * RECORD_SIZE]
+        self.step += 1
+
+        events = []
+        for player in (0, 1):
+            player_events, self.held[player] = key_events(player, record[player], self.held[player])
+            events.extend(player_events)
+        return events + character_event(record[2])
+
+    def after_step(self, game):
+        """재생한 스텝의 상태 해시 갱신 - 구간이 끝날 때마다 기록과 비교, 마지막 스텝이면 결과 출력"""
+        if self.digest is None or self.step == self.checked_step:
+            return
+        self.checked_step = self.step
+        self.digest.update(state_signature(game))
+        if self.step % self.interval and not self.finished():
+            return
+
+        segment = (self.step - 1) // self.interval
+        if self.digest.hexdigest() != self.segments[segment][6] and self.result is None:
+            self.result = False
+            print(f"Replay diverged in steps {segment * self.interval}-{self.step}")
+        self.digest = hashlib.sha1()
+        if self.finished():
+            play_scene = game.sceneManager.play_scene
+            score = f"{play_scene.player1_rounds_won}-{play_scene.player2_rounds_won}"
+            if self.result is None:
+                self.result = True
+                print(f"Replay reproduced exactly: steps {self.start_step}-{self.steps}, score {score}")
+            else:
+                print(f"Replay finished with score {score} (recorded {self.header['score'][0]}-{self.header['score'][1]})")
+
+
+def _key_event(event_type, key):
+    event = pico2d.Event(event_type)
+    event.key = key
+    return event
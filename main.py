@@ -1,16 +1,124 @@
+import argparse
+import time
+
+import config
 import game
-import pico2d
+import inputReplay
+import playerStateMachine
+import renderBackend
+import rollbackNet
+from startupProfiler import profiler
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--profile-startup', nargs='?', const='startup_profile.json', default=None, metavar='REPORT',
+                    help='시작 과정을 측정해 JSON 보고서로 저장하고 종료 (기본: startup_profile.json)')
+parser.add_argument('--fps', type=int, default=None, metavar='FPS',
+                    help='목표 렌더 fps (60/120/144, 0이면 제한 없음, 기본: config.TARGET_FPS)')
+parser.add_argument('--headless', action='store_true',
+                    help='창/오디오 없이 입력 스크립트로 최대 속도 실행 후 처리량 출력')
+parser.add_argument('--steps', type=int, default=36000,
+                    help='헤드리스 모드에서 실행할 시뮬레이션 스텝 수 (기본: 36000 = 게임 시간 10분)')
+parser.add_argument('--input-script', default=None, metavar='JSON',
+                    help='헤드리스 모드 입력 스크립트 ([[스텝, "down"/"up", 키 이름], ...], 기본: 무작위 데모 입력)')
+parser.add_argument('--seed', type=int, default=0, help='데모 입력 스크립트의 난수 시드')
+parser.add_argument('--no-render', action='store_true', help='헤드리스 모드에서 렌더링 호출도 생략')
+parser.add_argument('--replay', default=None, metavar='RPL', help='대전 리플레이 파일 재생 (inputReplay.py)')
+parser.add_argument('--seek', type=int, default=0, metavar='STEP', help='리플레이를 이 스텝부터 재생 (가까운 키프레임에서 이동)')
+parser.add_argument('--uncapped', action='store_true', help='리플레이를 렌더링 없이 최대 속도로 재생 후 검증 결과 출력')
+parser.add_argument('--net-side', type=int, choices=(0, 1), default=None,
+                    help='롤백 넷플레이 (rollbackNet.py) - 0이면 Player1, 1이면 Player2 조작')
+parser.add_argument('--net-port', type=int, default=7000, help='넷플레이 로컬 UDP 포트')
+parser.add_argument('--net-peer', default='127.0.0.1:7001', metavar='HOST:PORT', help='넷플레이 상대 주소')
+parser.add_argument('--net-frames', type=int, default=0,
+                    help='넷플레이를 이 프레임에서 끝냄 (0이면 매치가 끝날 때까지, 헤드리스 테스트용)')
+parser.add_argument('--p1', default='fighter', help='넷플레이 Player1 캐릭터')
+parser.add_argument('--p2', default='fighter', help='넷플레이 Player2 캐릭터')
+parser.add_argument('--fsm-stats', action='store_true',
+                    help='플레이어 행동 상태별 머문 스텝/처리 시간과 전이 횟수를 세어 종료 시 출력 (playerStateMachine.py)')
+args = parser.parse_args()
+
+replay = None
+if args.replay:
+    replay = inputReplay.ReplayPlayer.load(args.replay)
+    replay.apply_config()
+    config.RECORD_REPLAYS = False  # 재생하는 매치는 다시 기록하지 않음
+    if args.uncapped:
+        renderBackend.enable_headless(replay)
+    else:
+        renderBackend.set_input_script(replay)
+
+net = None
+if args.net_side is not None:
+    config.RECORD_REPLAYS = False  # 넷플레이 매치는 기록하지 않음
+    net = rollbackNet.RollbackSession(args.net_side, args.net_port, rollbackNet.parse_address(args.net_peer),
+                                      args.p1, args.p2, args.net_frames)
+
+if args.fps is not None:
+    config.TARGET_FPS = args.fps
+
+if args.headless:
+    if args.input_script:
+        script = renderBackend.InputScript.load(args.input_script)
+    else:
+        script = renderBackend.InputScript.demo(args.steps, args.seed)
+    renderBackend.enable_headless(script)
 
+if args.profile_startup:
+    profiler.enable()
 
+if args.fsm_stats:
+    playerStateMachine.stats.enable()
 
-game = game.Game()
-game.initialize()
+with profiler.section('Game.__init__'):
+    game = game.Game()
+with profiler.section('Game.initialize'):
+    game.initialize()
+
+if replay:
+    game.replay_player = replay
+    replay.begin(game)
+    if args.seek:
+        replay.seek(game, args.seek)
+
+if net:
+    game.net_session = net
+    net.begin(game)
+
+if args.profile_startup:
+    game.profile_startup(args.profile_startup)
+    game.running = False  # 측정만 하고 바로 종료
+
+def run_headless():
+    """헤드리스 실행 후 처리량 출력"""
+    start = time.perf_counter()
+    steps = game.run_headless(args.steps, render=not args.no_render)
+    elapsed = time.perf_counter() - start
+    print(f"Headless: {steps} steps in {elapsed:.2f} s ({steps / elapsed:.0f} steps/s, "
+          f"{steps * game.sim_dt / elapsed:.1f}x real time)")
+
+def run_replay_uncapped():
+    """리플레이를 렌더링 없이 최대 속도로 재생"""
+    start = time.perf_counter()
+    steps = game.run_headless(replay.steps - replay.step, render=False)
+    elapsed = time.perf_counter() - start
+    print(f"Replay: {steps} steps in {elapsed:.2f} s ({steps / elapsed:.0f} steps/s, "
+          f"{steps * game.sim_dt / elapsed:.1f}x real time)")
 
 def main():
-    while game.running:
+    if args.headless and not net and game.running:
+        run_headless()
+    elif replay and args.uncapped and game.running:
+        run_replay_uncapped()
+
+    # 헤드리스 넷플레이도 실제 시간으로 진행 (입력 스크립트가 봇 역할)
+    while game.running and (net or not args.headless) and not (replay and args.uncapped):
         game.run()
 
-    pico2d.close_canvas()
+    if args.fsm_stats:
+        playerStateMachine.stats.report(game.sim_dt)
+    game.shutdown()
+    renderBackend.close_canvas()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
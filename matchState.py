@@ -0,0 +1,733 @@
+"""
+순수 대전 시뮬레이션 코어
+Player/Character/SpriteManager/PlayScene/Game에 흩어진 대전 규칙(이동, 가드, 연계, 띄우기 물리, 타격 판정, 라운드)을
+MatchState 하나와 step(state, p1_input, p2_input) 함수로 재현 (pico2d 없이 실행, 분석/리플레이/스냅샷용)
+
+- 1스텝 = 고정 60Hz (game.py의 sim_dt와 같은 값)
+- 같은 초기 상태와 같은 입력이면 항상 비트 단위로 같은 결과 (난수, 시각, 딕셔너리 순서에 의존하지 않음)
+- 입력은 스텝마다 눌려 있는 버튼 비트마스크 (BUTTON_*)
+  키를 누르고 떼는 변화는 IOManager처럼 카운트다운/HP 0 동안에는 무시됨 (그동안 누른 키는 다시 눌러야 인식)
+- 애니메이션 프레임 수는 FRAME_COUNTS (시작할 때 assetManifest에서 읽음 - 스프라이트를 바꾸면 같이 따라감)
+- 스프라이트가 없는 애니메이션(priest의 rageSkill 등)은 게임과 마찬가지로 프레임이 진행되지 않음
+- 애니메이션 시간은 animationController의 정수 단위 (SpriteManager와 같은 프레임 경계, 넘친 시간은 다음 애니메이션으로 이어감)
+- 공격 판정 구간과 히트박스는 frameData (공격 시작 후 스텝 수 기준)
+
+실행 (프로젝트 루트에서, 무작위 입력으로 처리량 측정 및 결정성 확인):
+    python matchState.py [--steps 100000] [--seed 0]
+"""
+import hashlib
+import math
+
+import animationController
+import assetManifest
+import config
+import frameData
+import moveRegistry
+from handle_collision import CollisionHandler
+
+SIM_DT = 1.0 / 60.0  # 시뮬레이션 스텝 (초)
+STEP_UNITS = animationController.to_units(SIM_DT)  # 시뮬레이션 스텝 (애니메이션 시간 단위)
+
+# 입력 버튼 비트
+BUTTON_UP = 1
+BUTTON_DOWN = 2
+BUTTON_LEFT = 4
+BUTTON_RIGHT = 8
+BUTTON_FAST = 16
+BUTTON_STRONG = 32
+BUTTON_RAGE = 64
+DIRECTION_BUTTONS = BUTTON_UP | BUTTON_DOWN | BUTTON_LEFT | BUTTON_RIGHT
+ATTACK_BUTTONS = BUTTON_FAST | BUTTON_STRONG  # 누르는 순간 연계 입력이 되는 버튼
+
+# IOManager 키 이름 -> 버튼 (player2는 rage 키가 공격으로 연결되어 있지 않음)
+PLAYER1_KEYS = {'w': BUTTON_UP, 's': BUTTON_DOWN, 'a': BUTTON_LEFT, 'd': BUTTON_RIGHT,
+                'f': BUTTON_FAST, 'g': BUTTON_STRONG, 'h': BUTTON_RAGE}
+PLAYER2_KEYS = {'up': BUTTON_UP, 'down': BUTTON_DOWN, 'left': BUTTON_LEFT, 'right': BUTTON_RIGHT,
+                'slash': BUTTON_FAST, 'shift': BUTTON_STRONG}
+
+
+# 애니메이션 전체 재생 시간, 캐릭터별 사용 가능한 공격, 연계, 가드 위치는 moveRegistry의 표를 그대로 사용
+ANIMATION_DURATIONS = moveRegistry.ANIMATION_DURATIONS
+LOOPING_STATES = ('Idle', 'Walk', 'BackWalk')
+_FRAME_UNITS = {}  # (상태, 프레임 수, 고정 프레임 간격) -> 프레임 간격 (_frame_units)
+
+AVAILABLE_ATTACKS = moveRegistry.AVAILABLE_ATTACKS
+COMBO_STARTERS = moveRegistry.COMBO_STARTERS  # 시작하자마자 연계 가능한 공격
+GUARD_POSITIONS = moveRegistry.GUARD_HEIGHTS
+
+# 연계 입력 조건: 현재 상태 -> (연계 입력 이름, 눌려 있어야 하는 공격 버튼, 위 버튼 필요 여부)
+COMBO_INPUTS = {
+    'fastMiddleATK': ('fastMiddleATK_combo', BUTTON_FAST, False),
+    'fastMiddleATK2': ('fastMiddleATK_combo', BUTTON_FAST, False),
+    'strongMiddleATK': ('strongMiddleATK_combo', BUTTON_STRONG, False),
+    'strongUpperATK': ('strongUpperATK_combo', BUTTON_STRONG, True),
+}
+
+MOVE_SPEED = 300.0  # 픽셀/초 (모든 캐릭터 동일)
+MAX_HP = 100
+GUARD_COUNTER_WINDOW = 0.25  # 가드 후 반격 가능 시간 (초)
+AIR_DAMPING = 6.0  # 공중 수평 감속 계수
+COUNTDOWN_STEPS = 5  # Ready, 3, 2, 1, Fight!
+COUNTDOWN_DURATION = 1.0  # 카운트당 시간 (초)
+ROUND_END_DELAY = 1.8  # 라운드 종료 후 다음 라운드까지 대기 (초)
+WINS_NEEDED = 2
+
+
+def load_frame_counts(manifest=None):
+    """에셋 매니페스트에서 캐릭터별 애니메이션 프레임 수 읽기 (기본: 게임과 같은 assetManifest.get_manifest())"""
+    if manifest is None:
+        manifest = assetManifest.get_manifest()
+    return {character_type: {state: len(paths) for state, paths in entry['animations'].items()}
+            for character_type, entry in manifest['characters'].items()}
+
+
+# 캐릭터별 애니메이션 프레임 수 (SpriteManager가 로딩하는 스프라이트 수와 같은 값)
+FRAME_COUNTS = load_frame_counts()
+
+
+def buttons_from_keys(keys, key_map):
+    """IOManager 키 상태 딕셔너리를 버튼 비트마스크로 변환 (key_map: PLAYER1_KEYS 또는 PLAYER2_KEYS)"""
+    buttons = 0
+    for name, bit in key_map.items():
+        if keys.get(name):
+            buttons |= bit
+    return buttons
+
+
+class FighterState:
+    """플레이어 한 명의 게임 규칙 상태 (Player + Character + SpriteManager의 플레이어별 애니메이션 상태)"""
+
+    def __init__(self, character='thief', x=0.0, facing_right=True):
+        self.character = character
+        self.x = x
+        self.y = config.GROUND_Y
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.is_grounded = True
+        self.facing_right = facing_right
+        self.hp = MAX_HP
+
+        self.state = 'Idle'
+        self.position_state = 'Middle'
+        self.is_attacking = False
+        self.is_hit = False
+        self.hit_type = None  # 'fast', 'strong', 'airborne', 'down'
+        self.can_get_up = False
+        self.hit_recovery_input = False
+        self.can_combo = False
+        self.combo_reserved = False
+        self.is_guarding = False
+        self.guard_animation_reset = False
+        self.guard_counter_timer = 0.0
+        self.can_attack_after_guard = False
+        self.attack_hit_processed = False
+        self.can_process_hit = False
+        self.move_frame = 0  # 공격 시작 후 프레임 수 (frameData 조회용)
+
+        # 애니메이션 (SpriteManager) - 공격 판정 시점, 연계, 피격/가드 종료를 결정
+        self.anim_state = 'Idle'
+        self.anim_frame = 0
+        self.anim_elapsed = 0  # 현재 프레임 시작 후 지난 시간 (animationController 단위)
+
+        # 입력 (IOManager가 인식한 키 상태, 직전 스텝에 실제로 눌려 있던 버튼)
+        self.keys = 0
+        self.buttons = 0
+
+    def copy(self):
+        fighter = FighterState.__new__(FighterState)
+        fighter.__dict__.update(self.__dict__)
+        return fighter
+
+    def get_bb(self):
+        """피격 바운딩 박스 (Player.get_bb와 같음)"""
+        is_down = (self.hit_type == 'down') or (self.is_hit and not self.is_grounded and self.hit_type == 'airborne')
+        if is_down:
+            bb_width = 70 * 1.5
+            bb_height = 25 * 1.5
+            adjusted_x = self.x
+            adjusted_y = self.y - (15 * 1.5)
+        else:
+            bb_width = 40 * 1.5
+            bb_height = 50 * 1.5
+            adjusted_x = self.x - (30 * 1.5) if self.facing_right else self.x + (30 * 1.5)
+            adjusted_y = self.y - (50 * 1.5)
+        return adjusted_x - bb_width, adjusted_y - bb_height, adjusted_x + bb_width, adjusted_y + bb_height
+
+    def get_attack_range_bb(self):
+        """공격 범위 바운딩 박스 (Player.get_attack_range_bb와 같음, 판정 프레임이 아니면 None)"""
+        box = frameData.hitbox(self.character, moveRegistry.lookup(self.state).id, self.move_frame)
+        if box is None:
+            return None
+        return frameData.attack_box(box, self.get_bb(), self.facing_right)
+
+
+class MatchState:
+    """한 매치 전체 상태 - 두 플레이어 + 카운트다운/라운드/승패 (플레이 씬 진입 직후부터)"""
+
+    def __init__(self, p1_character='thief', p2_character='priest'):
+        self.step_count = 0
+        self.p1 = FighterState(p1_character, config.windowWidth * 0.35, True)
+        self.p2 = FighterState(p2_character, config.windowWidth * 0.65, False)
+
+        self.countdown_active = True
+        self.countdown_timer = 0.0
+        self.countdown_index = 0
+        self.round_over = False
+        self.round_end_timer = 0.0
+        self.player1_rounds_won = 0
+        self.player2_rounds_won = 0
+        self.game_over = False
+        self.winner = None  # 'Player1' 또는 'Player2'
+
+    def copy(self):
+        state = MatchState.__new__(MatchState)
+        state.__dict__.update(self.__dict__)
+        state.p1 = self.p1.copy()
+        state.p2 = self.p2.copy()
+        return state
+
+    def values(self):
+        """모든 상태 값을 고정된 순서의 튜플로 반환 (비교/해시용)"""
+        match = tuple(value for name, value in self.__dict__.items() if name not in ('p1', 'p2'))
+        return match + tuple(self.p1.__dict__.values()) + tuple(self.p2.__dict__.values())
+
+    def digest(self):
+        """상태 해시 - 실수는 repr로 정확히 표현되므로 값이 비트 단위로 같을 때만 같음"""
+        return hashlib.sha1(repr(self.values()).encode('utf-8')).hexdigest()
+
+
+def step(state, p1_input, p2_input, frame_counts=FRAME_COUNTS):
+    """1스텝 진행한 새 상태 반환 (state는 바꾸지 않음)"""
+    next_state = state.copy()
+    advance(next_state, p1_input, p2_input, frame_counts)
+    return next_state
+
+
+def advance(state, p1_input, p2_input, frame_counts=FRAME_COUNTS):
+    """state를 제자리에서 1스텝 진행 (step의 복사 없는 버전, 긴 분석 루프용)"""
+    p1, p2 = state.p1, state.p2
+    if state.game_over:
+        p1.buttons, p2.buttons = p1_input, p2_input
+        return
+    state.step_count += 1
+
+    # 카운트다운 중에는 게임 로직을 멈춤 (그동안의 키 변화는 인식되지 않음)
+    if state.countdown_active:
+        p1.buttons, p2.buttons = p1_input, p2_input
+        state.countdown_timer += SIM_DT
+        if state.countdown_timer >= COUNTDOWN_DURATION:
+            state.countdown_timer = 0.0
+            state.countdown_index += 1
+            if state.countdown_index >= COUNTDOWN_STEPS:
+                state.countdown_active = False
+                state.countdown_index = 0
+        return
+
+    p1_command = _read_input(p1, p1_input)
+    p2_command = _read_input(p2, p2_input)
+    _update_fighter(p1, SIM_DT, p1_command, p2)
+    _update_fighter(p2, SIM_DT, p2_command, p1)
+
+    _check_hit(p1, p2)
+    _check_hit(p2, p1)
+
+    # 라운드 종료 체크 (3판 2선승제)
+    if not state.round_over and not state.game_over:
+        if p1.hp <= 0:
+            state.player2_rounds_won += 1
+            state.round_over = True
+        elif p2.hp <= 0:
+            state.player1_rounds_won += 1
+            state.round_over = True
+        if state.player1_rounds_won >= WINS_NEEDED:
+            state.game_over = True
+            state.winner = 'Player1'
+        elif state.player2_rounds_won >= WINS_NEEDED:
+            state.game_over = True
+            state.winner = 'Player2'
+
+    if state.round_over and not state.game_over:
+        state.round_end_timer += SIM_DT
+        if state.round_end_timer >= ROUND_END_DELAY:
+            reset_round(state)
+            state.round_end_timer = 0.0
+
+    _update_animation(p1, STEP_UNITS, frame_counts)
+    _update_animation(p2, STEP_UNITS, frame_counts)
+
+    # 서로 바라보도록 방향 갱신
+    p1.facing_right = p1.x < p2.x
+    p2.facing_right = not p1.facing_right
+
+
+def reset_round(state):
+    """다음 라운드 준비 - 위치/HP/상태 초기화 후 카운트다운 재시작 (Game.reset_round)"""
+    for fighter, ratio, facing_right in ((state.p1, 0.35, True), (state.p2, 0.65, False)):
+        fighter.hp = MAX_HP
+        fighter.x = config.windowWidth * ratio
+        fighter.y = config.GROUND_Y
+        fighter.state = 'Idle'
+        fighter.is_attacking = False
+        fighter.is_hit = False
+        fighter.is_grounded = True
+        fighter.velocity_x = 0.0
+        fighter.velocity_y = 0.0
+        fighter.position_state = 'Middle'
+        fighter.hit_recovery_input = False
+        fighter.can_combo = False
+        fighter.combo_reserved = False
+        fighter.is_guarding = False
+        fighter.attack_hit_processed = False
+        fighter.can_process_hit = False
+        fighter.move_frame = 0
+        fighter.can_attack_after_guard = False
+        fighter.guard_counter_timer = 0.0
+        fighter.facing_right = facing_right
+        fighter.hit_type = None
+        fighter.can_get_up = False
+        fighter.anim_state = 'Idle'
+        fighter.anim_frame = 0
+        fighter.anim_elapsed = 0
+
+    state.round_over = False
+    state.countdown_active = True
+    state.countdown_timer = 0.0
+    state.countdown_index = 0
+    CollisionHandler.prevent_overlap_on_spawn(state.p1, state.p2)
+
+
+def _read_input(fighter, buttons):
+    """버튼 입력을 행동 명령으로 변환 (IOManager) - HP가 0 이하면 None
+
+    Returns: (이동, 공격, 연계, 위치 상태, 기상 입력)
+    """
+    changed = buttons ^ fighter.buttons
+    fighter.buttons = buttons
+    if fighter.hp <= 0:
+        return None
+
+    pressed = changed & buttons
+    keys = fighter.keys = (fighter.keys & ~changed) | pressed
+
+    if keys & BUTTON_UP:
+        move = 'up'
+    elif keys & BUTTON_DOWN:
+        move = 'down'
+    elif keys & BUTTON_LEFT:
+        move = 'left'
+    elif keys & BUTTON_RIGHT:
+        move = 'right'
+    else:
+        move = None
+
+    attack = _attack_for_keys(keys, rage=True)
+
+    # 공격 키를 누른 스텝에만 현재 상태에 맞는 키 조합이면 연계 입력
+    combo = None
+    if pressed & ATTACK_BUTTONS and fighter.state in COMBO_INPUTS:
+        name, button, needs_up = COMBO_INPUTS[fighter.state]
+        if keys & button and (keys & BUTTON_UP if needs_up else not keys & (BUTTON_UP | BUTTON_DOWN)):
+            combo = name
+
+    if keys & BUTTON_UP:
+        position_state = 'High'
+    elif keys & BUTTON_DOWN:
+        position_state = 'Low'
+    else:
+        position_state = 'Middle'
+
+    return move, attack, combo, position_state, bool(keys & DIRECTION_BUTTONS)
+
+
+def _attack_for_keys(keys, rage):
+    """눌린 키 조합의 공격 이름 (없으면 None)"""
+    if rage and keys & BUTTON_RAGE:
+        return 'rageSkill'
+    if keys & BUTTON_FAST:
+        strength = 'fast'
+    elif keys & BUTTON_STRONG:
+        strength = 'strong'
+    else:
+        return None
+    if keys & BUTTON_UP:
+        return strength + 'UpperATK'
+    if keys & BUTTON_DOWN:
+        return strength + 'LowerATK'
+    return strength + 'MiddleATK'
+
+
+def _start_attack(fighter, attack):
+    fighter.state = attack
+    fighter.is_attacking = True
+    fighter.attack_hit_processed = False
+    fighter.can_combo = attack in COMBO_STARTERS
+    fighter.combo_reserved = False
+
+
+def _cancel_guard(fighter):
+    fighter.is_guarding = False
+    fighter.can_attack_after_guard = False
+    fighter.guard_counter_timer = 0.0
+    fighter.guard_animation_reset = False
+
+
+def _apply_gravity(fighter, dt):
+    """중력/공중 이동 (Player.apply_gravity)"""
+    if not fighter.is_grounded:
+        fighter.velocity_y -= config.GRAVITY * dt
+        old_y = fighter.y
+        fighter.x += fighter.velocity_x * dt
+        CollisionHandler.clamp_to_screen(fighter)
+        fighter.velocity_x *= math.exp(-AIR_DAMPING * dt)
+        fighter.y += fighter.velocity_y * dt
+
+        if fighter.y <= config.GROUND_Y:
+            fighter.y = config.GROUND_Y
+            fighter.velocity_y = 0.0
+            fighter.velocity_x = 0.0
+            fighter.is_grounded = True
+            # 띄워진 뒤 착지하면 down 상태 (기상 가능)
+            if fighter.is_hit and fighter.hit_type == 'airborne' and old_y > config.GROUND_Y:
+                fighter.hit_type = 'down'
+                fighter.can_get_up = True
+    elif fighter.y > config.GROUND_Y:
+        fighter.is_grounded = False
+
+
+def _update_fighter(fighter, dt, command, other):
+    """플레이어 1스텝 (Player.update)"""
+    move, attack, combo, position_state, getup = command or (None, None, None, fighter.position_state, False)
+    fighter.position_state = position_state
+
+    if fighter.guard_counter_timer > 0.0:
+        fighter.guard_counter_timer = max(0.0, fighter.guard_counter_timer - dt)
+        if fighter.guard_counter_timer == 0.0:
+            fighter.can_attack_after_guard = False
+
+    _apply_gravity(fighter, dt)
+
+    # 가드 중 공격 입력 - 가드 취소 후 즉시 공격
+    if fighter.is_guarding and not fighter.is_attacking and attack and attack in AVAILABLE_ATTACKS[fighter.character]:
+        _cancel_guard(fighter)
+        _start_attack(fighter, attack)
+        return
+    if fighter.is_guarding:
+        fighter.state = 'guard'
+        return
+
+    # 기상 입력 (바닥에 누운 down 상태, strong 피격)
+    if fighter.is_hit and fighter.can_get_up and getup:
+        if (fighter.hit_type == 'down' and fighter.is_grounded) or fighter.hit_type == 'strong':
+            fighter.can_get_up = False
+            fighter.hit_recovery_input = True
+            return
+
+    if fighter.is_hit:
+        return
+
+    if combo and fighter.can_combo and not fighter.combo_reserved and COMBO_INPUTS[fighter.state][0] == combo:
+        fighter.combo_reserved = True
+        return
+
+    if not fighter.is_attacking and attack and attack in AVAILABLE_ATTACKS[fighter.character]:
+        _start_attack(fighter, attack)
+        return
+
+    if fighter.is_attacking or not fighter.is_grounded:
+        return
+
+    # 이동 - 상대 쪽으로 가면 Walk, 반대쪽이면 BackWalk
+    opponent_on_right = other.x > fighter.x
+    if move == 'right' or move == 'left':
+        step_x = MOVE_SPEED * dt
+        new_x = fighter.x + step_x if move == 'right' else fighter.x - step_x
+        toward = opponent_on_right == (move == 'right')
+        fighter.state = 'Walk' if toward else 'BackWalk'
+        fighter.facing_right = (move == 'right') == toward
+        fighter.x = CollisionHandler.safe_move_player(fighter, new_x, other)
+    elif not move:
+        fighter.state = 'Idle'
+        fighter.facing_right = opponent_on_right
+
+
+def _take_damage(fighter, damage, attack_state, attacker):
+    """피격 처리 - 공격 종류에 따른 피격 타입, Lower 공격/공중 추가타는 포물선으로 띄움 (Player.take_damage)"""
+    move = moveRegistry.lookup(attack_state)
+    was_airborne = fighter.hit_type == 'airborne' and not fighter.is_grounded
+    hit_type = move.hit_type
+
+    fighter.hp = max(0, fighter.hp - damage)
+    fighter.is_hit = True
+    fighter.hit_type = hit_type
+    fighter.can_get_up = hit_type == 'strong'
+    fighter.state = 'hit'
+
+    if move.launch is not None or was_airborne:
+        vy, vx_mag = move.launch or move.juggle
+
+        fighter.velocity_x = vx_mag if attacker.x < fighter.x else -vx_mag
+        fighter.velocity_y = vy
+        fighter.is_grounded = False
+        if not was_airborne:
+            fighter.y += 5
+
+    fighter.is_attacking = False
+    fighter.attack_hit_processed = True
+    fighter.can_process_hit = False
+    fighter.is_guarding = False
+    fighter.can_combo = False
+    fighter.combo_reserved = False
+
+
+def _start_guard(fighter):
+    """자동 가드 시작 또는 연장 (Player.start_guard)"""
+    if fighter.is_guarding:
+        fighter.guard_animation_reset = True
+    else:
+        fighter.is_guarding = True
+        fighter.guard_animation_reset = False
+    fighter.guard_counter_timer = GUARD_COUNTER_WINDOW
+    fighter.can_attack_after_guard = True
+    fighter.state = 'guard'
+
+
+def _try_counterattack(fighter):
+    """가드 직후 지금 눌린 공격 키로 즉시 반격 (Game._try_trigger_counterattack_from_input)"""
+    attack = _attack_for_keys(fighter.keys, rage=False)
+    if attack and attack in AVAILABLE_ATTACKS[fighter.character] and not fighter.is_attacking:
+        _cancel_guard(fighter)
+        _start_attack(fighter, attack)
+
+
+def _check_hit(attacker, target):
+    """공격 판정 - 공격 범위에 들어오면 가드 또는 피격 (Game.check_collision의 한 방향)"""
+    if not attacker.is_attacking or not attacker.can_process_hit or attacker.attack_hit_processed:
+        return
+
+    attack_state = attacker.state
+    move = moveRegistry.lookup(attack_state)
+    target_is_down = target.hit_type == 'down' and target.is_grounded
+    target_is_airborne = target.hit_type == 'airborne' and not target.is_grounded
+    can_hit = (not target.is_hit) or (move.height == 'lower' and target_is_down) or target_is_airborne
+    if not can_hit:
+        return
+
+    attack_bb = attacker.get_attack_range_bb()
+    if not attack_bb or not CollisionHandler.check_aabb_collision(attack_bb, target.get_bb()):
+        return
+
+    if target_is_airborne:
+        _take_damage(target, move.damage, attack_state, attacker)
+    elif (not target.is_attacking and not target.is_hit and
+          move.guard_height is not None and move.guard_height == target.position_state):
+        _start_guard(target)
+        _try_counterattack(target)
+    else:
+        _take_damage(target, move.damage, attack_state, attacker)
+
+    attacker.attack_hit_processed = True
+    attacker.can_process_hit = False
+
+
+def _frame_time(state, count):
+    """애니메이션 프레임 간격 (SpriteManager._get_frame_time_for_state)"""
+    frame_time = moveRegistry.lookup(state).frame_time
+    if frame_time is not None:
+        return frame_time
+    return ANIMATION_DURATIONS.get(state, 1.0) / count
+
+
+def _frame_units(state, count):
+    """애니메이션 프레임 간격 (animationController 단위, config를 바꿔 rebuild해도 맞도록 고정 간격까지 키로 사용)"""
+    key = (state, count, moveRegistry.lookup(state).frame_time)
+    units = _FRAME_UNITS.get(key)
+    if units is None:
+        units = _FRAME_UNITS[key] = animationController.to_units(_frame_time(state, count))
+    return units
+
+
+def _end_attack(fighter):
+    fighter.is_attacking = False
+    fighter.can_process_hit = False
+    fighter.state = 'Idle'
+    fighter.can_combo = False
+    fighter.combo_reserved = False
+    fighter.anim_state = 'Idle'
+    fighter.anim_frame = 0
+
+
+def _end_hit(fighter):
+    """피격 애니메이션 완료 - 피격/공격 상태 초기화 (Player.reset_hit_state)"""
+    fighter.is_hit = False
+    fighter.hit_type = None
+    fighter.can_get_up = False
+    fighter.is_attacking = False
+    fighter.can_process_hit = False
+    fighter.attack_hit_processed = True
+    fighter.can_combo = False
+    fighter.combo_reserved = False
+    if fighter.state == 'hit':
+        fighter.state = 'Idle'
+    fighter.anim_state = 'Idle'
+    fighter.anim_frame = 0
+
+
+def _update_hit_frame(fighter):
+    """피격 애니메이션 한 프레임 진행 - 피격 타입별로 기상 입력 대기"""
+    hit_type = fighter.hit_type
+    frame = fighter.anim_frame
+    if hit_type == 'fast':
+        if frame < 1:
+            fighter.anim_frame = frame + 1
+        else:
+            _end_hit(fighter)
+    elif hit_type == 'strong':
+        if frame < 4:
+            fighter.anim_frame = frame + 1
+            if frame + 1 == 4:
+                fighter.can_get_up = True
+        elif frame == 4:
+            if fighter.hit_recovery_input:
+                fighter.anim_frame = 5
+                fighter.hit_recovery_input = False
+        elif frame == 5:
+            _end_hit(fighter)
+    elif hit_type == 'airborne':
+        fighter.anim_frame = 0
+    elif hit_type == 'down':
+        if frame < 4:
+            fighter.anim_frame = 4
+        elif frame == 4:
+            if fighter.hit_recovery_input:
+                fighter.anim_frame = 5
+                fighter.hit_recovery_input = False
+        elif frame == 5:
+            _end_hit(fighter)
+
+
+def _update_animation(fighter, units, frame_counts):
+    """애니메이션 1스텝 - 공격 판정 구간(frameData), 연계, 피격/가드 종료 (SpriteManager.update)"""
+    if fighter.anim_state == 'guard' and fighter.state == 'guard' and fighter.guard_animation_reset:
+        fighter.guard_animation_reset = False
+        fighter.anim_frame = 0
+        fighter.anim_elapsed = 0
+
+    if fighter.anim_state != fighter.state:
+        fighter.anim_state = fighter.state
+        fighter.anim_frame = 0
+        fighter.anim_elapsed = 0
+        if moveRegistry.lookup(fighter.state).is_attack:
+            fighter.attack_hit_processed = False
+            fighter.can_process_hit = False
+            fighter.move_frame = 0
+
+    state = fighter.anim_state
+    count = frame_counts[fighter.character].get(state)
+    settled = True
+    if count:
+        # 공격은 시작 후 프레임 수로 타격 판정 구간 확인 (frameData)
+        move = moveRegistry.lookup(state)
+        if move.is_attack:
+            fighter.move_frame += 1
+            active = frameData.hitbox(fighter.character, move.id, fighter.move_frame) is not None
+            fighter.can_process_hit = active and not fighter.attack_hit_processed
+
+        # 프레임 경계를 넘을 때마다 다음 프레임 (넘친 시간은 다음 애니메이션까지 이어감)
+        fighter.anim_elapsed += units
+        while count:
+            frame_units = _frame_units(state, count)
+            if fighter.anim_elapsed < frame_units:
+                break
+            fighter.anim_elapsed -= frame_units
+            settled = _next_frame(fighter, state, count)
+            state = fighter.anim_state
+            count = frame_counts[fighter.character].get(state)
+
+    if settled and fighter.is_attacking:
+        combo_frame = moveRegistry.lookup(state).combo_frame.get(fighter.character)
+        if combo_frame is not None and fighter.anim_frame >= combo_frame:
+            fighter.can_combo = True
+
+
+def _next_frame(fighter, state, count):
+    """애니메이션 한 프레임 진행 (SpriteManager._next_frame) - 공격 애니메이션이 이어지는 중이면 True"""
+    if state == 'hit':
+        _update_hit_frame(fighter)
+        return False
+
+    next_frame = (fighter.anim_frame + 1) % count
+    if state in LOOPING_STATES:
+        fighter.anim_frame = next_frame
+        return False
+    if state == 'guard':
+        # 가드는 한 번만 재생 - 마지막 프레임에서 연장되었으면 처음부터, 아니면 가드 종료
+        if fighter.anim_frame < count - 1:
+            fighter.anim_frame = next_frame
+        elif fighter.guard_animation_reset:
+            fighter.anim_frame = 0
+            fighter.guard_animation_reset = False
+        elif fighter.is_guarding:
+            _cancel_guard(fighter)
+            fighter.state = 'Idle'
+            fighter.anim_state = 'Idle'
+            fighter.anim_frame = 0
+        return False
+
+    if next_frame == 0:
+        # 공격 애니메이션 한 사이클 완료 - 예약된 연계가 있으면 다음 공격으로
+        next_attack = moveRegistry.lookup(state).combo_next.get(fighter.character)
+        if next_attack and fighter.combo_reserved:
+            fighter.state = next_attack
+            fighter.anim_state = next_attack
+            fighter.anim_frame = 0
+            fighter.attack_hit_processed = False
+            fighter.can_process_hit = False
+            fighter.move_frame = 0
+            fighter.combo_reserved = False
+            fighter.can_combo = False
+        else:
+            _end_attack(fighter)
+        return False
+    fighter.anim_frame = next_frame
+    return True
+
+
+def _random_inputs(rng, steps):
+    """무작위 버튼 입력 목록 (버튼 하나를 2~40스텝 누르고 1~20스텝 쉼)"""
+    buttons = (BUTTON_UP, BUTTON_DOWN, BUTTON_LEFT, BUTTON_RIGHT, BUTTON_FAST, BUTTON_STRONG)
+    inputs = []
+    while len(inputs) < steps:
+        inputs.extend([rng.choice(buttons)] * rng.randint(2, 40))
+        inputs.extend([0] * rng.randint(1, 20))
+    return inputs[:steps]
+
+
+if __name__ == '__main__':
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description='Run the match simulation with random inputs')
+    parser.add_argument('--steps', type=int, default=100000, help='simulation steps')
+    parser.add_argument('--seed', type=int, default=0, help='random input seed')
+    parser.add_argument('--p1', default='thief', choices=sorted(FRAME_COUNTS), help='player 1 character')
+    parser.add_argument('--p2', default='priest', choices=sorted(FRAME_COUNTS), help='player 2 character')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    p1_inputs = _random_inputs(rng, args.steps)
+    p2_inputs = _random_inputs(rng, args.steps)
+
+    digests = []
+    for run in range(2):
+        match = MatchState(args.p1, args.p2)
+        start = time.perf_counter()
+        for p1_input, p2_input in zip(p1_inputs, p2_inputs):
+            if match.game_over:
+                match = MatchState(args.p1, args.p2)
+            advance(match, p1_input, p2_input)
+        elapsed = time.perf_counter() - start
+        digests.append(match.digest())
+        print(f"Run {run + 1}: {args.steps} steps in {elapsed:.2f} s ({args.steps / elapsed:.0f} steps/s), "
+              f"score {match.player1_rounds_won}-{match.player2_rounds_won}, digest {digests[-1][:12]}")
+    print('Deterministic' if digests[0] == digests[1] else 'NOT deterministic')
@@ -0,0 +1,184 @@
+"""
+기술(상태) 레지스트리
+상태 이름마다 정수 ID 하나와 변하지 않는 속성 레코드(Move) 하나를 시작할 때 한 번 만들어 두고,
+판정/피격/애니메이션 코드는 이름 문자열을 매번 .lower()로 검사하는 대신 lookup(state)으로 레코드를 꺼내 씀
+
+- ID는 등록 순서 (MOVES[id]가 레코드, MOVE_IDS[이름]이 ID) - 기본 상태와 공격은 모듈을 읽을 때 등록
+- 목록에 없는 이름도 lookup하면 같은 규칙(이름에 fast/strong/rage/lower/upper/middle 포함 여부)으로 만들어 등록
+- 레코드는 config 값(데미지, 사거리, 프레임 간격)을 복사해 두므로, 실행 중에 config를 바꾸면 rebuild()를 불러야 함
+- 캐릭터별 사용 가능 공격/연계/가드 위치 표는 여기 한 곳에만 둠 (Player, SpriteManager, matchState가 같이 씀)
+"""
+import collections
+import types
+
+import config
+
+CHARACTERS = ('priest', 'thief', 'fighter')
+
+# 캐릭터별 사용 가능한 공격
+AVAILABLE_ATTACKS = {
+    'priest': ('fastMiddleATK', 'strongMiddleATK', 'strongUpperATK', 'strongLowerATK', 'rageSkill', 'guard'),
+    'thief': ('fastMiddleATK', 'strongMiddleATK', 'strongUpperATK', 'strongLowerATK', 'guard'),
+    'fighter': ('fastMiddleATK', 'fastLowerATK', 'fastUpperATK', 'strongMiddleATK', 'strongLowerATK',
+                'strongUpperATK', 'guard'),
+}
+
+# 공격 상태 (Player.is_attack_state)
+ATTACK_STATES = ('fastMiddleATK', 'fastMiddleATK2', 'fastMiddleATK3', 'fastUpperATK', 'fastLowerATK',
+                 'strongMiddleATK', 'strongMiddleATK2', 'strongUpperATK', 'strongUpperATK2', 'strongLowerATK',
+                 'rageSkill')
+STATES = ('Idle', 'Walk', 'BackWalk', 'guard', 'hit') + ATTACK_STATES  # 미리 등록하는 상태 (ID 순서)
+
+COMBO_STARTERS = ('fastMiddleATK', 'strongMiddleATK', 'strongUpperATK')  # 시작하자마자 연계 가능한 공격
+
+# 연계 입력: 현재 상태 -> 받아들이는 연계 입력 이름 (IOManager의 combo_input)
+COMBO_INPUTS = {
+    'fastMiddleATK': 'fastMiddleATK_combo',
+    'fastMiddleATK2': 'fastMiddleATK_combo',
+    'strongMiddleATK': 'strongMiddleATK_combo',
+    'strongUpperATK': 'strongUpperATK_combo',
+}
+
+# 연계 공격: 캐릭터 -> 현재 공격 -> 다음 공격
+COMBO_MAPPING = {
+    'priest': {'strongMiddleATK': 'strongMiddleATK2'},
+    'thief': {'fastMiddleATK': 'fastMiddleATK2', 'fastMiddleATK2': 'fastMiddleATK3',
+              'strongMiddleATK': 'strongMiddleATK2', 'strongUpperATK': 'strongUpperATK2'},
+    'fighter': {'fastMiddleATK': 'fastMiddleATK2', 'fastMiddleATK2': 'fastMiddleATK3',
+                'strongUpperATK': 'strongUpperATK2'},
+}
+
+# 연계 가능 시점 프레임: 캐릭터 -> 공격 -> 프레임
+COMBO_FRAMES = {
+    'priest': {'strongMiddleATK': 3},
+    'thief': {'fastMiddleATK': 3, 'fastMiddleATK2': 3, 'strongMiddleATK': 3, 'strongUpperATK': 3},
+    'fighter': {'fastMiddleATK': 2, 'fastMiddleATK2': 2, 'strongUpperATK': 3},
+}
+
+# 공격별 가드 위치 (None은 가드 불가)
+GUARD_HEIGHTS = {
+    'fastUpperATK': 'High', 'strongUpperATK': 'High', 'strongUpperATK2': 'High',
+    'fastMiddleATK': 'Middle', 'strongMiddleATK': 'Middle',
+    'fastMiddleATK2': 'Middle', 'fastMiddleATK3': 'Middle', 'strongMiddleATK2': 'Middle',
+    'fastLowerATK': 'Low', 'strongLowerATK': 'Low',
+    'rageSkill': None,
+}
+
+# 애니메이션 전체 재생 시간 (초, hit는 guard와 같음)
+ANIMATION_DURATIONS = {
+    'Idle': 1.0, 'Walk': 0.8, 'BackWalk': 0.8,
+    'fastMiddleATK': 0.6, 'fastLowerATK': 0.4, 'fastUpperATK': 0.6,
+    'strongMiddleATK': 0.9, 'strongUpperATK': 1.8, 'strongLowerATK': 1.35, 'rageSkill': 1.0,
+    'hit': 0.9, 'guard': 0.9,
+    'fastMiddleATK2': 0.6, 'fastMiddleATK3': 0.6, 'strongMiddleATK2': 1.2, 'strongUpperATK2': 0.75,
+}
+
+# 기술 속성 레코드
+# strength: 'fast'/'strong'/'rage'/None, height: 'lower'/'upper'/'middle'/None
+# reach: 공격 사거리 (0이면 판정 없음), character_reach: 캐릭터별로 다른 사거리
+# reach_extends_down: 판정이 바닥 근처까지 내려감 (다운된 상대 타격용)
+# guard_height: 막을 수 있는 가드 위치 (None은 가드 불가)
+# hit_type: 맞은 쪽 피격 타입, launch: 지상에서 맞았을 때 띄우는 (vy, vx) (None이면 띄우지 않음)
+# juggle: 공중에서 맞았을 때 (vy, vx), frame_time: 고정 프레임 간격 (None이면 duration / 프레임 수)
+# combo_next/combo_frame: 캐릭터 -> 다음 연계 공격 / 연계 가능 프레임, characters: 쓸 수 있는 캐릭터
+Move = collections.namedtuple('Move', (
+    'id', 'name', 'strength', 'height', 'is_attack', 'damage', 'reach', 'character_reach', 'reach_extends_down',
+    'guard_height', 'hit_type', 'launch', 'juggle', 'duration', 'frame_time', 'combo_starter', 'combo_input',
+    'combo_next', 'combo_frame', 'characters'))
+
+MOVES = []  # ID -> Move
+MOVE_IDS = {}  # 이름 -> ID
+_BY_NAME = {}  # 이름 -> Move
+
+
+def _derive(move_id, name):
+    """이름과 표에서 레코드 만들기 (config 값은 지금 값으로 복사)"""
+    lowered = name.lower()
+    if 'fast' in lowered:
+        strength, damage, reach, frame_time = ('fast', config.FAST_DAMAGE, config.FAST_ATTACK_RANGE,
+                                               config.FAST_FRAME_TIME)
+    elif 'strong' in lowered:
+        strength, damage, reach, frame_time = ('strong', config.STRONG_DAMAGE, config.STRONG_ATTACK_RANGE,
+                                               config.STRONG_FRAME_TIME)
+    elif 'rage' in lowered:
+        strength, damage, reach, frame_time = 'rage', config.RAGE_DAMAGE, config.RAGE_ATTACK_RANGE, None
+    else:
+        strength, damage, reach, frame_time = None, 5, 0, None
+    if 'lower' in lowered:
+        height = 'lower'
+    elif 'upper' in lowered:
+        height = 'upper'
+    elif 'middle' in lowered:
+        height = 'middle'
+    else:
+        height = None
+
+    # priest의 상단 강공격은 사거리가 따로 있음
+    character_reach = {'priest': config.PRIEST_STRONG_UPPER_RANGE} if lowered == 'strongupperatk' else {}
+
+    if height == 'lower':
+        hit_type = 'airborne'
+        # 지상에서 띄우기 - x 속도는 80%로 감소
+        launch = (640.0, 300.0 * 0.8) if strength == 'strong' else (480.0, 200.0 * 0.8)
+    else:
+        hit_type = 'strong' if strength == 'strong' else 'fast'
+        launch = None
+    if strength == 'strong':
+        juggle = (400.0, 450.0)
+    elif strength == 'fast':
+        juggle = (350.0, 180.0)
+    else:
+        juggle = (400.0, 200.0)
+
+    return Move(
+        id=move_id,
+        name=name,
+        strength=strength,
+        height=height,
+        is_attack=name in ATTACK_STATES,
+        damage=damage,
+        reach=reach,
+        character_reach=types.MappingProxyType(character_reach),
+        reach_extends_down=height == 'lower',
+        guard_height=GUARD_HEIGHTS.get(name),
+        hit_type=hit_type,
+        launch=launch,
+        juggle=juggle,
+        duration=ANIMATION_DURATIONS.get(name, 1.0),
+        frame_time=frame_time,
+        combo_starter=name in COMBO_STARTERS,
+        combo_input=COMBO_INPUTS.get(name),
+        combo_next=types.MappingProxyType({character: mapping[name] for character, mapping in COMBO_MAPPING.items()
+                                           if name in mapping}),
+        combo_frame=types.MappingProxyType({character: frames[name] for character, frames in COMBO_FRAMES.items()
+                                            if name in frames}),
+        characters=frozenset(character for character, attacks in AVAILABLE_ATTACKS.items() if name in attacks),
+    )
+
+
+def register(name):
+    """이름 등록 (이미 있으면 그대로) -> Move"""
+    move = _BY_NAME.get(name)
+    if move is None:
+        move = _derive(len(MOVES), name)
+        MOVES.append(move)
+        MOVE_IDS[name] = move.id
+        _BY_NAME[name] = move
+    return move
+
+
+def lookup(name):
+    """상태 이름 -> Move (처음 보는 이름은 등록)"""
+    return _BY_NAME.get(name) or register(name)
+
+
+def rebuild():
+    """config 값이 바뀐 뒤 모든 레코드 다시 만들기 (ID는 그대로)"""
+    for move in MOVES:
+        MOVES[move.id] = _BY_NAME[move.name] = _derive(move.id, move.name)
+
+
+# 기본 상태 -> 공격 순서로 ID 고정
+for _name in STATES:
+    register(_name)
+IDLE, WALK, BACKWALK, GUARD, HIT = range(5)
@@ -0,0 +1,354 @@
+"""
+플레이어 행동 상태 머신
+Player의 겹치는 플래그(is_guarding, is_hit, is_attacking, can_combo, combo_reserved, can_attack_after_guard)를
+네 가지 행동 상태로 묶고, 상태마다 처리 함수 하나(HANDLERS)와 (상태, 이벤트) -> (다음 상태, 동작) 전이 표(TRANSITIONS)로 정리
+Player.update는 공통 처리 뒤 지금 상태의 처리 함수 하나만 부르고, Player/SpriteManager/Game은 플래그를 직접 바꾸지 않고 fire()로 전이
+
+- 상태는 플래그에서 표 한 번으로 계산 (state_of: 가드 > 피격 > 공격 > 중립) - 스냅샷/되감기/리플레이는 지금처럼 플래그만 저장
+- 표에 없는 (상태, 이벤트)는 아무것도 하지 않고 None (예: 공격 중 가드, 중립에서 연계 실행)
+- Idle/Walk/BackWalk와 공격 이름은 애니메이션 상태 (Player.state) - 행동 상태 안에서 바뀜
+- stats.enable()이면 플레이어/상태별 스텝 수와 처리 함수 시간, 전이 횟수를 셈
+  (main.py --fsm-stats, 넷플레이 되감기로 다시 시뮬레이션한 스텝도 포함)
+
+전이 그래프 내보내기 (Graphviz DOT):
+    python playerStateMachine.py > playerStates.dot
+"""
+import collections
+import time
+
+import moveRegistry
+
+NEUTRAL, ATTACK, GUARD, HIT = 'neutral', 'attack', 'guard', 'hit'
+STATES = (NEUTRAL, ATTACK, GUARD, HIT)
+
+# is_guarding * 4 + is_hit * 2 + is_attacking -> 행동 상태
+_BY_FLAGS = (NEUTRAL, ATTACK, HIT, HIT, GUARD, GUARD, GUARD, GUARD)
+
+
+def state_of(player):
+    """플래그 -> 행동 상태"""
+    return _BY_FLAGS[player.is_guarding * 4 + player.is_hit * 2 + player.is_attacking]
+
+
+# 전이 동작 - 플래그만 바꿈 (가드 로그 외에는 부르는 쪽에서 출력)
+
+def _start_attack(player, attack):
+    """공격 시작 (연계 시작 공격이면 바로 연계 가능)"""
+    player.state = attack
+    player.is_attacking = True
+    player.reset_attack_hit_flag()
+    player.can_combo = moveRegistry.lookup(attack).combo_starter
+    player.combo_reserved = False
+
+
+def _guard_cancel_attack(player, attack):
+    """가드를 풀고 바로 공격 (가드 중 공격 입력, 가드 직후 반격)"""
+    player.is_guarding = False
+    player.can_attack_after_guard = False
+    player.guard_counter_timer = 0.0
+    player.guard_animation_reset = False
+    player.character.state = attack
+    _start_attack(player, attack)
+
+
+def _reserve_combo(player):
+    player.combo_reserved = True
+
+
+def _open_combo_window(player):
+    player.can_combo = True
+
+
+def _execute_combo(player, next_attack):
+    """예약한 연계 공격 시작 (애니메이션이 끝날 때) - 새 공격이므로 타격 플래그와 공격 프레임 수 초기화"""
+    player.state = next_attack
+    player.reset_attack_hit_flag()
+    player.can_process_hit = False
+    player.move_frame = 0
+    player.combo_reserved = False
+    player.can_combo = False
+
+
+def _end_attack(player):
+    player.is_attacking = False
+    player.can_process_hit = False  # 다음 공격이 판정 프레임 전에 맞히지 않도록
+    player.state = 'Idle'
+    player.can_combo = False
+    player.combo_reserved = False
+
+
+def _start_guard(player):
+    player.is_guarding = True
+    player.guard_animation_reset = False
+    print(f"Auto guard activated! Position: {player.position_state} - Starting guard animation")
+    # 가드 시작 시 짧은 반격 창 부여
+    player.guard_counter_timer = player.guard_counter_window
+    player.can_attack_after_guard = True
+    print(f"Guard counter window opened for {player.guard_counter_window} seconds")
+    player.state = 'guard'
+    player.character.state = 'guard'
+
+
+def _extend_guard(player):
+    """가드 중 다시 막으면 애니메이션을 처음부터 (SpriteManager가 guard_animation_reset 확인), 반격 창도 연장"""
+    print(f"Guard extended! Position: {player.position_state} - Resetting guard animation")
+    player.guard_animation_reset = True
+    player.guard_counter_timer = player.guard_counter_window
+    player.can_attack_after_guard = True
+    player.state = 'guard'
+    player.character.state = 'guard'
+
+
+def _end_guard(player):
+    player.is_guarding = False
+    player.can_attack_after_guard = False
+    player.guard_counter_timer = 0.0
+    player.guard_animation_reset = False
+    player.state = 'Idle'
+    player.character.state = 'Idle'
+
+
+def _enter_hit(player):
+    """피격 - 진행 중인 공격/가드를 모두 취소 (취소된 공격은 더 이상 타격 판정을 만들지 않음)"""
+    player.is_hit = player.character.is_hit
+    player.state = 'hit'
+    player.is_attacking = False
+    player.attack_hit_processed = True
+    player.can_process_hit = False
+    player.is_guarding = False
+    player.can_combo = False
+    player.combo_reserved = False
+
+
+def _get_up(player):
+    player.hit_recovery_input = True
+
+
+def _recover(player):
+    """hit 애니메이션이 끝나면 hit 상태와 공격 관련 플래그 모두 초기화"""
+    player.is_hit = False
+    player.character.reset_hit_state()
+    player.is_attacking = False
+    player.can_process_hit = False
+    player.attack_hit_processed = True
+    player.can_combo = False
+    player.combo_reserved = False
+    if player.state == 'hit':
+        player.state = 'Idle'
+
+
+def _reset(player):
+    """캐릭터 변경 - 모든 행동 상태 초기화"""
+    player.is_attacking = False
+    player.is_guarding = False
+    player.is_hit = False
+    player.can_combo = False
+    player.combo_reserved = False
+    player.state = 'Idle'
+    player.character.state = 'Idle'
+    player.character.is_hit = False
+
+
+# (상태, 이벤트) -> (다음 상태, 동작)
+TRANSITIONS = {
+    (NEUTRAL, 'attack'): (ATTACK, _start_attack),
+    (NEUTRAL, 'guard'): (GUARD, _start_guard),
+    (ATTACK, 'combo_window'): (ATTACK, _open_combo_window),
+    (ATTACK, 'combo_input'): (ATTACK, _reserve_combo),
+    (ATTACK, 'combo'): (ATTACK, _execute_combo),
+    (ATTACK, 'attack_end'): (NEUTRAL, _end_attack),
+    (GUARD, 'guard'): (GUARD, _extend_guard),
+    (GUARD, 'attack'): (ATTACK, _guard_cancel_attack),
+    (GUARD, 'guard_end'): (NEUTRAL, _end_guard),
+    (HIT, 'get_up'): (HIT, _get_up),
+    (HIT, 'recover'): (NEUTRAL, _recover),
+}
+for _state in STATES:
+    TRANSITIONS[_state, 'damage'] = (HIT, _enter_hit)
+    TRANSITIONS[_state, 'character_change'] = (NEUTRAL, _reset)
+
+
+def fire(player, event, *args):
+    """이벤트로 전이 -> 다음 상태 (지금 상태에서 받지 않는 이벤트면 아무것도 하지 않고 None)"""
+    state = state_of(player)
+    transition = TRANSITIONS.get((state, event))
+    if transition is None:
+        return None
+    next_state, action = transition
+    action(player, *args)
+    if stats.enabled:
+        stats.transitions[player.player_side, state, event, next_state] += 1
+    return next_state
+
+
+# 상태별 처리 함수 - Player.update의 공통 처리(반격 창 타이머, 캐릭터 변경, 중력, hit 동기화) 뒤에 하나만 불림
+
+def _update_neutral(player, deltaTime, move_input, atk_input, combo_input, other_player, getup_input):
+    # 새로운 공격 입력 처리 (캐릭터별 공격 제한 확인)
+    if atk_input and player.can_use_attack(atk_input):
+        fire(player, 'attack', atk_input)
+        print(f"Starting attack: {atk_input}")
+        return
+
+    # 이동 처리 - 상대 플레이어의 위치에 따라 동적으로 Walk/BackWalk 결정
+    if player.is_grounded:
+        move_speed = player.get_move_speed()
+
+        # 상대방이 내 오른쪽에 있는지 왼쪽에 있는지 판단
+        opponent_on_right = other_player and other_player.x > player.x
+
+        if move_input == 'right':
+            # 오른쪽으로 이동 - 상대가 오른쪽에 있으면 Walk (접근), 왼쪽에 있으면 BackWalk (후퇴, 같은 속도)
+            new_x = player.x + move_speed * deltaTime
+            if opponent_on_right:
+                player.state = 'Walk'
+                player.facing_right = True
+                player.dir = 1
+            else:
+                player.state = 'BackWalk'
+                player.facing_right = False
+                player.dir = -1
+            player.update_position(new_x, other_player)
+
+        elif move_input == 'left':
+            # 왼쪽으로 이동 - 상대가 오른쪽에 있으면 BackWalk (후퇴, 같은 속도), 왼쪽에 있으면 Walk (접근)
+            new_x = player.x - move_speed * deltaTime
+            if opponent_on_right:
+                player.state = 'BackWalk'
+                player.facing_right = True
+                player.dir = 1
+            else:
+                player.state = 'Walk'
+                player.facing_right = False
+                player.dir = -1
+            player.update_position(new_x, other_player)
+
+        elif not move_input:
+            player.state = 'Idle'
+            # Idle 상태에서도 상대방을 바라보도록 방향 업데이트
+            if opponent_on_right:
+                player.facing_right = True
+                player.dir = 1
+            else:
+                player.facing_right = False
+                player.dir = -1
+
+    player.sync_character(deltaTime)
+
+
+def _update_attack(player, deltaTime, move_input, atk_input, combo_input, other_player, getup_input):
+    # 연계 입력 - 현재 공격이 받아들이는 연계 입력(예: 'fastMiddleATK_combo')일 때만 예약
+    if (combo_input and player.can_combo and not player.combo_reserved and
+            combo_input == moveRegistry.lookup(player.state).combo_input):
+        fire(player, 'combo_input')
+        print(f"Combo reserved for {player.get_character_type()}: {player.state} -> {combo_input}")
+        return
+
+    player.sync_character(deltaTime)
+
+
+def _update_guard(player, deltaTime, move_input, atk_input, combo_input, other_player, getup_input):
+    # 가드 중 공격키 입력으로 가드 취소 후 즉시 공격
+    if atk_input and not player.is_attacking:
+        if player.can_use_attack(atk_input):
+            fire(player, 'attack', atk_input)
+            print(f"Guard canceled by attack input -> immediate attack: {atk_input}")
+            return
+        print(f"Cannot use attack {atk_input} for current character")
+
+    # 가드 중에는 상태가 'guard'로 고정, 이동 등 다른 행동 불가 (가드는 애니메이션이 끝나면 SpriteManager가 해제)
+    player.state = 'guard'
+    player.character.state = 'guard'
+
+
+def _update_hit(player, deltaTime, move_input, atk_input, combo_input, other_player, getup_input):
+    # 기상 입력 - down 상태(바닥에 떨어진 후)와 strong 피격에서 SpriteManager가 기상을 허용한 뒤에만
+    character = player.character
+    if getup_input and character.can_get_up:
+        if character.hit_type == 'down' and player.is_grounded:
+            if character.try_get_up():
+                fire(player, 'get_up')
+                print("Player attempting to get up from down state!")
+                return
+        elif character.hit_type == 'strong':
+            if character.try_get_up():
+                fire(player, 'get_up')
+                print(f"Player attempting to get up! Current frame: {character.frame}")
+                return
+
+    player.sync_character(deltaTime)
+
+
+HANDLERS = {
+    NEUTRAL: _update_neutral,
+    ATTACK: _update_attack,
+    GUARD: _update_guard,
+    HIT: _update_hit,
+}
+
+
+def update(player, deltaTime, move_input, atk_input, combo_input, other_player, getup_input):
+    """지금 행동 상태의 처리 함수 실행"""
+    state = state_of(player)
+    if not stats.enabled:
+        HANDLERS[state](player, deltaTime, move_input, atk_input, combo_input, other_player, getup_input)
+        return
+    start = time.perf_counter()
+    HANDLERS[state](player, deltaTime, move_input, atk_input, combo_input, other_player, getup_input)
+    stats.record(player.player_side, state, time.perf_counter() - start)
+
+
+class StateStats:
+    """플레이어/상태별 스텝 수와 처리 함수 시간, 전이 횟수"""
+
+    def __init__(self):
+        self.enabled = False
+        self.steps = collections.Counter()  # (플레이어, 상태) -> 스텝 수
+        self.seconds = collections.Counter()  # (플레이어, 상태) -> 처리 함수 시간 (초)
+        self.transitions = collections.Counter()  # (플레이어, 상태, 이벤트, 다음 상태) -> 횟수
+
+    def enable(self):
+        """기록 시작"""
+        self.enabled = True
+
+    def record(self, side, state, seconds):
+        self.steps[side, state] += 1
+        self.seconds[side, state] += seconds
+
+    def report(self, step_seconds):
+        """상태별 머문 시간과 전이 횟수 출력 (step_seconds: 시뮬레이션 1스텝 시간)"""
+        print(f"{'player':<7}{'state':<9}{'steps':>8}{'game s':>9}{'share':>7}{'handler us':>12}")
+        for side in sorted({side for side, _ in self.steps}):
+            total = sum(self.steps[side, state] for state in STATES) or 1
+            for state in STATES:
+                steps = self.steps[side, state]
+                per_step = self.seconds[side, state] / steps * 1e6 if steps else 0.0
+                print(f"{side:<7}{state:<9}{steps:>8}{steps * step_seconds:>9.1f}{steps / total:>7.1%}"
+                      f"{per_step:>12.2f}")
+        print(f"{'player':<7}{'transition':<40}{'count':>7}")
+        for (side, state, event, next_state), count in sorted(self.transitions.items()):
+            print(f"{side:<7}{f'{state} --{event}--> {next_state}':<40}{count:>7}")
+
+
+stats = StateStats()
+
+
+def to_dot(counts=None):
+    """전이 표 -> Graphviz DOT (counts: stats.transitions를 주면 간선에 횟수 표시)"""
+    totals = collections.Counter()
+    for (side, state, event, next_state), count in (counts or {}).items():
+        totals[state, event] += count
+    lines = ['digraph PlayerStates {', '    rankdir=LR;']
+    for state in STATES:
+        lines.append(f'    {state} [shape=box, label="{state}\\n{HANDLERS[state].__name__}"];')
+    for (state, event), (next_state, action) in TRANSITIONS.items():
+        label = f"{event}\\n{action.__name__}"
+        if counts is not None:
+            label += f"\\n{totals[state, event]}"
+        lines.append(f'    {state} -> {next_state} [label="{label}"];')
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    print(to_dot())
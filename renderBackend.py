@@ -0,0 +1,182 @@
+"""
+렌더링/오디오/입력 백엔드
+기본은 pico2d(SDL) 창, 오디오 장치, 키보드 이벤트를 그대로 사용하고,
+헤드리스 모드(enable_headless)에서는 창과 오디오 장치 없이 실행 (빌드 서버에서 게임 로직 처리량 측정용)
+
+헤드리스 모드:
+    - 캔버스 열기/지우기/그리기는 아무것도 하지 않음
+    - 이미지/폰트/사운드는 같은 인터페이스의 Null 객체로 대체 (이미지 크기는 PNG 헤더에서 읽음)
+    - 입력은 InputScript가 시뮬레이션 스텝 번호별로 만들어 주는 키 이벤트 사용
+"""
+import json
+import random
+
+import pico2d
+
+headless = False
+input_script = None  # 헤드리스 모드의 입력 (InputScript)
+
+
+class NullImage:
+    """그리기를 생략하는 이미지 (pico2d.Image와 같은 인터페이스)"""
+
+    def __init__(self, w, h):
+        self.w = w
+        self.h = h
+
+    def draw(self, *args, **kwargs):
+        pass
+
+    def clip_draw(self, *args, **kwargs):
+        pass
+
+    def composite_draw(self, *args, **kwargs):
+        pass
+
+    def clip_composite_draw(self, *args, **kwargs):
+        pass
+
+    def opacify(self, o):
+        pass
+
+
+class NullFont:
+    """그리기를 생략하는 폰트"""
+
+    def draw(self, *args, **kwargs):
+        pass
+
+
+class NullSound:
+    """재생하지 않는 효과음/배경음악 (pico2d.Wav/Music과 같은 인터페이스)"""
+
+    def __init__(self):
+        self.volume = 128
+
+    def play(self, n=1):
+        pass
+
+    def repeat_play(self):
+        pass
+
+    def set_volume(self, v):
+        self.volume = v
+
+    def get_volume(self):
+        return self.volume
+
+    def stop(self):
+        pass
+
+    def pause(self):
+        pass
+
+    def resume(self):
+        pass
+
+
+class InputScript:
+    """시뮬레이션 스텝 번호별 키 입력 목록 - 같은 스크립트면 항상 같은 입력
+
+    events: [(스텝, 'down' 또는 'up', 키 이름)] - 키 이름은 pico2d.SDLK_ 뒤 부분 ('a', 'SPACE', 'LEFT', ...)
+    """
+
+    def __init__(self, events):
+        self.events = {}
+        for step, action, key in events:
+            event = pico2d.Event(pico2d.SDL_KEYDOWN if action == 'down' else pico2d.SDL_KEYUP)
+            event.key = getattr(pico2d, f'SDLK_{key}')
+            self.events.setdefault(int(step), []).append(event)
+        self.step = 0
+
+    @classmethod
+    def load(cls, path):
+        """JSON 파일에서 읽기 - [[스텝, "down"/"up", 키 이름], ...]"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def demo(cls, steps, seed=0):
+        """타이틀 -> 캐릭터 선택 -> 대전 -> 게임 오버 -> 타이틀을 반복하는 무작위 입력 (seed로 재현 가능)
+
+        스페이스/엔터는 타이틀, 캐릭터 선택, 게임 오버 화면 넘기기용으로 주기적으로 누름
+        """
+        rng = random.Random(seed)
+        player_keys = (('w', 's', 'a', 'd', 'f', 'g', 'h'),
+                       ('UP', 'DOWN', 'LEFT', 'RIGHT', 'SLASH', 'LSHIFT', 'KP_3'))
+        events = []
+        for step in range(0, steps, 30):
+            events.append((step, 'down', 'SPACE'))
+            events.append((step + 1, 'up', 'SPACE'))
+            events.append((step + 2, 'down', 'RETURN'))
+            events.append((step + 3, 'up', 'RETURN'))
+        for keys in player_keys:
+            step = 0
+            while step < steps:
+                key = rng.choice(keys)
+                hold = rng.randint(2, 40)
+                events.append((step, 'down', key))
+                events.append((step + hold, 'up', key))
+                step += hold + rng.randint(1, 20)
+        return cls(events)
+
+    def next_events(self):
+        """다음 스텝의 이벤트 목록"""
+        events = self.events.get(self.step, [])
+        self.step += 1
+        return events
+
+
+def enable_headless(script=None):
+    """헤드리스 모드 켜기 - 캔버스를 열기 전에 호출"""
+    global headless, input_script
+    headless = True
+    input_script = script
+
+
+def open_canvas(w, h):
+    if not headless:
+        pico2d.open_canvas(w, h)
+
+
+def close_canvas():
+    if not headless:
+        pico2d.close_canvas()
+
+
+def clear_canvas():
+    if not headless:
+        pico2d.clear_canvas()
+
+
+def update_canvas():
+    if not headless:
+        pico2d.update_canvas()
+
+
+def set_input_script(script):
+    """창 모드에서 입력 스크립트 사용 (리플레이 재생) - 실제 입력은 창 닫기/ESC만 받음"""
+    global input_script
+    input_script = script
+
+
+def get_events():
+    """입력 이벤트 - 헤드리스 모드나 입력 스크립트가 있으면 스크립트의 다음 스텝 이벤트"""
+    if not headless:
+        events = pico2d.get_events()
+        if input_script is None:
+            return events
+        events = [e for e in events if e.type == pico2d.SDL_QUIT or
+                  (e.type == pico2d.SDL_KEYDOWN and e.key == pico2d.SDLK_ESCAPE)]
+        return events + input_script.next_events()
+    return input_script.next_events() if input_script else []
+
+
+def draw_rectangle(*args):
+    if not headless:
+        pico2d.draw_rectangle(*args)
+
+
+def draw_line(*args):
+    if not headless:
+        pico2d.draw_line(*args)
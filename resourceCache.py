@@ -0,0 +1,127 @@
+"""
+프로세스 전역 리소스 캐시
+이미지/폰트/사운드를 (종류, 실제 경로, 파라미터) 키로 한 번만 로딩하고,
+소유자(씬/플레이어/캐릭터 등) 단위 참조 카운트로 더 이상 쓰지 않는 항목을 해제
+"""
+import pathlib
+
+import assetBundle
+import imageScaler
+
+
+def make_key(kind, path, *params):
+    """캐시 키 - 상대 경로/대소문자 표기가 달라도 같은 파일이면 같은 키"""
+    return (kind, str(pathlib.Path(path).resolve()), params)
+
+
+def estimate_image_bytes(image):
+    """텍스처 메모리 추정 (RGBA 4바이트)"""
+    return image.w * image.h * 4
+
+
+def estimate_file_bytes(path):
+    """폰트/사운드는 파일 크기로 추정"""
+    return assetBundle.get_size(path)
+
+
+class ResourceCache:
+    """참조 카운트 리소스 캐시 - 같은 소유자가 같은 키를 여러 번 얻어도 참조는 1개"""
+
+    def __init__(self):
+        self.entries = {}  # 키 -> [리소스, 바이트 수, 소유자 집합]
+        self.owner_keys = {}  # 소유자 -> 키 집합
+        self.hits = 0
+        self.misses = 0
+        self.bytes_loaded = 0  # 지금까지 로딩한 총 바이트 (누적)
+        self.bytes_released = 0
+
+    def lookup(self, key, owner=None):
+        """캐시에 있으면 참조를 추가하고 반환 (적중), 없으면 None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.hits += 1
+        self._add_ref(key, entry, owner)
+        return entry[0]
+
+    def insert(self, key, resource, size, owner=None):
+        """새로 로딩한 리소스 등록 (미스)"""
+        self.misses += 1
+        self.bytes_loaded += size
+        entry = [resource, size, set()]
+        self.entries[key] = entry
+        self._add_ref(key, entry, owner)
+        return resource
+
+    def load(self, key, factory, size_of, owner=None):
+        """캐시에서 찾고 없으면 factory()로 로딩해 등록"""
+        resource = self.lookup(key, owner)
+        if resource is None:
+            resource = factory()
+            self.insert(key, resource, size_of(resource), owner)
+        return resource
+
+    def load_image(self, path, owner=None, size=None):
+        """이미지 로딩 - size(배율 또는 (너비, 높이))가 있으면 최종 크기로 리샘플링한 이미지"""
+        return self.load(make_key('image', path, size), lambda: imageScaler.load_image(path, size),
+                         estimate_image_bytes, owner)
+
+    def load_font(self, path, size, owner=None):
+        """폰트 로딩 - 같은 파일이라도 크기가 다르면 별도 항목"""
+        return self.load(make_key('font', path, size), lambda: assetBundle.load_font(path, size),
+                         lambda font: estimate_file_bytes(path), owner)
+
+    def load_wav(self, path, owner=None):
+        """효과음 로딩"""
+        return self.load(make_key('wav', path), lambda: assetBundle.load_wav(path),
+                         lambda wav: estimate_file_bytes(path), owner)
+
+    def load_music(self, path, owner=None):
+        """배경음악 로딩"""
+        return self.load(make_key('music', path), lambda: assetBundle.load_music(path),
+                         lambda music: estimate_file_bytes(path), owner)
+
+    def release(self, owner):
+        """소유자가 가진 참조를 모두 해제 - 참조가 0이 된 항목은 캐시에서 제거
+
+        제거된 리소스는 남은 파이썬 참조가 사라질 때 pico2d 소멸자가 메모리를 해제
+        """
+        for key in self.owner_keys.pop(owner, ()):
+            entry = self.entries.get(key)
+            if entry is None:
+                continue
+            entry[2].discard(owner)
+            if not entry[2]:
+                del self.entries[key]
+                self.bytes_released += entry[1]
+
+    def resident_bytes(self):
+        """현재 캐시에 남아있는 리소스의 추정 바이트 수"""
+        return sum(entry[1] for entry in self.entries.values())
+
+    def stats(self):
+        """적중/미스/바이트 통계"""
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'bytes_loaded': self.bytes_loaded,
+            'bytes_released': self.bytes_released,
+            'bytes_resident': self.resident_bytes(),
+        }
+
+    def report(self):
+        """통계 출력"""
+        s = self.stats()
+        print(f"Resource cache: {s['entries']} entries, {s['hits']} hits / {s['misses']} misses, "
+              f"{s['bytes_resident'] / 1024 / 1024:.1f} MB resident, "
+              f"{s['bytes_released'] / 1024 / 1024:.1f} MB released")
+
+    def _add_ref(self, key, entry, owner):
+        """소유자 참조 추가 (owner가 None이면 해제되지 않는 전역 참조)"""
+        entry[2].add(owner)
+        self.owner_keys.setdefault(owner, set()).add(key)
+
+
+# 프로세스 전역 캐시
+resources = ResourceCache()
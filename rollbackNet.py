@@ -0,0 +1,374 @@
+"""
+롤백 넷플레이 (UDP)
+두 쪽이 같은 매치를 각자 시뮬레이션하고 프레임마다 자기 입력만 주고받음
+상대 입력이 아직 안 왔으면 마지막으로 받은 입력으로 예측해 진행하고,
+실제 입력이 예측과 다르면 그 프레임 상태(gameSnapshot)로 되감아 현재 프레임까지 다시 시뮬레이션
+
+- 프레임 입력은 inputReplay와 같은 1바이트 (눌린 키 | PRESS_BIT) - 두 플레이어 이벤트를 모두 입력 바이트로 만들어 넣음
+  (로컬 키보드 이벤트도 바로 넣지 않으므로 같은 입력이면 양쪽 상태가 항상 같음)
+- 로컬 입력은 config.NET_INPUT_DELAY 프레임 뒤에 적용, 상대보다 NET_MAX_PREDICTION 프레임 넘게 앞서면 대기
+- 패킷마다 상대가 아직 받았다고 알리지 않은 입력을 모두 다시 보냄 (손실/순서 바뀜은 재전송으로 해결)
+- 프레임 이득(상대보다 앞선 정도)을 주고받아 앞선 쪽이 가끔 한 프레임 쉬며 맞춤
+- 확정된 프레임 상태 해시를 NET_CHECKPOINT_INTERVAL마다 상대와 비교 (어긋나면 출력)
+- 캐릭터는 시작 옵션으로 정하고 매치 중 캐릭터 변경 키는 쓰지 않음, 다시 시뮬레이션하는 동안은 효과음 끔
+
+실행 (두 컴퓨터 또는 한 컴퓨터에서 두 번, 프로젝트 루트에서):
+    python main.py --net-side 0 --net-port 7000 --net-peer <상대 주소>:7001 --p1 fighter --p2 thief
+    python main.py --net-side 1 --net-port 7001 --net-peer <상대 주소>:7000 --p1 fighter --p2 thief
+지연/손실 테스트는 Tools/netHarness.py (로컬 UDP 중계기)
+"""
+import contextlib
+import hashlib
+import json
+import socket
+import struct
+import time
+
+import pico2d
+
+import config
+import gameSnapshot
+import inputReplay
+import renderBackend
+
+MAGIC = b'RBNT'
+HELLO = 0
+INPUT = 1
+# MAGIC, 종류, 첫 입력 프레임, 받은 상대 입력 수, 현재 프레임, 프레임 이득, 체크포인트 프레임, 체크포인트 해시, 입력 수
+PACKET = '<4sBIIIbI8sB'
+PACKET_SIZE = struct.calcsize(PACKET)
+MAX_RESEND = 64  # 패킷당 보내는 입력 최대 개수
+SYNC_INTERVAL = 10  # 프레임 이득 맞추기로 쉬는 최소 간격 (프레임)
+SYNC_THRESHOLD = 3.0  # 두 쪽 프레임 이득 차이(앞선 프레임의 2배)가 이 이상이면 앞선 쪽이 한 프레임 쉼
+ADVANTAGE_SMOOTHING = 0.05  # 프레임 이득 지수 이동 평균 비율 (지터로 번갈아 쉬지 않도록)
+TIMEOUT = 5.0  # 이 시간(초) 동안 상대 패킷이 없으면 연결 끊김으로 처리
+LINGER = 30  # 끝난 뒤 상대도 끝낼 수 있도록 계속 보내는 프레임 수 (받은 입력 수 알림)
+
+
+class UdpPeer:
+    """논블로킹 UDP 소켓 - 상대 주소로 보내고 받은 데이터그램을 모두 꺼냄"""
+
+    def __init__(self, port, peer):
+        self.peer = peer
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('', port))
+        self.sock.setblocking(False)
+        self.sent = 0
+        self.received = 0
+
+    def send(self, data):
+        try:
+            self.sock.sendto(data, self.peer)
+            self.sent += 1
+        except OSError:
+            pass  # 상대가 아직 없거나 네트워크 오류 - 다음 프레임에 다시 보냄
+
+    def receive(self):
+        packets = []
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(2048)
+            except BlockingIOError:
+                break
+            except OSError:
+                continue  # 상대 포트가 닫혀 있다는 ICMP 응답 (Windows ConnectionResetError 등)
+            self.received += 1
+            packets.append(data)
+        return packets
+
+    def close(self):
+        self.sock.close()
+
+
+def parse_address(text):
+    """'호스트:포트' -> (호스트, 포트)"""
+    host, _, port = text.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+class RollbackSession:
+    """롤백 넷플레이 세션 - Game.step 앞뒤에서 호출되고 Game.update에 이번 프레임 이벤트를 넘김"""
+
+    def __init__(self, side, port, peer, p1_character, p2_character, frames=0):
+        self.side = side  # 0이면 Player1, 1이면 Player2 조작
+        self.characters = (p1_character, p2_character)
+        self.frame_limit = frames  # 0이면 매치가 끝날 때까지
+        self.delay = config.NET_INPUT_DELAY
+        self.max_prediction = config.NET_MAX_PREDICTION
+        self.interval = config.NET_CHECKPOINT_INTERVAL
+        self.peer = UdpPeer(port, peer)
+        # 캐릭터/규칙 상수/입력 지연이 같아야 같은 결과 - 연결할 때 비교
+        session = [self.characters, self.delay, {name: getattr(config, name) for name in inputReplay.CONFIG_KEYS}]
+        self.session_id = hashlib.sha1(json.dumps(session).encode('utf-8')).digest()[:8]
+
+        self.keys = inputReplay.KeyTracker()
+        # 프레임별 입력 - 입력 지연 동안의 처음 프레임은 양쪽 모두 입력 없음
+        self.local = bytearray(self.delay)
+        self.remote = bytearray(self.delay)  # 받은(확정된) 상대 입력
+        self.used = bytearray()  # 프레임별로 시뮬레이션에 쓴 상대 입력 (예측 포함)
+        self.snapshots = {}  # 프레임 -> 그 프레임을 시뮬레이션하기 전 상태
+        self.signatures = {}  # 프레임 -> 그 프레임을 시뮬레이션한 뒤 상태 (확정되면 해시에 반영)
+        self.frame = 0  # 다음에 시뮬레이션할 프레임
+        self.sim_frame = 0  # 지금 시뮬레이션 중인 프레임 (frame_events)
+        self.extra_events = []
+        self.mismatch = None  # 예측이 틀린 가장 이른 프레임
+
+        self.connected = False
+        self.done = False
+        self.last_receive = time.perf_counter()
+        self.remote_ack = self.delay  # 상대가 받은 로컬 입력 수
+        self.remote_frame = 0
+        self.local_advantage = 0.0  # 상대보다 앞선 프레임 (패킷 지연 포함, 평균)
+        self.remote_advantage = 0.0  # 상대가 알려 준 상대 쪽 값 (평균)
+        self.next_sync = 0
+
+        self.digest = hashlib.sha1()
+        self.confirmed = 0  # 해시에 반영한 (두 입력이 모두 확정된) 프레임 수
+        self.checkpoints = {}  # 확정 프레임 수 -> 상태 해시
+        self.remote_checkpoints = {}
+        self.compared = 0  # 마지막으로 비교한 체크포인트
+        self.matched_checkpoints = 0
+        self.desync_frame = None
+        self.linger = 0
+
+        self.rollback_depths = []
+        self.resim_times = []  # 되감기마다 다시 시뮬레이션한 프레임당 시간 (초)
+        self.stalls = 0  # 예측 한도로 쉰 프레임
+        self.sync_waits = 0  # 프레임 이득 맞추기로 쉰 프레임
+
+    def begin(self, game):
+        """매치 시작 상태 만들기 (캐릭터 선택 완료 직후) - 연결은 첫 프레임에서"""
+        title_music = game.sceneManager.title_scene.bgm
+        if title_music:
+            title_music.stop()
+        game.start_match(*self.characters)
+        game.assetLoader.finish_all()  # 스프라이트 로딩 시점이 결과에 영향을 주지 않도록
+        print(f"Net: side {self.side} waiting for {self.peer.peer[0]}:{self.peer.peer[1]}")
+
+    def before_step(self, game):
+        """프레임 시작 - 입력 교환, 틀린 예측 되감기 / False면 이번 스텝은 시뮬레이션하지 않음"""
+        events = renderBackend.get_events()
+        if any(e.type == pico2d.SDL_QUIT or (e.type == pico2d.SDL_KEYDOWN and e.key == pico2d.SDLK_ESCAPE)
+               for e in events):
+            self.finish(game, 'quit')
+            return False
+        self.keys.observe(events)
+        if self.done:
+            return False
+
+        self._receive(game)
+        if not self.connected:
+            self._send(HELLO)
+            return False
+        if time.perf_counter() - self.last_receive > TIMEOUT:
+            self.finish(game, 'peer timed out')
+            return False
+
+        self._rollback(game)
+        self._confirm()
+
+        # 매치가 끝났거나 프레임 한도 - 모든 프레임이 확정되고 상대도 입력을 다 받으면 종료
+        if game.game_over or (self.frame_limit and self.frame >= self.frame_limit):
+            self._send(INPUT)
+            if self.confirmed == self.frame and self.remote_ack >= self.frame:
+                self.linger += 1
+                if self.linger > LINGER:
+                    self.finish(game, 'match over' if game.game_over else 'frame limit')
+            return False
+
+        if self.frame - len(self.remote) >= self.max_prediction:
+            self.stalls += 1
+            self._send(INPUT)
+            return False
+        if self.frame >= self.next_sync and self.local_advantage - self.remote_advantage >= SYNC_THRESHOLD:
+            self.next_sync = self.frame + SYNC_INTERVAL
+            self.sync_waits += 1
+            self._send(INPUT)
+            return False
+
+        # 두 키 세트 중 어느 쪽으로 조작해도 내 캐릭터 입력 (캐릭터 변경 키는 넷플레이에서 쓰지 않음)
+        self.local.append(self.keys.take(0) | self.keys.take(1))
+        self.keys.take_character()
+        self._send(INPUT)
+        self._prepare(game, self.frame)
+        self.extra_events = [e for e in events if e.type == pico2d.SDL_KEYDOWN and e.key == pico2d.SDLK_F1]
+        return True
+
+    def after_step(self, game):
+        """프레임 끝 - 상태 기록"""
+        self.signatures[self.frame] = inputReplay.state_signature(game)
+        self.frame += 1
+
+    def frame_events(self):
+        """시뮬레이션 중인 프레임의 키 이벤트 (두 플레이어 입력 바이트로 만듦)"""
+        frame = self.sim_frame
+        inputs = [None, None]
+        inputs[self.side] = self.local
+        inputs[1 - self.side] = self.used
+        events, self.extra_events = self.extra_events, []
+        for player in (0, 1):
+            previous = inputs[player][frame - 1] & ~inputReplay.PRESS_BIT if frame else 0
+            events.extend(inputReplay.key_events(player, inputs[player][frame], previous)[0])
+        return events
+
+    def _prepare(self, game, frame):
+        """frame 시뮬레이션 준비 - 되감기용 상태 저장, 상대 입력(없으면 예측) 정하기"""
+        self.snapshots[frame] = gameSnapshot.save(game)
+        if frame < len(self.remote):
+            remote = self.remote[frame]
+        else:
+            # 예측: 마지막으로 받은 입력의 키를 계속 누르고 있음 (새로 누르는 공격은 없음)
+            remote = self.remote[-1] & ~inputReplay.PRESS_BIT if self.remote else 0
+        self.used.append(remote)
+        self.sim_frame = frame
+
+    def _rollback(self, game):
+        """예측이 틀린 프레임으로 되감아 현재 프레임까지 다시 시뮬레이션"""
+        if self.mismatch is None:
+            return
+        start, end = self.mismatch, self.frame
+        self.mismatch = None
+        begin = time.perf_counter()
+        with _muted(game):
+            gameSnapshot.load(game, self.snapshots[start])
+            del self.used[start:]
+            for frame in range(start, end):
+                self._prepare(game, frame)
+                game.spriteManager.save_previous_positions()
+                game.update(game.sim_dt)
+                self.signatures[frame] = inputReplay.state_signature(game)
+                if game.game_over:
+                    # 매치가 끝나는 프레임 - 양쪽 모두 여기서 멈추도록 뒤 프레임은 버림
+                    end = self.frame = frame + 1
+                    del self.used[end:]
+                    break
+        self.rollback_depths.append(end - start)
+        self.resim_times.append((time.perf_counter() - begin) / (end - start))
+
+    def _confirm(self):
+        """두 입력이 모두 확정된 프레임을 상태 해시에 반영하고 더는 되감지 않을 상태 정리"""
+        limit = min(len(self.remote), self.frame)
+        while self.confirmed < limit:
+            self.digest.update(self.signatures.pop(self.confirmed))
+            self.snapshots.pop(self.confirmed, None)
+            self.confirmed += 1
+            if self.confirmed % self.interval == 0:
+                self.checkpoints[self.confirmed] = self.digest.digest()[:8]
+                self._compare_checkpoint(self.confirmed)
+
+    def _compare_checkpoint(self, frame):
+        if frame <= self.compared or frame not in self.checkpoints or frame not in self.remote_checkpoints:
+            return
+        self.compared = frame
+        if self.checkpoints[frame] == self.remote_checkpoints.pop(frame):
+            self.matched_checkpoints += 1
+        elif self.desync_frame is None:
+            self.desync_frame = frame
+            print(f"Net: desync detected by frame {frame}")
+
+    def _send(self, kind):
+        if kind == HELLO:
+            self.peer.send(struct.pack(PACKET, MAGIC, HELLO, 0, 0, 0, 0, 0, self.session_id, 0))
+            return
+        start = self.remote_ack
+        inputs = self.local[start:start + MAX_RESEND]
+        checkpoint = self.confirmed - self.confirmed % self.interval
+        advantage = max(-128, min(127, self.frame - self.remote_frame))
+        header = struct.pack(PACKET, MAGIC, INPUT, start, len(self.remote), self.frame, advantage, checkpoint,
+                             self.checkpoints.get(checkpoint, bytes(8)), len(inputs))
+        self.peer.send(header + bytes(inputs))
+
+    def _receive(self, game):
+        for data in self.peer.receive():
+            if len(data) < PACKET_SIZE:
+                continue
+            magic, kind, start, ack, frame, advantage, checkpoint, digest, count = struct.unpack_from(PACKET, data)
+            if magic != MAGIC:
+                continue
+            self.last_receive = time.perf_counter()
+            if kind == HELLO:
+                if digest != self.session_id:
+                    self.finish(game, 'peer uses different characters or settings')
+                    return
+                self.connected = True
+                continue
+            self.connected = True
+            self.remote_ack = max(self.remote_ack, ack)
+            self.remote_frame = max(self.remote_frame, frame)
+            self.local_advantage += (self.frame - frame - self.local_advantage) * ADVANTAGE_SMOOTHING
+            self.remote_advantage += (advantage - self.remote_advantage) * ADVANTAGE_SMOOTHING
+            if checkpoint > self.compared:
+                self.remote_checkpoints[checkpoint] = digest
+                self._compare_checkpoint(checkpoint)
+
+            # 이미 받은 입력 뒤에 이어지는 부분만 사용 (앞에 빠진 입력은 다음 패킷에서 다시 옴)
+            received = len(self.remote)
+            if not start <= received < start + count:
+                continue
+            for index, value in enumerate(data[PACKET_SIZE + received - start:PACKET_SIZE + count], received):
+                if index < len(self.used) and self.used[index] != value and self.mismatch is None:
+                    self.mismatch = index
+                self.remote.append(value)
+
+    def finish(self, game, reason):
+        """세션 종료 - 통계 출력 후 게임 종료"""
+        if self.done:
+            return
+        self.done = True
+        game.running = False
+        self.peer.close()
+        stats = self.stats()
+        stats['reason'] = reason
+        print(f"Net: {reason} at frame {self.frame} ({stats['confirmed']} confirmed), "
+              f"{stats['rollbacks']} rollbacks ({stats['rollback_rate']:.1%} of frames), "
+              f"depth avg {stats['depth_avg']:.1f} / max {stats['depth_max']}, "
+              f"resim {stats['resim_ms_avg']:.3f} ms/frame (p95 {stats['resim_ms_p95']:.3f}), "
+              f"{stats['stalls']} stalls, {stats['sync_waits']} sync waits, "
+              f"{stats['checkpoints_matched']} checkpoints matched"
+              + (f", DESYNC by frame {stats['desync_frame']}" if stats['desync_frame'] else ''))
+        print('NETSTATS ' + json.dumps(stats))
+
+    def stats(self):
+        """되감기 빈도/깊이, 프레임당 재시뮬레이션 비용 등"""
+        depths = self.rollback_depths
+        resim_ms = sorted(t * 1000 for t in self.resim_times)
+        return {
+            'side': self.side,
+            'frames': self.frame,
+            'confirmed': self.confirmed,
+            'rollbacks': len(depths),
+            'rollback_rate': len(depths) / self.frame if self.frame else 0.0,
+            'resim_frames': sum(depths),
+            'depth_avg': sum(depths) / len(depths) if depths else 0.0,
+            'depth_max': max(depths, default=0),
+            'depth_histogram': {depth: depths.count(depth) for depth in sorted(set(depths))},
+            'resim_ms_avg': sum(resim_ms) / len(resim_ms) if resim_ms else 0.0,
+            'resim_ms_p95': resim_ms[min(len(resim_ms) - 1, int(round(0.95 * (len(resim_ms) - 1))))] if resim_ms else 0.0,
+            'stalls': self.stalls,
+            'sync_waits': self.sync_waits,
+            'frame_advantage': round(self.local_advantage - self.remote_advantage, 2),
+            'packets_sent': self.peer.sent,
+            'packets_received': self.peer.received,
+            'checkpoints_matched': self.matched_checkpoints,
+            'desync_frame': self.desync_frame,
+            'checkpoints': {frame: digest.hex() for frame, digest in self.checkpoints.items()},
+        }
+
+
+@contextlib.contextmanager
+def _muted(game):
+    """다시 시뮬레이션하는 동안 효과음 끄기 (이미 한 번 재생한 프레임)"""
+    silent = renderBackend.NullSound()
+    targets = [(player, name) for player in (game.playerLeft, game.playerRight)
+               for name in ('hit_sound', 'swoosh_sound')]
+    targets.append((game.sceneManager.play_scene, 'round_over_sound'))
+    saved = [getattr(target, name, None) for target, name in targets]
+    for (target, name), sound in zip(targets, saved):
+        if sound:
+            setattr(target, name, silent)
+    try:
+        yield
+    finally:
+        for (target, name), sound in zip(targets, saved):
+            if sound:
+                setattr(target, name, sound)
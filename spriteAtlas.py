@@ -0,0 +1,126 @@
+"""
+스프라이트 아틀라스 런타임 모듈
+Tools/atlasBuilder.py가 만든 시트 이미지와 프레임 테이블(JSON)을 읽어
+프레임마다 clip_draw / clip_composite_draw로 그리는 AtlasFrame을 제공
+"""
+import json
+import pathlib
+
+import assetBundle
+
+from resourceCache import resources
+from startupProfiler import profiler
+
+ATLAS_VERSION = 2  # 2: 투명 테두리 잘라내기 (프레임별 ox/oy/fw/fh)
+
+
+def get_atlas_dir():
+    """아틀라스 출력 폴더 경로 반환"""
+    return pathlib.Path.cwd() / 'Resources' / 'Atlas'
+
+
+class AtlasFrame:
+    """아틀라스 시트의 한 영역 - pico2d Image와 같은 draw 인터페이스 제공
+
+    투명 테두리를 잘라낸 프레임은 시트에 남은 영역만 그리되, w/h와 그리는 위치는
+    원래 프레임 기준이라 화면 배치는 잘라내기 전과 동일
+    """
+
+    def __init__(self, sheet, x, y, w, h, offset_x=0, offset_y=0, frame_w=None, frame_h=None):
+        self.sheet = sheet  # 시트 이미지 (pico2d Image)
+        # 시트에 저장된 영역 크기
+        self.clip_w = w
+        self.clip_h = h
+        # 원래 프레임 크기 (렌더링 코드는 이 크기 기준으로 그림)
+        self.w = w if frame_w is None else frame_w
+        self.h = h if frame_h is None else frame_h
+        # 저장된 영역의 원래 프레임 안 위치 (좌상단 기준)
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        # 저장된 영역 중심이 원래 프레임 중심에서 떨어진 거리 (화면 좌표, y는 위쪽이 +)
+        self.center_dx = offset_x + w / 2 - self.w / 2
+        self.center_dy = self.h / 2 - (offset_y + h / 2)
+        # 프레임 테이블은 좌상단 기준 좌표, pico2d의 clip 계열은 좌하단 기준
+        self.left = x
+        self.bottom = sheet.h - y - h
+
+    def _dest(self, x, y, w, h, flip_x):
+        """원래 프레임을 (x, y)에 w x h로 그릴 때 저장된 영역이 그려질 위치와 크기"""
+        sx, sy = w / self.w, h / self.h
+        dx = -self.center_dx if flip_x else self.center_dx
+        return x + dx * sx, y + self.center_dy * sy, self.clip_w * sx, self.clip_h * sy
+
+    def draw(self, x, y, w=None, h=None):
+        """시트에서 프레임 영역만 잘라서 그리기"""
+        if w is None and h is None:
+            w, h = self.w, self.h
+        self.sheet.clip_draw(self.left, self.bottom, self.clip_w, self.clip_h, *self._dest(x, y, w, h, False))
+
+    def composite_draw(self, rad, flip, x, y, w=None, h=None):
+        """반전 포함 그리기 (회전은 잘라낸 영역 중심 기준)"""
+        if w is None and h is None:
+            w, h = self.w, self.h
+        self.sheet.clip_composite_draw(self.left, self.bottom, self.clip_w, self.clip_h, rad, flip,
+                                       *self._dest(x, y, w, h, 'h' in flip))
+
+    def mirrored(self, mirrored_sheet):
+        """좌우 반전된 시트에서 같은 프레임을 가리키는 AtlasFrame (x만 반전, y는 그대로)"""
+        top = self.sheet.h - self.bottom - self.clip_h
+        return AtlasFrame(mirrored_sheet, self.sheet.w - self.left - self.clip_w, top, self.clip_w, self.clip_h,
+                          self.w - self.offset_x - self.clip_w, self.offset_y, self.w, self.h)
+
+
+def read_atlas_table(character_type):
+    """캐릭터 프레임 테이블 읽기 - 빌드 결과가 없거나 버전이 다르면 None 반환"""
+    table_path = get_atlas_dir() / f'{character_type}.json'
+    if not assetBundle.exists(table_path):
+        return None
+
+    table = json.loads(assetBundle.read_bytes(table_path).decode('utf-8'))
+
+    if table.get('version') != ATLAS_VERSION:
+        print(f"Warning: Atlas version mismatch for {character_type} - rebuild with Tools/atlasBuilder.py")
+        return None
+    return table
+
+
+def get_sheet_paths(table):
+    """프레임 테이블의 시트 이미지 경로 목록"""
+    return [get_atlas_dir() / name for name in table['sheets']]
+
+
+def scale_rect(x, y, w, h, scale):
+    """시트를 scale배로 리샘플링했을 때의 프레임 영역 (양 끝 좌표를 반올림해 이웃 프레임과 겹치지 않음)"""
+    left, top = round(x * scale), round(y * scale)
+    return left, top, round((x + w) * scale) - left, round((y + h) * scale) - top
+
+
+def build_atlas_sprites(table, sheets, scale=None):
+    """로딩된 시트 이미지로 상태별 AtlasFrame 리스트 구성 (scale: 시트를 미리 리샘플링한 배율)"""
+    scale = scale or 1
+    frames = []
+    for fr in table['frames']:
+        frame_w, frame_h = fr.get('fw', fr['w']), fr.get('fh', fr['h'])
+        frames.append(AtlasFrame(sheets[fr['sheet']], *scale_rect(fr['x'], fr['y'], fr['w'], fr['h'], scale),
+                                 round(fr.get('ox', 0) * scale), round(fr.get('oy', 0) * scale),
+                                 frame_w * scale, frame_h * scale))
+    return {
+        state: [frames[i] for i in indices]
+        for state, indices in table['animations'].items()
+    }
+
+
+def load_character_atlas(character_type, owner=None, scale=None):
+    """캐릭터 아틀라스 동기 로딩 - 빌드 결과가 없으면 None 반환
+
+    owner: 리소스 캐시 소유자, scale: 시트를 미리 리샘플링할 배율
+    """
+    table = read_atlas_table(character_type)
+    if table is None:
+        return None
+    # 시트는 캐릭터당 몇 장뿐이므로 한 번씩만 로딩 (여러 애니메이션이 한 시트를 공유하므로 시트 단위로 측정)
+    sheets = []
+    for path in get_sheet_paths(table):
+        with profiler.section(f'sheet {pathlib.Path(path).name}'):
+            sheets.append(resources.load_image(path, owner, size=scale))
+    return build_atlas_sprites(table, sheets, scale)
@@ -1,57 +1,45 @@
-import pico2d
-import pathlib
+import renderBackend
+from collections import OrderedDict
+from functools import partial
 import config
+import frameData
+import moveRegistry
+import playerStateMachine
+import animationController
+import assetManifest
+import spriteAtlas
+import spriteMirror
+from resourceCache import resources
+from startupProfiler import profiler
 
 class SpriteManager:
     def __init__(self):
-        self.shared_sprites = {}  # 캐릭터별 공유 스프라이트 딕셔너리
-        self.player1_state = 'Idle'
-        self.player2_state = 'Idle'
-        self.player1_frame = 0
-        self.player2_frame = 0
-
-        # 고정된 애니메이션 재생 시간 (초) - config.py 기준
-        self.animation_durations = {
-            'Idle': 1.0,           # 1초 동안 재생
-            'Walk': 0.8,           # 0.8초 동안 재생
-            'BackWalk': 0.8,       # 0.8초 동안 재생
-            'fastMiddleATK': 0.6,  # Fast 공격: 0.6초
-            'fastLowerATK': 0.4,   # Fast 공격: 0.4초
-            'fastUpperATK': 0.6,   # Fast 공격: 0.6초
-            'strongMiddleATK': 0.9, # Strong 공격: 0.9초
-            'strongUpperATK': 1.8,  # Strong 공격: 1.8초 (12프레임)
-            'strongLowerATK': 1.35, # Strong 공격: 1.35초 (9프레임)
-            'rageSkill': 1.0,      # Rage 스킬: 1초 (18프레임)
-            # 'hit'는 이후 guard와 동일하게 맞추기 위해 임시값 제거
-            'hit': 0.3,
-            'guard': 0.9,          # 가드: 0.9초 (2프레임을 천천히 재생)
-            # 연계 공격들
-            'fastMiddleATK2': 0.6,
-            'fastMiddleATK3': 0.6,
-            'strongMiddleATK2': 1.2,
-            'strongUpperATK2': 0.75,
-        }
-        # hit 재생시간을 guard와 동일하게 강제 (guard 시간 변경 시 자동 동기화)
-        self.animation_durations['hit'] = self.animation_durations.get('guard', self.animation_durations.get('hit', 0.3))
+        self.shared_sprites = OrderedDict()  # 캐릭터별 공유 스프라이트 (오래 안 쓴 순서, LRU)
+        self.mirrored_sprites = {}  # 캐릭터별 좌우 반전 스프라이트 (shared_sprites와 같이 로딩/해제)
+        self.use_mirrored = config.USE_MIRRORED_SPRITES
+        self.max_resident_characters = 2  # 동시에 유지할 캐릭터 수 (한 매치는 최대 2캐릭터)
+        self.loader = None  # AssetLoader (설정되면 prefetch가 백그라운드 디코딩으로 진행)
+        self.pending_loads = {}  # 백그라운드 로딩 중인 캐릭터 -> 로딩 그룹 이름
+        self.waiting_character = None  # get_character_sprites가 로딩 완료를 기다리는 캐릭터
+        # 아틀라스 사용 여부 (Resources/Atlas에 빌드 결과가 없으면 개별 파일로 대체)
+        self.use_atlas = config.USE_SPRITE_ATLAS
+
+        # 고정된 애니메이션 재생 시간 (초) - hit는 guard와 같음 (moveRegistry.ANIMATION_DURATIONS)
+        self.animation_durations = dict(moveRegistry.ANIMATION_DURATIONS)
+        self.frame_units = {}  # (상태, 스프라이트 수, 고정 프레임 간격) -> 프레임 간격 (animationController 단위)
 
-        self.frame_timer = 0.0  # 프레임 타이머
-        self.player2_frame_timer = 0.0  # 플레이어2용 프레임 타이머
         # 1280x720 -> 1920x1080 스케일링을 위한 배율
         self.scale_factor = 1.5
+        # 로딩 시 화면 크기로 리샘플링할 배율 (None이면 원본 크기로 로딩하고 그릴 때 확대)
+        self.bake_scale = self.scale_factor if config.BAKE_DISPLAY_SCALE else None
+        # 그릴 때 곱할 배율 (미리 리샘플링했으면 1.0 - 1:1 복사)
+        self.draw_scale = self.scale_factor / (self.bake_scale or 1)
 
-        # 플레이어 초기 위치도 스케일링 - 그라운드에 위치, 충돌하지 않도록 간격 조정
-        self.player1_x = 400 * self.scale_factor  # 600
-        self.player1_y = config.GROUND_Y  # 그라운드에 위치
-        self.player1_dir = -1  # 방향 (1: 왼쪽, -1: 오른쪽)
-        self.player2_x = 600 * self.scale_factor  # 900 (더 넓은 간격)
-        self.player2_y = config.GROUND_Y  # 그라운드에 위치
-        self.player2_dir = -1
-        self.player1_ref = None  # Player1 참조
-        self.player2_ref = None  # Player2 참조
-
-        # 캐릭터 타입 추적
-        self.player1_character_type = 'thief'
-        self.player2_character_type = 'priest'
+        # 엔티티별 애니메이션 (그리는 순서) - 플레이어 초기 위치도 스케일링, 그라운드에 위치, 충돌하지 않도록 간격 조정
+        self.animations = [
+            animationController.AnimationController('Player1', 'thief', 400 * self.scale_factor, config.GROUND_Y),
+            animationController.AnimationController('Player2', 'priest', 600 * self.scale_factor, config.GROUND_Y),
+        ]
 
         # 캐릭터별 y 위치 오프셋도 스케일링
         self.character_y_offsets = {
@@ -60,630 +48,526 @@ class SpriteManager:
             'fighter': -30 * self.scale_factor   # -45
         }
 
-    def set_player_references(self, player1, player2):
-        """플레이어 참조를 설정"""
-        self.player1_ref = player1
-        self.player2_ref = player2
-        # 초기 캐릭터 타입 설정
-        if player1:
-            self.player1_character_type = player1.get_character_type()
-        if player2:
-            self.player2_character_type = player2.get_character_type()
-
-    def load_sprites(self):
-        """스프라이트 로딩 - 예외 처리 추가"""
+    def set_player_references(self, *players):
+        """플레이어 참조를 설정 (순서대로 애니메이션 하나씩, 모자라면 추가)"""
+        for i, player in enumerate(players):
+            if i == len(self.animations):
+                self.animations.append(animationController.AnimationController(
+                    f'Player{i + 1}', 'thief', player.x if player else 0.0, config.GROUND_Y))
+            animation = self.animations[i]
+            animation.owner = player
+            if player:
+                # 캐릭터 변경 시 스프라이트를 미리 로딩할 수 있도록 역참조 설정
+                player.sprite_manager = self
+                # 초기 캐릭터 타입 설정
+                animation.character_type = player.get_character_type()
+
+    def load_sprites(self, character_types=None):
+        """스프라이트 일괄 로딩 (기본: 모든 캐릭터) - 평소에는 필요할 때 캐릭터 단위로 로딩됨"""
+        for character_type in (character_types or assetManifest.ANIMATION_SPECS):
+            with profiler.section(f'character {character_type}'):
+                self.shared_sprites[character_type] = self._load_character(character_type)
+                self.shared_sprites.move_to_end(character_type)
+                with profiler.section('mirror'):
+                    self._build_mirrored(character_type)
+
+    def _load_character(self, character_type):
+        """캐릭터 하나의 스프라이트 로딩 - 실패해도 다른 캐릭터에는 영향 없음"""
+        try:
+            sprites = None
+            if self.use_atlas:
+                sprites = spriteAtlas.load_character_atlas(character_type, owner=self._owner(character_type),
+                                                           scale=self.bake_scale)
+            if sprites is None:
+                sprites = self._load_character_files(character_type)
+            print(f"Sprites loaded: {character_type}")
+            return sprites
+        except Exception as e:
+            print(f"Warning: Sprite loading failed for {character_type}: {e}")
+            # 빈 딕셔너리로 대체 (렌더링만 생략됨)
+            return {}
+
+    def _character_frame_paths(self, character_type):
+        """상태별 프레임 파일 경로 목록 (매니페스트 기준, 검증에 실패한 애니메이션은 제외)"""
+        return {
+            state: [str(path) for path in paths]
+            for state, paths in assetManifest.get_frame_paths(character_type).items()
+        }
+
+    def _load_character_files(self, character_type):
+        """개별 PNG 파일에서 캐릭터 스프라이트 로딩 (프레임당 이미지 1장)
+
+        애니메이션 단위로 로딩해 일부가 실패해도 나머지 애니메이션은 사용
+        """
+        sprites = {}
+        for state, paths in self._character_frame_paths(character_type).items():
+            try:
+                with profiler.section(f'animation {state}'):
+                    sprites[state] = [resources.load_image(path, owner=self._owner(character_type),
+                                                           size=self.bake_scale) for path in paths]
+            except Exception as e:
+                print(f"Warning: Sprite loading failed for {character_type}/{state}: {e}")
+        return sprites
+
+    def prefetch(self, character_type):
+        """캐릭터 스프라이트를 미리 로딩 (캐릭터 선택/변경 시 호출)
+
+        로더가 있으면 백그라운드 디코딩을 요청만 하고 바로 반환
+        """
+        if character_type not in assetManifest.ANIMATION_SPECS:
+            return
+        if character_type in self.shared_sprites:
+            self.shared_sprites.move_to_end(character_type)
+        elif self.loader is None:
+            self.get_character_sprites(character_type)
+        elif character_type not in self.pending_loads:
+            self._request_character(character_type)
+
+    def _request_character(self, character_type):
+        """캐릭터 스프라이트 백그라운드 로딩 요청 - 이미지가 모두 올라오면 등록"""
+        group = self._owner(character_type)
+        self.pending_loads[character_type] = group
+
+        table = spriteAtlas.read_atlas_table(character_type) if self.use_atlas else None
+        if table is not None:
+            paths = spriteAtlas.get_sheet_paths(table)
+
+            def assemble(images):
+                return spriteAtlas.build_atlas_sprites(table, images, self.bake_scale)
+        else:
+            frame_paths = self._character_frame_paths(character_type)
+            paths = list(dict.fromkeys(p for state_paths in frame_paths.values() for p in state_paths))
+            index = {path: i for i, path in enumerate(paths)}
+
+            def assemble(images):
+                # 프레임이 하나라도 실패한 애니메이션만 제외 (부분 로딩)
+                sprites = {}
+                for state, state_paths in frame_paths.items():
+                    frames = [images[index[p]] for p in state_paths]
+                    if all(frame is not None for frame in frames):
+                        sprites[state] = frames
+                    else:
+                        print(f"Warning: Sprite loading failed for {character_type}/{state}")
+                return sprites
+
+        images = [None] * len(paths)
+        remaining = [len(paths)]
+        errors = []
+
+        def on_done(i, image):
+            images[i] = image
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                if errors and table is not None:
+                    # 아틀라스 시트가 빠지면 프레임 인덱스를 맞출 수 없으므로 전체 실패
+                    print(f"Warning: Sprite loading failed for {character_type}: {errors[0]}")
+                    self._install_character(character_type, {})
+                else:
+                    self._install_character(character_type, assemble(images))
+                    print(f"Sprites loaded: {character_type}")
+
+        def on_error(i, e):
+            errors.append(e)
+            print(f"Warning: {e}")
+            on_done(i, None)
+
+        if not paths:
+            self._install_character(character_type, {})
+            return
+
+        for i, path in enumerate(paths):
+            self.loader.request_image(path, partial(on_done, i), partial(on_error, i),
+                                      group=group, owner=group, size=self.bake_scale)
+
+    def _owner(self, character_type):
+        """리소스 캐시 소유자 이름 (백그라운드 로딩 그룹 이름으로도 사용)"""
+        return f'sprites:{character_type}'
+
+    def _install_character(self, character_type, sprites):
+        """로딩이 끝난 스프라이트 세트 등록"""
+        self.pending_loads.pop(character_type, None)
+        self.shared_sprites[character_type] = sprites
+        self._build_mirrored(character_type)
+        self.evict_unused_characters(keep=character_type)
+
+    def _build_mirrored(self, character_type):
+        """왼쪽을 바라볼 때 쓸 반전 스프라이트를 한 번만 생성 (실패하면 반전 그리기로 대체)"""
+        if not self.use_mirrored:
+            return
         try:
-            base_path = pathlib.Path.cwd() / 'Resources' / 'Character'
-
-            # Priest 캐릭터 스프라이트 로딩
-            self.shared_sprites['priest'] = {
-                'Idle': [pico2d.load_image(str(base_path / 'priest' / 'idle' / f'{i}.png')) for i in range(4)],
-                'Walk': [pico2d.load_image(str(base_path / 'priest' / 'walk' / f'{i}.png')) for i in range(8)],
-                'BackWalk': [pico2d.load_image(str(base_path / 'priest' / 'BackWalk' / f'{i}.png')) for i in range(8)],
-                'fastMiddleATK': [pico2d.load_image(str(base_path / 'priest' / 'fastMiddleATK' / f'{i}.png')) for i in range(6)],
-                'strongMiddleATK': [pico2d.load_image(str(base_path / 'priest' / 'strongMiddleATK' / f'{i}.png')) for i in range(6)],
-                'strongMiddleATK2': [pico2d.load_image(str(base_path / 'priest' / 'strongMiddleATK' / f'{i}.png')) for i in range(6, 14)],
-                'strongUpperATK': [pico2d.load_image(str(base_path / 'priest' / 'strongUpperATK' / f'{i}.png')) for i in range(12)],
-                'strongLowerATK': [pico2d.load_image(str(base_path / 'priest' / 'strongLowerATK' / f'{i}.png')) for i in range(9)],
-                'hit': [pico2d.load_image(str(base_path / 'priest' / 'hit' / f'{i}.png')) for i in range(6)],
-                'guard': [pico2d.load_image(str(base_path / 'priest' / 'guard' / f'{i}.png')) for i in range(2)]  # Guard 스프라이트 추가 (0~1)
-            }
-
-            # thief 캐릭터 스프라이트 로딩
-            self.shared_sprites['thief'] = {
-                'Idle': [pico2d.load_image(str(base_path / 'Thief' / 'idle' / f'{i}.png')) for i in range(6)],
-                'Walk': [pico2d.load_image(str(base_path / 'Thief' / 'walk' / f'{i}.png')) for i in range(6)],
-                'BackWalk': [pico2d.load_image(str(base_path / 'Thief' / 'BackWalk' / f'{i}.png')) for i in range(7)],
-                'fastMiddleATK': [pico2d.load_image(str(base_path / 'Thief' / 'fastMiddleATK' / f'{i}.png')) for i in range(6)],
-                'fastMiddleATK2': [pico2d.load_image(str(base_path / 'Thief' / 'fastMiddleATK' / f'{i}.png')) for i in range(6, 12)],
-                'fastMiddleATK3': [pico2d.load_image(str(base_path / 'Thief' / 'fastMiddleATK' / f'{i}.png')) for i in range(12, 18)],
-                'strongMiddleATK': [pico2d.load_image(str(base_path / 'Thief' / 'strongMiddleATK' / f'{i}.png')) for i in range(5)],
-                'strongMiddleATK2': [pico2d.load_image(str(base_path / 'Thief' / 'strongMiddleATK' / f'{i}.png')) for i in range(5, 10)],
-                'strongUpperATK': [pico2d.load_image(str(base_path / 'Thief' / 'strongUpperATK' / f'{i}.png')) for i in range(5)],
-                'strongUpperATK2': [pico2d.load_image(str(base_path / 'Thief' / 'strongUpperATK' / f'{i}.png')) for i in range(5, 10)],
-                'strongLowerATK': [pico2d.load_image(str(base_path / 'Thief' / 'strongLowerATK' / f'{i}.png')) for i in range(4)],
-                'hit': [pico2d.load_image(str(base_path / 'Thief' / 'hit' / f'{i}.png')) for i in range(6)],
-                'guard': [pico2d.load_image(str(base_path / 'Thief' / 'Guard' / f'{i}.png')) for i in range(2)]
-            }
-
-            # fighter 캐릭터 스프라이트 로딩
-            self.shared_sprites['fighter'] = {
-                'Idle': [pico2d.load_image(str(base_path / 'fighter' / 'idle' / f'{i}.png')) for i in range(4)],
-                'Walk': [pico2d.load_image(str(base_path / 'fighter' / 'walk' / f'{i}.png')) for i in range(8)],
-                'BackWalk': [pico2d.load_image(str(base_path / 'fighter' / 'BackWalk' / f'{i}.png')) for i in range(5)],
-                'fastMiddleATK': [pico2d.load_image(str(base_path / 'fighter' / 'fastMiddleATK' / f'{i}.png')) for i in range(4)],
-                'fastMiddleATK2': [pico2d.load_image(str(base_path / 'fighter' / 'fastMiddleATK' / f'{i}.png')) for i in range(4, 7)],
-                'fastMiddleATK3': [pico2d.load_image(str(base_path / 'fighter' / 'fastMiddleATK' / f'{i}.png')) for i in range(7, 10)],
-                'strongMiddleATK': [pico2d.load_image(str(base_path / 'fighter' / 'strongMiddleATK' / f'{i}.png')) for i in range(5)],
-                'strongLowerATK': [pico2d.load_image(str(base_path / 'fighter' / 'strongLowerATK' / f'{i}.png')) for i in range(5)],
-                'strongUpperATK': [pico2d.load_image(str(base_path / 'fighter' / 'strongUpperATK' / f'{i}.png')) for i in range(4)],
-                'strongUpperATK2': [pico2d.load_image(str(base_path / 'fighter' / 'strongUpperATK' / f'{i}.png')) for i in range(4, 8)],
-                'fastLowerATK': [pico2d.load_image(str(base_path / 'fighter' / 'fastLowerATK' / f'{i}.png')) for i in range(4)],  # 0~3
-                'fastUpperATK': [pico2d.load_image(str(base_path / 'fighter' / 'fastUpperATK' / f'{i}.png')) for i in range(6)],  # 0~5
-                'hit': [pico2d.load_image(str(base_path / 'fighter' / 'hit' / f'{i}.png')) for i in range(6)],
-                'guard': [pico2d.load_image(str(base_path / 'fighter' / 'Guard' / f'{i}.png')) for i in range(2)]
-            }
+            self.mirrored_sprites[character_type] = spriteMirror.mirror_sprites(self.shared_sprites[character_type])
         except Exception as e:
-            print(f"Warning: Sprite loading failed: {e}")
-            # 기본 빈 딕셔너리로 초기화
-            self.shared_sprites = {
-                'priest': {}, 'thief': {}, 'fighter': {}
-            }
+            print(f"Warning: Mirrored sprite creation failed for {character_type}: {e}")
+            self.mirrored_sprites.pop(character_type, None)
+
+    def evict_unused_characters(self, keep=None):
+        """오래 사용하지 않은 캐릭터부터 해제 - 현재 플레이어가 쓰는 캐릭터와 keep은 유지"""
+        in_use = {animation.character_type for animation in self.animations}
+        in_use.update((keep, self.waiting_character))
+        for character_type in list(self.shared_sprites):
+            if len(self.shared_sprites) <= self.max_resident_characters:
+                break
+            if character_type not in in_use:
+                # 참조가 사라지면 pico2d Image 소멸 시 텍스처도 해제됨
+                del self.shared_sprites[character_type]
+                self.mirrored_sprites.pop(character_type, None)
+                resources.release(self._owner(character_type))
+                print(f"Sprites evicted: {character_type}")
 
     def get_character_sprites(self, character_type):
-        """캐릭터 타입에 따른 스프라이트 반환"""
-        return self.shared_sprites.get(character_type, self.shared_sprites.get('priest', {}))
+        """캐릭터 타입에 따른 스프라이트 반환 - 처음 요청될 때 로딩"""
+        sprites = self.shared_sprites.get(character_type)
+        if sprites is not None:
+            # 최근 사용 순서 갱신 (LRU)
+            self.shared_sprites.move_to_end(character_type)
+            return sprites
+
+        if character_type not in assetManifest.ANIMATION_SPECS:
+            return {}
+
+        if character_type in self.pending_loads:
+            # 백그라운드 로딩 중이면 남은 디코딩을 기다려 바로 등록
+            # (wait가 다른 캐릭터 결과도 함께 등록하므로 그동안 해제되지 않도록 보호)
+            self.waiting_character = character_type
+            try:
+                self.loader.wait(self.pending_loads[character_type])
+            finally:
+                self.waiting_character = None
+            return self.shared_sprites.get(character_type, {})
+
+        sprites = self._load_character(character_type)
+        self._install_character(character_type, sprites)
+        return sprites
+
+    def update(self, deltaTime):
+        """시뮬레이션 1스텝 - 플레이어 상태/위치를 읽어 모든 애니메이션 진행 (플레이어 업데이트 후에 호출)
+
+        모든 애니메이션의 시간을 한 번에 진행하고, 프레임 경계를 넘은 애니메이션만 프레임 규칙을 처리
+        """
+        for animation in self.animations:
+            self._begin_step(animation)
+
+        for animation in animationController.advance_all(self.animations, animationController.to_units(deltaTime)):
+            animation.settled = self._play_due_frames(animation)
 
-    def _handle_animation_completion(self, player_ref, state, character_type, is_player1=True):
-        """애니메이션 완료 시 처리 로직"""
-        if not player_ref:
+        # 연계 가능 시점 체크
+        for animation in self.animations:
+            owner = animation.owner
+            if owner and owner.is_attacking and animation.settled:
+                self._update_combo_availability(owner, animation.state, animation.character_type, animation.frame)
+
+    def _begin_step(self, animation):
+        """캐릭터/상태 변경 감지, 위치 동기화, 프레임 간격과 공격 판정 구간 갱신"""
+        animation.settled = True
+        owner = animation.owner
+        if owner:
+            # 캐릭터 타입 변경 감지
+            character_type = owner.get_character_type()
+            if character_type != animation.character_type:
+                animation.character_type = character_type
+                animation.reset()
+                print(f"{animation.label} character changed to: {character_type}")
+                # 이전 캐릭터가 더 이상 쓰이지 않으면 해제
+                self.evict_unused_characters()
+
+            # 가드 애니메이션 리셋 체크 (상태 변경과 별도로)
+            new_state = owner.state
+            if animation.state == 'guard' and new_state == 'guard' and owner.should_reset_guard_animation():
+                print(f"{animation.label} guard animation reset - extending guard")
+                animation.reset()
+
+            # 상태가 변경되면 이번 스텝부터 처음 프레임으로
+            if animation.state != new_state:
+                print(f"{animation.label} state changed: {animation.state} -> {new_state}")
+                animation.reset(new_state)
+                # 새로운 공격 시작 시 기존의 타격 처리 플래그들 초기화
+                if moveRegistry.lookup(new_state).is_attack:
+                    owner.reset_attack_hit_flag()
+                    owner.can_process_hit = False
+                    owner.move_frame = 0
+
+            animation.x, animation.y, animation.dir = owner.x, owner.y, owner.dir
+
+        self._refresh_frame_time(animation)
+
+        # 공격 중이면 프레임 데이터로 타격 판정 구간 확인 (스프라이트 타이머가 아닌 공격 시작 후 프레임 수 기준)
+        if not (owner and animation.frame_count):
+            return
+        move = moveRegistry.lookup(animation.state)
+        if move.is_attack:
+            owner.move_frame += 1
+            active = frameData.hitbox(animation.character_type, move.id, owner.move_frame) is not None
+            # 판정 프레임이어도 이번 공격이 이미 맞았거나 막혔으면 다시 켜지 않음 (한 공격당 한 번)
+            owner.can_process_hit = active and not owner.attack_hit_processed
+
+    def _refresh_frame_time(self, animation):
+        """현재 애니메이션의 스프라이트 수와 프레임 간격 (스프라이트가 없으면 0 - 진행하지 않음)"""
+        sprites = self.get_character_sprites(animation.character_type)
+        frames = sprites.get(animation.state) if sprites else None
+        sprite_count = len(frames) if frames else 0
+        animation.frame_count = sprite_count
+        if not sprite_count:
+            animation.frame_units = 0
+            return
+        # config를 바꿔 moveRegistry.rebuild()해도 맞도록 고정 프레임 간격까지 키로 사용
+        key = (animation.state, sprite_count, moveRegistry.lookup(animation.state).frame_time)
+        frame_units = self.frame_units.get(key)
+        if frame_units is None:
+            frame_time = self._get_frame_time_for_state(animation.state, sprite_count)
+            # hit 상태는 guard와 같은 전체 재생시간으로 고정
+            if animation.state == 'hit':
+                frame_time = self.animation_durations.get('guard', self.animation_durations.get('hit', 0.3)) / sprite_count
+            frame_units = self.frame_units[key] = animationController.to_units(frame_time)
+        animation.frame_units = frame_units
+
+    def _play_due_frames(self, animation):
+        """끝난 프레임만큼 다음 프레임으로 - 연계 가능 시점을 확인할지 반환"""
+        settled = True
+        while animation.due():
+            state = animation.state
+            settled = self._next_frame(animation)
+            if animation.state != state:
+                self._refresh_frame_time(animation)
+        return settled
+
+    def _next_frame(self, animation):
+        """프레임 하나 진행 - 공격 애니메이션이 이어지는 중이면 True"""
+        owner = animation.owner
+        state = animation.state
+
+        # hit 상태 특별 처리 - airborne과 down 타입 포함
+        if state == 'hit' and owner:
+            self._next_hit_frame(animation)
             return False
 
-        # hit 상태 처리 - 완전한 상태 초기화
-        if state == 'hit':
-            # hit 애니메이션이 완료되면 hit 상태 완전 초기화
-            player_ref.reset_hit_state()
-            # SpriteManager 상태도 Idle로 변경
-            if is_player1:
-                self.player1_state = 'Idle'
-                self.player1_frame = 0
-                self.frame_timer = 0.0
-            else:
-                self.player2_state = 'Idle'
-                self.player2_frame = 0
-                self.player2_frame_timer = 0.0
-            print(f"Player {'1' if is_player1 else '2'} hit animation completed - reset to Idle")
-            return True
+        next_frame = (animation.frame + 1) % animation.frame_count
 
-        # 연계 공격 처리
-        combo_mapping = {
-            'priest': {
-                'strongMiddleATK': 'strongMiddleATK2'
-            },
-            'thief': {
-                'fastMiddleATK': 'fastMiddleATK2',
-                'fastMiddleATK2': 'fastMiddleATK3',
-                'strongMiddleATK': 'strongMiddleATK2',
-                'strongUpperATK': 'strongUpperATK2'
-            },
-            'fighter': {
-                'fastMiddleATK': 'fastMiddleATK2',
-                'fastMiddleATK2': 'fastMiddleATK3',
-                'strongUpperATK': 'strongUpperATK2'
-            }
-        }
+        # 일반 상태는 단순 순환, 단 guard는 한 번만 재생
+        if state in ['Idle', 'Walk', 'BackWalk']:
+            animation.frame = next_frame
+            return False
+        if state == 'guard':
+            # guard는 2프레임을 순차적으로 재생하고 마지막 프레임에서 완료 처리
+            if animation.frame < animation.frame_count - 1:
+                animation.frame = next_frame
+            elif owner:
+                # 가드가 연장되는지 체크 (guard_animation_reset 플래그)
+                if owner.guard_animation_reset:
+                    # 가드 연장 - 애니메이션을 처음부터 다시 시작
+                    print(f"{animation.label} guard extended - restarting animation")
+                    animation.play('guard')
+                    owner.guard_animation_reset = False
+                elif owner.is_guarding:
+                    # 정상적인 가드 완료 - 모든 가드 관련 플래그 정리하고 Idle로 전환
+                    playerStateMachine.fire(owner, 'guard_end')
+                    animation.play('Idle')
+                    print(f"{animation.label} guard animation completed - transitioning to Idle")
+            return False
 
-        # 연계 가능한 상태인지 확인
-        if (character_type in combo_mapping and
-            state in combo_mapping[character_type]):
-
-            if player_ref.combo_reserved:
-                # 연계 실행
-                next_state = combo_mapping[character_type][state]
-                if is_player1:
-                    self.player1_state = next_state
-                    self.player1_frame = 0
-                    self.frame_timer = 0.0
-                else:
-                    self.player2_state = next_state
-                    self.player2_frame = 0
-                    self.player2_frame_timer = 0.0
-
-                # 연계로 새로운 공격이 시작되므로 타격 플래그 초기화
-                player_ref.state = next_state
-                # 한 공격당 한 번만 타격 처리되도록 리셋
-                if hasattr(player_ref, 'reset_attack_hit_flag'):
-                    player_ref.reset_attack_hit_flag()
-                # 중앙 프레임 기반 히트 판정을 위해 처리 플래그 초기화
-                if hasattr(player_ref, 'can_process_hit'):
-                    player_ref.can_process_hit = False
-                player_ref.combo_reserved = False
-                player_ref.can_combo = False
-                print(f"Combo executed: {state} -> {next_state}")
-                return True
-            else:
-                # 연계 입력이 없으면 공격 종료
-                self._end_attack(player_ref, is_player1)
-                return True
+        # 공격 상태에서 애니메이션 완료 시 처리
+        if next_frame == 0:  # 애니메이션 한 사이클 완료
+            if self._handle_animation_completion(animation, state):
+                return False
 
-        # 연계가 없는 공격이나 마지막 연계 완료 - 모든 공격 상태 포함
-        self._end_attack(player_ref, is_player1)
+        animation.frame = next_frame
         return True
 
-    def _end_attack(self, player_ref, is_player1):
-        """공격 종료 처리"""
+    def _next_hit_frame(self, animation):
+        """피격 애니메이션 한 프레임 진행 - 피격 타입별로 기상 입력 대기"""
+        owner = animation.owner
+        hit_type = owner.character.hit_type
+        if hit_type == 'fast':
+            # fast 공격: 프레임 0->1 후 바로 완료
+            if animation.frame < 1:
+                animation.frame += 1
+            else:
+                self._handle_animation_completion(animation, 'hit')
+        elif hit_type == 'strong':
+            # strong 공격: 프레임 0->1->2->3->4 후 기상 대기
+            if animation.frame < 4:
+                animation.frame += 1
+                # 4번째 프레임에 도달하면 기상 가능 상태로 설정
+                if animation.frame == 4:
+                    owner.character.can_get_up = True
+                    print(f"{animation.label} can now get up (frame 4)")
+            elif animation.frame == 4:
+                # 기상 입력 체크 - 프레임 4에서 대기
+                if owner.hit_recovery_input:
+                    animation.frame = 5  # 기상 프레임
+                    owner.hit_recovery_input = False
+                    print(f"{animation.label} getting up!")
+            elif animation.frame == 5:
+                # 기상 애니메이션 완료
+                self._handle_animation_completion(animation, 'hit')
+        elif hit_type == 'airborne':
+            # 공중에 뜬 상태 - 착지할 때까지 첫 번째 프레임 유지
+            animation.frame = 0
+        elif hit_type == 'down':
+            # down 상태: 바닥에 떨어진 후 기상 대기
+            if animation.frame < 4:
+                animation.frame = 4  # down 프레임으로 즉시 이동
+            elif animation.frame == 4:
+                # 기상 입력 체크
+                if owner.hit_recovery_input:
+                    animation.frame = 5  # 기상 프레임
+                    owner.hit_recovery_input = False
+                    print(f"{animation.label} getting up from down state!")
+            elif animation.frame == 5:
+                # 기상 애니메이션 완료
+                self._handle_animation_completion(animation, 'hit')
+
+    def _handle_animation_completion(self, animation, state):
+        """애니메이션 완료 시 처리 로직 (다음 애니메이션은 넘친 시간을 이어서 재생)"""
+        owner = animation.owner
+        if not owner:
+            return False
 
-        player_ref.is_attacking = False
-        player_ref.state = 'Idle'
-        player_ref.can_combo = False
-        player_ref.combo_reserved = False
+        # hit 상태 처리 - 완전한 상태 초기화 후 Idle
+        if state == 'hit':
+            owner.reset_hit_state()
+            animation.play('Idle')
+            print(f"{animation.label} hit animation completed - reset to Idle")
+            return True
 
-        if is_player1:
-            self.player1_state = 'Idle'
-            self.player1_frame = 0
-        else:
-            self.player2_state = 'Idle'
-            self.player2_frame = 0
+        # 연계 공격 처리 (moveRegistry.COMBO_MAPPING) - 연계 입력이 있으면 실행, 없으면 공격 종료
+        next_state = moveRegistry.lookup(state).combo_next.get(animation.character_type)
+        if next_state is not None and owner.combo_reserved:
+            animation.play(next_state)
+            # 연계로 새로운 공격 시작 (타격 플래그와 공격 프레임 수 초기화)
+            playerStateMachine.fire(owner, 'combo', next_state)
+            print(f"Combo executed: {state} -> {next_state}")
+            return True
 
-        print(f"Attack ended for player {'1' if is_player1 else '2'}")
+        # 연계가 없는 공격이나 마지막 연계 완료 - 모든 공격 상태 포함
+        self._end_attack(animation)
+        return True
+
+    def _end_attack(self, animation):
+        """공격 종료 처리"""
+        playerStateMachine.fire(animation.owner, 'attack_end')
+        animation.play('Idle')
+        print(f"Attack ended for {animation.label}")
 
     def _update_combo_availability(self, player_ref, state, character_type, frame):
         """연계 가능 시점 체크"""
         if not player_ref:
             return
 
-        combo_frames = {
-            'priest': {'strongMiddleATK': 3},
-            'thief': {
-                'fastMiddleATK': 3, 'fastMiddleATK2': 3,
-                'strongMiddleATK': 3, 'strongUpperATK': 3
-            },
-            'fighter': {
-                'fastMiddleATK': 2, 'fastMiddleATK2': 2,
-                'strongUpperATK': 3
-            }
-        }
-
-        if (character_type in combo_frames and
-            state in combo_frames[character_type] and
-            frame >= combo_frames[character_type][state]):
+        combo_frame = moveRegistry.lookup(state).combo_frame.get(character_type)
+        if combo_frame is not None and frame >= combo_frame:
             if not player_ref.can_combo:
-                player_ref.can_combo = True
+                playerStateMachine.fire(player_ref, 'combo_window')
                 print(f"Combo available for {character_type} at frame {frame}")
 
     def _get_frame_time_for_state(self, state, sprite_count):
         """상태와 스프라이트 개수에 따른 프레임 시간 반환 (고정 재생 시간 기준)"""
-        total_duration = self.animation_durations.get(state, 1.0)  # 기본 1초
-
         # fast/strong 공격은 config의 고정 프레임 간격을 우선 사용
-        st = state.lower() if state else ''
-        if 'fast' in st:
-            return config.FAST_FRAME_TIME
-        if 'strong' in st:
-            return config.STRONG_FRAME_TIME
+        move = moveRegistry.lookup(state) if state else None
+        if move and move.frame_time is not None:
+            return move.frame_time
 
         if sprite_count > 0:
-            return total_duration / sprite_count
+            return self.animation_durations.get(state, 1.0) / sprite_count
         else:
             return 0.1  # 기본값
 
-    def update_player1_state(self, new_state, deltaTime):
-        # 캐릭터 타입 변경 감지
-        if self.player1_ref:
-            current_character_type = self.player1_ref.get_character_type()
-            if current_character_type != self.player1_character_type:
-                self.player1_character_type = current_character_type
-                self.player1_frame = 0
-                self.frame_timer = 0.0
-                print(f"Player1 character changed to: {current_character_type}")
-
-        # 가드 애니메이션 리셋 체크 (상태 변경과 별도로)
-        if (self.player1_ref and self.player1_state == 'guard' and
-            new_state == 'guard' and self.player1_ref.should_reset_guard_animation()):
-            print("Player1 guard animation reset - extending guard")
-            self.player1_frame = 0
-            self.frame_timer = 0.0
-
-        # 상태가 변경되면 프레임을 0으로 리셋
-        if self.player1_state != new_state:
-            print(f"Player1 state changed: {self.player1_state} -> {new_state}")
-            self.player1_state = new_state
-            self.player1_frame = 0
-            self.frame_timer = 0.0
-            # 새로운 공격 시작 시 타격 플래그 리셋
-            if self.player1_ref and 'ATK' in new_state:
-                # 공격 시작 시 기존의 타격 처리 플래그들 초기화
-                self.player1_ref.reset_attack_hit_flag()
-                self.player1_ref.can_process_hit = False
-
-        character_type = self.player1_character_type
-        sprites = self.get_character_sprites(character_type)
-
-        if sprites and self.player1_state in sprites:
-            sprite_count = len(sprites[self.player1_state])
-            # 스프라이트 개수에 따라 프레임 시간 계산
-            # 기본 프레임 시간 계산
-            current_frame_time = self._get_frame_time_for_state(self.player1_state, sprite_count)
-            # hit 상태는 guard와 같은 전체 재생시간으로 고정
-            if self.player1_state == 'hit':
-                total_hit_duration = self.animation_durations.get('guard', self.animation_durations.get('hit', 0.3))
-                current_frame_time = (total_hit_duration / sprite_count) if sprite_count > 0 else current_frame_time
-
-            # 프레임 애니메이션 업데이트
-            self.frame_timer += deltaTime
-            if self.frame_timer >= current_frame_time:
-                self.frame_timer = 0.0
-
-                # 공격 애니메이션 중 타격 처리 활성화 - 범위 확장으로 안정성 향상
-                if self.player1_ref and 'ATK' in self.player1_state:
-                    # 히트 허용: 중앙 프레임 근처(중앙-1 ~ 중앙+1)에서 허용하여 안정성 향상
-                    center = sprite_count // 2
-                    hit_start = max(0, center - 1)
-                    hit_end = min(sprite_count - 1, center + 1)
-                    # 중앙 프레임 근처에서 타격 처리 허용
-                    self.player1_ref.can_process_hit = (hit_start <= self.player1_frame <= hit_end)
-
-                # hit 상태 특별 처리 - airborne과 down 타입 추가
-                if self.player1_state == 'hit' and self.player1_ref:
-                    if self.player1_ref.character.hit_type == 'fast':
-                        # fast 공격: 프레임 0->1 후 바로 완료
-                        if self.player1_frame < 1:
-                            self.player1_frame += 1
-                        else:
-                            # fast hit 애니메이션 완료
-                            self._handle_animation_completion(self.player1_ref, 'hit', character_type, True)
-                    elif self.player1_ref.character.hit_type == 'strong':
-                        # strong 공격: 프레임 0->1->2->3->4 후 기상 대기
-                        if self.player1_frame < 4:
-                            self.player1_frame += 1
-                            # 4번째 프레임에 도달하면 기상 가능 상태로 설정
-                            if self.player1_frame == 4:
-                                self.player1_ref.character.can_get_up = True
-                                print("Player1 can now get up (frame 4)")
-                        elif self.player1_frame == 4:
-                            # 기상 입력 체크 - 프레임 4에서 대기
-                            if self.player1_ref.hit_recovery_input:
-                                self.player1_frame = 5  # 기상 프레임
-                                self.player1_ref.hit_recovery_input = False
-                                print("Player1 getting up!")
-                            # 프레임 4에서 대기 (기상 입력 대기)
-                        elif self.player1_frame == 5:
-                            # 기상 애니메이션 완료
-                            self._handle_animation_completion(self.player1_ref, 'hit', character_type, True)
-                    elif self.player1_ref.character.hit_type == 'airborne':
-                        # 공중에 뜬 상태 - 프레임 0에서 고정, 착지할 때까지 대기
-                        self.player1_frame = 0  # 공중에서는 첫 번째 프레임 유지
-                        if self.player1_ref.is_grounded and self.player1_ref.character.hit_type == 'down':
-                            # 착지 후 down 상태가 되면 프레임 4로 변경
-                            self.player1_frame = 4
-                            print("Player1 landed - now in down state")
-                    elif self.player1_ref.character.hit_type == 'down':
-                        # down 상태: 바닥에 떨어진 후 기상 대기
-                        if self.player1_frame < 4:
-                            self.player1_frame = 4  # down 프레임으로 즉시 이동
-                        elif self.player1_frame == 4:
-                            # 기상 입력 체크
-                            if self.player1_ref.hit_recovery_input:
-                                self.player1_frame = 5  # 기상 프레임
-                                self.player1_ref.hit_recovery_input = False
-                                print("Player1 getting up from down state!")
-                        elif self.player1_frame == 5:
-                            # 기상 애니메이션 완료
-                            self._handle_animation_completion(self.player1_ref, 'hit', character_type, True)
-                    return
-
-                next_frame = (self.player1_frame + 1) % sprite_count
-
-                # 일반 상태는 단순 순환, 단 guard는 한 번만 재생
-                if self.player1_state in ['Idle', 'Walk', 'BackWalk']:
-                    self.player1_frame = next_frame
-                    return
-                elif self.player1_state == 'guard':
-                    # guard는 2프레임을 순차적으로 재생하고 마지막 프레임에서 완료 처리
-                    if self.player1_frame < sprite_count - 1:
-                        # 아직 마지막 프레임이 아니면 다음 프레임으로
-                        self.player1_frame = next_frame
-                        return
-                    else:
-                        # 마지막 프레임에 도달 - 완료 처리 체크
-                        if self.player1_ref:
-                            # 가드가 연장되는지 체크 (guard_animation_reset 플래그)
-                            if hasattr(self.player1_ref, 'guard_animation_reset') and self.player1_ref.guard_animation_reset:
-                                # 가드 연장 - 애니메이션을 처음부터 다시 시작
-                                print("Player1 guard extended - restarting animation")
-                                self.player1_frame = 0
-                                self.frame_timer = 0.0
-                                self.player1_ref.guard_animation_reset = False
-                                return
-                            elif self.player1_ref.is_guarding:
-                                # 정상적인 가드 완료 - 모든 가드 관련 플래그 정리
-                                self.player1_ref.is_guarding = False
-                                self.player1_ref.can_attack_after_guard = False
-                                self.player1_ref.guard_counter_timer = 0.0
-                                if hasattr(self.player1_ref, 'guard_animation_reset'):
-                                    self.player1_ref.guard_animation_reset = False
-
-                                # 상태를 확실히 Idle로 전환
-                                self.player1_ref.state = 'Idle'
-                                self.player1_ref.character.state = 'Idle'
-                                self.player1_state = 'Idle'
-                                self.player1_frame = 0
-                                self.frame_timer = 0.0  # 타이머 리셋
-                                print("Player1 guard animation completed - transitioning to Idle")
-                        return
-
-                # 공격 상태에서 애니메이션 완료 시 처리
-                if next_frame == 0:  # 애니메이션 한 사이클 완료
-                    if self._handle_animation_completion(
-                        self.player1_ref, self.player1_state, character_type, True):
-                        return
-
-                self.player1_frame = next_frame
-
-        # 연계 가능 시점 체크
-        if self.player1_ref and self.player1_ref.is_attacking:
-            self._update_combo_availability(
-                self.player1_ref, self.player1_state, self.player1_character_type, self.player1_frame)
-
-    def update_player2_state(self, new_state, deltaTime):
-        # 캐릭터 타입 변경 감지
-        if self.player2_ref:
-            current_character_type = self.player2_ref.get_character_type()
-            if current_character_type != self.player2_character_type:
-                self.player2_character_type = current_character_type
-                self.player2_frame = 0
-                self.player2_frame_timer = 0.0
-                print(f"Player2 character changed to: {current_character_type}")
-
-        # 가드 애니메이션 리셋 체크 (상태 변경과 별도로)
-        if (self.player2_ref and self.player2_state == 'guard' and
-            new_state == 'guard' and self.player2_ref.should_reset_guard_animation()):
-            print("Player2 guard animation reset - extending guard")
-            self.player2_frame = 0
-            self.player2_frame_timer = 0.0
-
-        # 상태가 변경되면 프레임을 0으로 리셋
-        if self.player2_state != new_state:
-            print(f"Player2 state changed: {self.player2_state} -> {new_state}")
-            self.player2_state = new_state
-            self.player2_frame = 0
-            self.player2_frame_timer = 0.0
-            # 새로운 공격 시작 시 타격 플래그 리셋
-            if self.player2_ref and 'ATK' in new_state:
-                # 공격 시작 시 기존의 타격 처리 플래그들 초기화
-                self.player2_ref.reset_attack_hit_flag()
-                self.player2_ref.can_process_hit = False
-
-        character_type = self.player2_character_type
-        sprites = self.get_character_sprites(character_type)
-
-        if sprites and self.player2_state in sprites:
-            sprite_count = len(sprites[self.player2_state])
-            # 스프라이트 개수에 따라 프레임 시간 계산
-            # 기본 프레임 시간 계산
-            current_frame_time = self._get_frame_time_for_state(self.player2_state, sprite_count)
-            # hit 상태는 guard와 같은 전체 재생시간으로 고정
-            if self.player2_state == 'hit':
-                total_hit_duration = self.animation_durations.get('guard', self.animation_durations.get('hit', 0.3))
-                current_frame_time = (total_hit_duration / sprite_count) if sprite_count > 0 else current_frame_time
-
-            # 프레임 애니메이션 업데이트
-            self.player2_frame_timer += deltaTime
-            if self.player2_frame_timer >= current_frame_time:
-                self.player2_frame_timer = 0.0
-
-                # 공격 애니메이션 중 타격 처리 활성화 - 범위 확장으로 안정성 향상
-                if self.player2_ref and 'ATK' in self.player2_state:
-                    # 히트 허용: 중앙 프레임 근처(중앙-1 ~ 중앙+1)에서 허용하여 안정성 향상
-                    center = sprite_count // 2
-                    hit_start = max(0, center - 1)
-                    hit_end = min(sprite_count - 1, center + 1)
-                    # 중앙 프레임 근처에서 타격 처리 허용
-                    self.player2_ref.can_process_hit = (hit_start <= self.player2_frame <= hit_end)
-
-                # hit 상태 특별 처리 - airborne과 down 타입 추가
-                if self.player2_state == 'hit' and self.player2_ref:
-                    if self.player2_ref.character.hit_type == 'fast':
-                        # fast 공격: 프레임 0->1 후 바로 완료
-                        if self.player2_frame < 1:
-                            self.player2_frame += 1
-                        else:
-                            # fast hit 애니메이션 완료
-                            self._handle_animation_completion(self.player2_ref, 'hit', character_type, False)
-                    elif self.player2_ref.character.hit_type == 'strong':
-                        # strong 공격: 프레임 0->1->2->3->4 후 기상 대기
-                        if self.player2_frame < 4:
-                            self.player2_frame += 1
-                            # 4번째 프레임에 도달하면 기상 가능 상태로 설정
-                            if self.player2_frame == 4:
-                                self.player2_ref.character.can_get_up = True
-                                print("Player2 can now get up (frame 4)")
-                        elif self.player2_frame == 4:
-                            # 기상 입력 체크 - 프레임 4에서 대기
-                            if self.player2_ref.hit_recovery_input:
-                                self.player2_frame = 5  # 기상 프레임
-                                self.player2_ref.hit_recovery_input = False
-                                print("Player2 getting up!")
-                            # 프레임 4에서 대기 (기상 입력 대기)
-                        elif self.player2_frame == 5:
-                            # 기상 애니메이션 완료
-                            self._handle_animation_completion(self.player2_ref, 'hit', character_type, False)
-                    elif self.player2_ref.character.hit_type == 'airborne':
-                        # 공중에 뜬 상태 - 프레임 0에서 고정, 착지할 때까지 대기
-                        self.player2_frame = 0  # 공중에서는 첫 번째 프레임 유지
-                        if self.player2_ref.is_grounded and self.player2_ref.character.hit_type == 'down':
-                            # 착지 후 down 상태가 되면 프레임 4로 변경
-                            self.player2_frame = 4
-                            print("Player2 landed - now in down state")
-                    elif self.player2_ref.character.hit_type == 'down':
-                        # down 상태: 바닥에 떨어진 후 기상 대기
-                        if self.player2_frame < 4:
-                            self.player2_frame = 4  # down 프레임으로 즉시 이동
-                        elif self.player2_frame == 4:
-                            # 기상 입력 체크
-                            if self.player2_ref.hit_recovery_input:
-                                self.player2_frame = 5  # 기상 프레임
-                                self.player2_ref.hit_recovery_input = False
-                                print("Player2 getting up from down state!")
-                        elif self.player2_frame == 5:
-                            # 기상 애니메이션 완료
-                            self._handle_animation_completion(self.player2_ref, 'hit', character_type, False)
-                    return
-
-                next_frame = (self.player2_frame + 1) % sprite_count
-
-                # 일반 상태는 단순 순환, 단 guard는 한 번만 재생
-                if self.player2_state in ['Idle', 'Walk', 'BackWalk']:
-                    self.player2_frame = next_frame
-                    return
-                elif self.player2_state == 'guard':
-                    # guard는 2프레임을 순차적으로 재생하고 마지막 프레임에서 완료 처리
-                    if self.player2_frame < sprite_count - 1:
-                        # 아직 마지막 프레임이 아니면 다음 프레임으로
-                        self.player2_frame = next_frame
-                        return
-                    else:
-                        # 마지막 프레임에 도달 - 완료 처리 체크
-                        if self.player2_ref:
-                            # 가드가 연장되는지 체크 (guard_animation_reset 플래그)
-                            if hasattr(self.player2_ref, 'guard_animation_reset') and self.player2_ref.guard_animation_reset:
-                                # 가드 연장 - 애니메이션을 처음부터 다시 시작
-                                print("Player2 guard extended - restarting animation")
-                                self.player2_frame = 0
-                                self.player2_frame_timer = 0.0
-                                self.player2_ref.guard_animation_reset = False
-                                return
-                            elif self.player2_ref.is_guarding:
-                                # 정상적인 가드 완료 - 모든 가드 관련 플래그 정리
-                                self.player2_ref.is_guarding = False
-                                self.player2_ref.can_attack_after_guard = False
-                                self.player2_ref.guard_counter_timer = 0.0
-                                if hasattr(self.player2_ref, 'guard_animation_reset'):
-                                    self.player2_ref.guard_animation_reset = False
-
-                                # 상태를 확실히 Idle로 전환
-                                self.player2_ref.state = 'Idle'
-                                self.player2_ref.character.state = 'Idle'
-                                self.player2_state = 'Idle'
-                                self.player2_frame = 0
-                                self.player2_frame_timer = 0.0  # 타이머 리셋
-                                print("Player2 guard animation completed - transitioning to Idle")
-                        return
-
-                # 공격 상태에서 애니메이션 완료 시 처리
-                if next_frame == 0:  # 애니메이션 한 사이클 완료
-                    if self._handle_animation_completion(
-                        self.player2_ref, self.player2_state, character_type, False):
-                        return
-
-                self.player2_frame = next_frame
-
-        # 연계 가능 시점 체크
-        if self.player2_ref and self.player2_ref.is_attacking:
-            self._update_combo_availability(
-                self.player2_ref, self.player2_state, self.player2_character_type, self.player2_frame)
-
-    def update_player1_position(self, x, y):
-        self.player1_x = x
-        self.player1_y = y
-
-    def update_player1_direction(self, direction):
-        self.player1_dir = direction
+    def sync_positions(self):
+        """플레이어 위치/방향을 애니메이션에 바로 반영 (매치 시작, 라운드 리셋)"""
+        for animation in self.animations:
+            owner = animation.owner
+            if owner:
+                animation.x, animation.y, animation.dir = owner.x, owner.y, owner.dir
+
+    def save_previous_positions(self):
+        """시뮬레이션 스텝 직전에 호출 - 현재 위치를 보간 시작점으로 저장"""
+        for animation in self.animations:
+            animation.prev_x, animation.prev_y = animation.x, animation.y
+
+    def snap_positions(self):
+        """순간이동(라운드 리셋 등) 후 호출 - 이전 위치에서 미끄러지듯 보간되지 않도록 맞춤"""
+        self.save_previous_positions()
+
+    def _faces_right(self, xs):
+        """플레이어마다 가장 가까운 다른 플레이어를 바라보는 방향 (오른쪽이면 True, 상대가 없으면 None)
+
+        x가 같으면 앞 순서가 왼쪽, 뒤 순서가 오른쪽을 바라봄 (두 명이면 Player1이 Player2보다 왼쪽일 때 오른쪽)
+        """
+        owned = [i for i, animation in enumerate(self.animations) if animation.owner]
+        faces_right = [None] * len(self.animations)
+        if len(owned) == 2:
+            # 두 명이면 서로가 가장 가까운 상대 (매 스텝 호출되는 대전의 경우 - 거리 비교 생략)
+            first, second = owned
+            faces_right[first] = xs[first] < xs[second]
+            faces_right[second] = not faces_right[first]
+            return faces_right
+        for i in owned:
+            nearest = None
+            for j in owned:
+                if j != i and (nearest is None or abs(xs[j] - xs[i]) < abs(xs[nearest] - xs[i])):
+                    nearest = j
+            if nearest is not None:
+                faces_right[i] = xs[i] < xs[nearest] or (xs[i] == xs[nearest] and i > nearest)
+        return faces_right
+
+    def update_facing(self):
+        """플레이어가 가장 가까운 상대를 바라보도록 방향 갱신 (시뮬레이션 스텝마다 호출, 공격 범위 동기화용)"""
+        faces_right = self._faces_right([animation.x for animation in self.animations])
+        for animation, right in zip(self.animations, faces_right):
+            if right is not None:
+                animation.owner.facing_right = right
+
+    def render(self, alpha=1.0):
+        """렌더링 - alpha는 직전 시뮬레이션 스텝과 현재 스텝 사이의 보간 비율 (0~1)"""
+        try:
+            # 두 시뮬레이션 스텝 사이 위치 보간
+            positions = [(animation.prev_x + (animation.x - animation.prev_x) * alpha,
+                          animation.prev_y + (animation.y - animation.prev_y) * alpha)
+                         for animation in self.animations]
 
-    def update_player2_position(self, x, y):
-        self.player2_x = x
-        self.player2_y = y
+            # 보간한 위치 기준으로 가장 가까운 상대를 바라보게 함 (상대가 없으면 오른쪽, 방향 속성은 update_facing에서 갱신)
+            faces_right = self._faces_right([x for x, _ in positions])
 
-    def update_player2_direction(self, direction):
-        self.player2_dir = direction
-
-    def render(self):
-        """렌더링 - 예외 처리 추가"""
-        try:
-            # 플레이어1과 플레이어2의 상대적 위치를 확인하여 서로를 바라보게 함
-            player1_faces_right = True  # 기본값
-            player2_faces_right = True  # 기본값
-
-            if self.player1_ref and self.player2_ref:
-                # Player1이 Player2보다 왼쪽에 있으면 오른쪽을 바라봄
-                if self.player1_x < self.player2_x:
-                    player1_faces_right = True
-                    player2_faces_right = False  # Player2는 왼쪽을 바라봄
-                else:
-                    player1_faces_right = False  # Player1은 왼쪽을 바라봄
-                    player2_faces_right = True
-
-                # 플레이어의 방향 속성 업데이트 (공격 범위 동기화용)
-                self.player1_ref.facing_right = player1_faces_right
-                self.player2_ref.facing_right = player2_faces_right
-
-            # 플레이어1 렌더링
-            if self.player1_ref:
-                character_type = self.player1_character_type
-                sprites = self.get_character_sprites(character_type)
-
-                # 캐릭터별 y 오프셋 적용
-                y_offset = self.character_y_offsets.get(character_type, 0)
-                adjusted_y1 = self.player1_y + y_offset
-
-                if sprites and self.player1_state in sprites:
-                    sprite_list = sprites[self.player1_state]
-                    if sprite_list and len(sprite_list) > 0:
-                        frame = self.player1_frame % len(sprite_list)
-                        # 방향에 따라 렌더링
-                        if player1_faces_right:
-                            # 오른쪽을 바라봄 (기본)
-                            sprite_list[frame].draw(self.player1_x, adjusted_y1,
-                                                  sprite_list[frame].w * self.scale_factor,
-                                                  sprite_list[frame].h * self.scale_factor)
-                        else:
-                            # 왼쪽을 바라봄 (좌우 반전)
-                            sprite_list[frame].composite_draw(0, 'h', self.player1_x, adjusted_y1,
-                                                            sprite_list[frame].w * self.scale_factor,
-                                                            sprite_list[frame].h * self.scale_factor)
-
-            # 플레이어2 렌더링
-            if self.player2_ref:
-                character_type = self.player2_character_type
-                sprites = self.get_character_sprites(character_type)
-
-                # 캐릭터별 y 오프셋 적용
-                y_offset = self.character_y_offsets.get(character_type, 0)
-                adjusted_y2 = self.player2_y + y_offset
-
-                if sprites and self.player2_state in sprites:
-                    sprite_list = sprites[self.player2_state]
-                    if sprite_list and len(sprite_list) > 0:
-                        frame = self.player2_frame % len(sprite_list)
-                        # 방향에 따라 렌더링
-                        if player2_faces_right:
-                            # 오른쪽을 바라봄 (기본)
-                            sprite_list[frame].draw(self.player2_x, adjusted_y2,
-                                                  sprite_list[frame].w * self.scale_factor,
-                                                  sprite_list[frame].h * self.scale_factor)
-                        else:
-                            # 왼쪽을 바라봄 (좌우 반전)
-                            sprite_list[frame].composite_draw(0, 'h', self.player2_x, adjusted_y2,
-                                                            sprite_list[frame].w * self.scale_factor,
-                                                            sprite_list[frame].h * self.scale_factor)
+            for animation, (x, y), right in zip(self.animations, positions, faces_right):
+                if animation.owner:
+                    self._draw_animation(animation, x, y, right is not False)
 
             # 공격 범위 바운딩 박스 디버그 렌더링 (F1 키로 토글, 공격 중일 때만)
             if config.SHOW_BOUNDING_BOX:
                 try:
-                    if self.player1_ref and getattr(self.player1_ref, 'is_attacking', False):
-                        atk_bb = None
-                        if hasattr(self.player1_ref, 'get_attack_range_bb'):
-                            atk_bb = self.player1_ref.get_attack_range_bb()
-                        if atk_bb:
-                            pico2d.draw_rectangle(*atk_bb)
-
-                    if self.player2_ref and getattr(self.player2_ref, 'is_attacking', False):
-                        atk_bb = None
-                        if hasattr(self.player2_ref, 'get_attack_range_bb'):
-                            atk_bb = self.player2_ref.get_attack_range_bb()
-                        if atk_bb:
-                            pico2d.draw_rectangle(*atk_bb)
+                    for animation in self.animations:
+                        if animation.owner and animation.owner.is_attacking:
+                            atk_bb = animation.owner.get_attack_range_bb()
+                            if atk_bb:
+                                renderBackend.draw_rectangle(*atk_bb)
                 except Exception as e:
                     print(f"Warning: Attack BB rendering failed: {e}")
         except Exception as e:
             print(f"Warning: Sprite rendering failed: {e}")
+
+    def _draw_animation(self, animation, x, y, faces_right):
+        """애니메이션 현재 프레임 그리기"""
+        character_type = animation.character_type
+        sprites = self.get_character_sprites(character_type)
+        if not sprites or animation.state not in sprites:
+            return
+        sprite_list = sprites[animation.state]
+        if not sprite_list:
+            return
+
+        # 캐릭터별 y 오프셋 적용
+        y += self.character_y_offsets.get(character_type, 0)
+        frame = animation.frame % len(sprite_list)
+        mirrored_list = self.mirrored_sprites.get(character_type, {}).get(animation.state)
+        # 방향에 따라 렌더링
+        if faces_right:
+            # 오른쪽을 바라봄 (기본)
+            sprite = sprite_list[frame]
+            sprite.draw(x, y, sprite.w * self.draw_scale, sprite.h * self.draw_scale)
+        elif mirrored_list:
+            # 왼쪽을 바라봄 (미리 반전해 둔 프레임)
+            sprite = mirrored_list[frame]
+            sprite.draw(x, y, sprite.w * self.draw_scale, sprite.h * self.draw_scale)
+        else:
+            # 왼쪽을 바라봄 (좌우 반전)
+            sprite = sprite_list[frame]
+            sprite.composite_draw(0, 'h', x, y, sprite.w * self.draw_scale, sprite.h * self.draw_scale)
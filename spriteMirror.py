@@ -0,0 +1,83 @@
+"""
+좌우 반전 스프라이트 미리 만들기
+왼쪽을 바라보는 캐릭터를 매 프레임 composite_draw(0, 'h', ...)로 그리면
+SDL_RenderCopyEx 경로를 타므로, 로딩 시 반전된 텍스처를 한 번 만들어 두고 draw로 그림
+"""
+import ctypes
+
+import pico2d
+from pico2d import pico2d as pico2d_core
+from sdl2 import (SDL_BLENDMODE_BLEND, SDL_BLENDMODE_NONE, SDL_CreateTexture, SDL_FLIP_HORIZONTAL,
+                  SDL_GetError, SDL_GetRenderDrawColor, SDL_GetRenderTarget, SDL_GetTextureBlendMode,
+                  SDL_QueryTexture, SDL_RenderClear, SDL_RenderCopyEx, SDL_SetRenderDrawColor,
+                  SDL_SetRenderTarget, SDL_SetTextureBlendMode, SDL_TEXTUREACCESS_TARGET)
+
+import renderBackend
+from spriteAtlas import AtlasFrame
+
+
+def mirror_texture(texture, w, h):
+    """텍스처를 좌우 반전한 새 텍스처 생성 (렌더 타깃에 RenderCopyEx 1회, 메인 스레드 전용)"""
+    renderer = pico2d_core.renderer
+    # 원본과 같은 픽셀 포맷으로 만들어야 그릴 때 포맷 변환이 생기지 않음
+    pixel_format = ctypes.c_uint32()
+    SDL_QueryTexture(texture, pixel_format, None, None, None)
+    target = SDL_CreateTexture(renderer, pixel_format.value, SDL_TEXTUREACCESS_TARGET, w, h)
+    if not target:
+        raise IOError(f"cannot create mirror texture: {SDL_GetError().decode('utf-8', 'replace')}")
+
+    # 현재 렌더 타깃/그리기 색/원본 블렌드 모드를 보존
+    previous_target = SDL_GetRenderTarget(renderer)
+    r, g, b, a = ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8()
+    SDL_GetRenderDrawColor(renderer, r, g, b, a)
+    blend_mode = ctypes.c_int()
+    SDL_GetTextureBlendMode(texture, blend_mode)
+
+    SDL_SetRenderTarget(renderer, target)
+    SDL_SetRenderDrawColor(renderer, 0, 0, 0, 0)
+    SDL_RenderClear(renderer)
+    # 알파를 그대로 복사하도록 블렌딩 없이 반전 복사
+    SDL_SetTextureBlendMode(texture, SDL_BLENDMODE_NONE)
+    SDL_RenderCopyEx(renderer, texture, None, None, 0, None, SDL_FLIP_HORIZONTAL)
+
+    SDL_SetTextureBlendMode(texture, blend_mode.value)
+    SDL_SetRenderTarget(renderer, previous_target)
+    SDL_SetRenderDrawColor(renderer, r.value, g.value, b.value, a.value)
+    SDL_SetTextureBlendMode(target, SDL_BLENDMODE_BLEND)
+    return target
+
+
+def mirror_image(image):
+    """pico2d Image의 좌우 반전 복사본 (헤드리스 모드에서는 그릴 내용이 없으므로 원본 그대로)"""
+    if renderBackend.headless:
+        return image
+    return pico2d.Image(mirror_texture(image.texture, image.w, image.h))
+
+
+def mirror_frame(frame, mirrored_sheets):
+    """AtlasFrame은 시트 전체를 한 번만 반전하고 반전된 좌표의 프레임을 반환"""
+    sheet = frame.sheet
+    mirrored_sheet = mirrored_sheets.get(id(sheet))
+    if mirrored_sheet is None:
+        mirrored_sheet = mirrored_sheets[id(sheet)] = mirror_image(sheet)
+    return frame.mirrored(mirrored_sheet)
+
+
+def mirror_sprites(sprites):
+    """상태별 프레임 리스트 전체의 반전 버전 생성 - 여러 상태가 공유하는 프레임은 한 번만 반전"""
+    mirrored_frames = {}  # id(원본 프레임) -> 반전 프레임
+    mirrored_sheets = {}  # id(원본 시트) -> 반전 시트
+    result = {}
+    for state, frames in sprites.items():
+        mirrored_list = []
+        for frame in frames:
+            mirrored = mirrored_frames.get(id(frame))
+            if mirrored is None:
+                if isinstance(frame, AtlasFrame):
+                    mirrored = mirror_frame(frame, mirrored_sheets)
+                else:
+                    mirrored = mirror_image(frame)
+                mirrored_frames[id(frame)] = mirrored
+            mirrored_list.append(mirrored)
+        result[state] = mirrored_list
+    return result
@@ -0,0 +1,97 @@
+"""
+시작 프로파일러
+구간별 소요 시간과 읽은 파일 수/바이트를 트리로 기록해 JSON 보고서로 저장
+(main.py --profile-startup 으로 켬, 꺼져 있으면 구간 기록은 아무것도 하지 않음)
+
+- 구간(section)은 메인 스레드에서만 중첩해서 사용
+- 워커 스레드의 파일 읽기는 그 시점에 열려 있는 메인 스레드 구간에 합산됨
+"""
+import contextlib
+import json
+import pathlib
+import threading
+import time
+
+REPORT_VERSION = 1
+
+
+def _new_node(name):
+    return {'name': name, 'ms': 0.0, 'files': 0, 'bytes': 0, 'children': []}
+
+
+class StartupProfiler:
+    """구간 트리 + 파일 읽기 카운터"""
+
+    def __init__(self):
+        self.enabled = False
+        self.root = _new_node('startup')
+        self.stack = [self.root]
+        self.file_count = 0
+        self.byte_count = 0
+        self.file_bytes = {}  # 경로 -> 읽은 바이트 (같은 파일을 여러 번 읽으면 합산)
+        self.lock = threading.Lock()
+        self.start_time = None
+
+    def enable(self):
+        """기록 시작"""
+        self.enabled = True
+        self.start_time = time.perf_counter()
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """구간 측정 - with profiler.section('이름'): ..."""
+        if not self.enabled:
+            yield
+            return
+        node = _new_node(name)
+        self.stack[-1]['children'].append(node)
+        self.stack.append(node)
+        files_before, bytes_before = self.file_count, self.byte_count
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            node['ms'] = round((time.perf_counter() - start) * 1000, 3)
+            node['files'] = self.file_count - files_before
+            node['bytes'] = self.byte_count - bytes_before
+            self.stack.pop()
+
+    def record_file(self, path, size):
+        """파일 읽기 기록 (워커 스레드에서도 호출)"""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.file_count += 1
+            self.byte_count += size
+            key = str(path)
+            self.file_bytes[key] = self.file_bytes.get(key, 0) + size
+
+    def build_report(self, largest=20):
+        """보고서 딕셔너리 - 가장 큰 파일 목록은 지연 로딩 후보를 고를 때 참고"""
+        total_ms = (time.perf_counter() - self.start_time) * 1000 if self.start_time else 0.0
+        largest_files = sorted(self.file_bytes.items(), key=lambda item: item[1], reverse=True)[:largest]
+        return {
+            'version': REPORT_VERSION,
+            'total_ms': round(total_ms, 3),
+            'files_touched': len(self.file_bytes),
+            'file_reads': self.file_count,
+            'bytes_read': self.byte_count,
+            'sections': self.root['children'],
+            'largest_files': [{'path': path, 'bytes': size} for path, size in largest_files],
+        }
+
+    def write_report(self, path):
+        """JSON 보고서 저장 후 요약 출력"""
+        report = self.build_report()
+        path = pathlib.Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+        print(f"Startup profile: {report['total_ms']:.1f} ms, {report['files_touched']} files, "
+              f"{report['bytes_read'] / 1024 / 1024:.1f} MB read -> {path}")
+        for node in report['sections']:
+            print(f"  {node['name']:<40}{node['ms']:>10.1f} ms{node['files']:>6} files")
+        return report
+
+
+# 프로세스 전역 프로파일러
+profiler = StartupProfiler()